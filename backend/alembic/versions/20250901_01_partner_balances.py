@@ -0,0 +1,44 @@
+"""partner balance ledger
+
+Revision ID: partner_balances_20250901
+Revises: order_pricing_20250829
+Create Date: 2025-09-01
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = 'partner_balances_20250901'
+down_revision = 'order_pricing_20250829'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'partner_balances',
+        sa.Column('partner_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('partners.id'), primary_key=True),
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id'), nullable=False),
+        sa.Column('balance', sa.Numeric(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_partner_balances_organization_id', 'partner_balances', ['organization_id'])
+    # Backfill from existing history: document postings increase, payments decrease
+    op.execute(
+        """
+        INSERT INTO partner_balances (partner_id, organization_id, balance, updated_at)
+        SELECT partner_id, organization_id,
+               SUM(CASE WHEN UPPER(COALESCE(method, '')) IN ('ORDER', 'PURCHASE') THEN amount ELSE -amount END),
+               NOW()
+        FROM financial_transactions
+        WHERE partner_id IS NOT NULL
+        GROUP BY partner_id, organization_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_partner_balances_organization_id', table_name='partner_balances')
+    op.drop_table('partner_balances')
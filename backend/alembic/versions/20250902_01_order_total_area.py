@@ -0,0 +1,37 @@
+"""store total item area on orders
+
+Revision ID: order_total_area_20250902
+Revises: partner_balances_20250901
+Create Date: 2025-09-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'order_total_area_20250902'
+down_revision = 'partner_balances_20250901'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('orders', sa.Column('total_area_sqm', sa.Numeric(), nullable=True))
+    # Backfill with the same rule order_service.order_item_area_expr applies
+    op.execute(
+        """
+        UPDATE orders SET total_area_sqm = (
+            SELECT SUM(COALESCE(
+                oi.area_sqm,
+                (CAST(oi.width AS NUMERIC) / 1000) * (CAST(oi.height AS NUMERIC) / 1000)
+                    * CAST(COALESCE(oi.quantity, 0) AS NUMERIC)
+            ))
+            FROM order_items oi
+            WHERE oi.order_id = orders.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('orders', 'total_area_sqm')
@@ -0,0 +1,33 @@
+"""per-org document number sequences
+
+Revision ID: number_sequences_20250902
+Revises: order_total_area_20250902
+Create Date: 2025-09-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = 'number_sequences_20250902'
+down_revision = 'order_total_area_20250902'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rows are created lazily by sequence_service, seeded from existing numbers
+    op.create_table(
+        'number_sequences',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id'), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('period', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_value', sa.Integer(), nullable=False, server_default='0'),
+        sa.UniqueConstraint('organization_id', 'name', 'period', name='uq_number_sequence'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('number_sequences')
@@ -0,0 +1,40 @@
+"""one production job per order item
+
+Revision ID: unique_job_per_item_20250903
+Revises: number_sequences_20250902
+Create Date: 2025-09-03
+"""
+
+from alembic import op
+
+
+revision = 'unique_job_per_item_20250903'
+down_revision = 'number_sequences_20250902'
+branch_labels = None
+depends_on = None
+
+# Jobs duplicated by re-sent URETIMDE transitions: keep the most advanced job per
+# item and move the duplicates' logs onto it before deleting them.
+RANKED = """
+    SELECT id,
+           ROW_NUMBER() OVER w AS rn,
+           FIRST_VALUE(id) OVER w AS keep_id
+    FROM production_jobs
+    WINDOW w AS (PARTITION BY order_item_id ORDER BY COALESCE(quantity_produced, 0) DESC, job_number, id)
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        UPDATE production_logs SET job_id = ranked.keep_id
+        FROM ({RANKED}) AS ranked
+        WHERE production_logs.job_id = ranked.id AND ranked.rn > 1
+        """
+    )
+    op.execute(f"DELETE FROM production_jobs WHERE id IN (SELECT id FROM ({RANKED}) AS ranked WHERE rn > 1)")
+    op.create_unique_constraint('uq_production_job_order_item', 'production_jobs', ['order_item_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_production_job_order_item', 'production_jobs', type_='unique')
@@ -0,0 +1,28 @@
+"""change tracking columns on production jobs
+
+Revision ID: production_job_versions_20250903
+Revises: unique_job_per_item_20250903
+Create Date: 2025-09-03
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'production_job_versions_20250903'
+down_revision = 'unique_job_per_item_20250903'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing jobs start at version 0; clients load the full board once before polling with ?since=
+    op.add_column('production_jobs', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.add_column('production_jobs', sa.Column('version', sa.Integer(), nullable=False, server_default='0'))
+    op.create_index('ix_production_jobs_org_version', 'production_jobs', ['organization_id', 'version'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_production_jobs_org_version', table_name='production_jobs')
+    op.drop_column('production_jobs', 'version')
+    op.drop_column('production_jobs', 'updated_at')
@@ -0,0 +1,46 @@
+"""latest station and log time on production jobs
+
+Revision ID: job_current_station_20250904
+Revises: production_job_versions_20250903
+Create Date: 2025-09-04
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = 'job_current_station_20250904'
+down_revision = 'production_job_versions_20250903'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'production_jobs',
+        sa.Column('current_station_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('production_stations.id'), nullable=True),
+    )
+    op.add_column('production_jobs', sa.Column('last_log_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_production_jobs_org_station', 'production_jobs', ['organization_id', 'current_station_id'])
+    # Backfill from each job's latest log (same rule as production_service.rebuild_job_stations)
+    op.execute(
+        """
+        UPDATE production_jobs SET
+            current_station_id = (
+                SELECT l.station_id FROM production_logs l
+                WHERE l.job_id = production_jobs.id
+                ORDER BY l.completed_at DESC NULLS LAST, l.id DESC
+                LIMIT 1
+            ),
+            last_log_at = (
+                SELECT MAX(l.completed_at) FROM production_logs l WHERE l.job_id = production_jobs.id
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_production_jobs_org_station', table_name='production_jobs')
+    op.drop_column('production_jobs', 'last_log_at')
+    op.drop_column('production_jobs', 'current_station_id')
@@ -0,0 +1,43 @@
+"""cached daily production rollups per station
+
+Revision ID: production_daily_rollups_20250905
+Revises: job_current_station_20250904
+Create Date: 2025-09-05
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = 'production_daily_rollups_20250905'
+down_revision = 'job_current_station_20250904'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'production_daily_rollups',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id'), nullable=False),
+        sa.Column('station_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('production_stations.id'), nullable=True),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('log_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('quantity', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('cycle_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('cycle_seconds', sa.Numeric(), nullable=False, server_default='0'),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('organization_id', 'station_id', 'day', name='uq_production_daily_rollup'),
+    )
+    op.create_index('ix_production_daily_rollups_org_day', 'production_daily_rollups', ['organization_id', 'day'])
+    # Analytics over completed_at ranges, and the per-job LAG window
+    op.create_index('ix_production_logs_completed_at', 'production_logs', ['completed_at'])
+    op.create_index('ix_production_logs_job_completed_at', 'production_logs', ['job_id', 'completed_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_production_logs_job_completed_at', table_name='production_logs')
+    op.drop_index('ix_production_logs_completed_at', table_name='production_logs')
+    op.drop_index('ix_production_daily_rollups_org_day', table_name='production_daily_rollups')
+    op.drop_table('production_daily_rollups')
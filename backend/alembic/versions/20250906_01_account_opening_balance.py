@@ -0,0 +1,33 @@
+"""opening balance on accounts for balance reconciliation
+
+Revision ID: account_opening_balance_20250906
+Revises: production_daily_rollups_20250905
+Create Date: 2025-09-06
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'account_opening_balance_20250906'
+down_revision = 'production_daily_rollups_20250905'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('accounts', sa.Column('opening_balance', sa.Numeric(), nullable=False, server_default='0'))
+    # Take today's balances as correct: opening = current - net of the account's transactions
+    op.execute(
+        """
+        UPDATE accounts SET opening_balance = COALESCE(current_balance, 0) - COALESCE((
+            SELECT SUM(CASE WHEN t.direction = 'IN' THEN t.amount ELSE -t.amount END)
+            FROM financial_transactions t
+            WHERE t.account_id = accounts.id
+        ), 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('accounts', 'opening_balance')
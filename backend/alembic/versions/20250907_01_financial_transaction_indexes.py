@@ -0,0 +1,32 @@
+"""composite indexes for the transaction ledger
+
+Revision ID: financial_tx_indexes_20250907
+Revises: account_opening_balance_20250906
+Create Date: 2025-09-07
+"""
+
+from alembic import op
+
+
+revision = 'financial_tx_indexes_20250907'
+down_revision = 'account_opening_balance_20250906'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_financial_transactions_org_date', ['organization_id', 'transaction_date', 'id']),
+    ('ix_financial_transactions_org_partner_date', ['organization_id', 'partner_id', 'transaction_date']),
+    ('ix_financial_transactions_org_account_date', ['organization_id', 'account_id', 'transaction_date']),
+    ('ix_financial_transactions_order_id', ['order_id']),
+    ('ix_financial_transactions_purchase_order_id', ['purchase_order_id']),
+)
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES:
+        op.create_index(name, 'financial_transactions', columns)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='financial_transactions')
@@ -0,0 +1,57 @@
+"""indexes matching the list, board and lookup queries
+
+Revision ID: access_path_indexes_20250908
+Revises: financial_tx_indexes_20250907
+Create Date: 2025-09-08
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'access_path_indexes_20250908'
+down_revision = 'financial_tx_indexes_20250907'
+branch_labels = None
+depends_on = None
+
+# (name, table, columns); org-scoped lists lead with organization_id and end
+# with their keyset ordering so a page is a single index range scan
+INDEXES = (
+    ('ix_partners_org_name', 'partners', ['organization_id', 'name', 'id']),
+    ('ix_categories_org_name', 'categories', ['organization_id', 'name', 'id']),
+    ('ix_products_org_name', 'products', ['organization_id', 'name', 'id']),
+    ('ix_materials_org_name', 'materials', ['organization_id', 'name', 'id']),
+    ('ix_orders_org_date', 'orders', ['organization_id', 'order_date', 'id']),
+    ('ix_orders_org_status', 'orders', ['organization_id', 'status']),
+    ('ix_orders_partner_id', 'orders', ['partner_id']),
+    ('ix_order_items_order_id', 'order_items', ['order_id']),
+    ('ix_purchase_orders_org_date', 'purchase_orders', ['organization_id', 'order_date']),
+    ('ix_purchase_orders_sales_order_id', 'purchase_orders', ['sales_order_id']),
+    ('ix_purchase_order_items_purchase_order_id', 'purchase_order_items', ['purchase_order_id']),
+    ('ix_production_stations_org_order', 'production_stations', ['organization_id', 'order_index']),
+    ('ix_production_jobs_org_status', 'production_jobs', ['organization_id', 'status']),
+    ('ix_accounts_organization_id', 'accounts', ['organization_id']),
+    ('ix_user_organizations_org_id', 'user_organizations', ['org_id']),
+)
+
+# Snapshot of models._ACTIVE_JOB_PREDICATE (built from models.COMPLETED_JOB_STATUSES)
+# at this revision; changing those statuses needs a migration that recreates the index
+ACTIVE_JOB_PREDICATE = "status NOT IN ('TAMAMLANDI', 'COMPLETED')"
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    # Partial: station queues and the board only read active jobs
+    op.create_index(
+        'ix_production_jobs_active_station',
+        'production_jobs',
+        ['organization_id', 'current_station_id', 'last_log_at'],
+        postgresql_where=sa.text(ACTIVE_JOB_PREDICATE),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_production_jobs_active_station', table_name='production_jobs')
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,53 @@
+"""Turkish-aware tr_fold() and trigram indexes for search
+
+Revision ID: search_fold_20250909
+Revises: access_path_indexes_20250908
+Create Date: 2025-09-09
+"""
+
+from alembic import op
+
+
+revision = 'search_fold_20250909'
+down_revision = 'access_path_indexes_20250908'
+branch_labels = None
+depends_on = None
+
+# As app.core.textfold had them at this revision; search_fold_explicit_20250912
+# replaces the function
+FOLD_FROM = "İIıŞşĞğÜüÖöÇçÂâÎîÛû"
+FOLD_TO = "iiissgguuooccaaiiuu"
+
+# Columns searched by services.search_service (and the list endpoints)
+SEARCH_COLUMNS = (
+    ('orders', 'order_number'),
+    ('orders', 'project_name'),
+    ('partners', 'name'),
+    ('partners', 'email'),
+    ('partners', 'phone'),
+    ('products', 'name'),
+    ('products', 'sku'),
+    ('categories', 'name'),
+    ('categories', 'code'),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION tr_fold(value text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$ SELECT lower(translate(value, '{FOLD_FROM}', '{FOLD_TO}')) $$
+        """
+    )
+    for table, column in SEARCH_COLUMNS:
+        op.execute(
+            f"CREATE INDEX ix_{table}_{column}_trgm ON {table} USING gin (tr_fold({column}) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    for table, column in reversed(SEARCH_COLUMNS):
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_{column}_trgm")
+    op.execute("DROP FUNCTION IF EXISTS tr_fold(text)")
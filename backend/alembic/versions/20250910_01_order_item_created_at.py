@@ -0,0 +1,24 @@
+"""entry time on order items, used to number production jobs
+
+Revision ID: order_item_created_at_20250910
+Revises: search_fold_20250909
+Create Date: 2025-09-10
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'order_item_created_at_20250910'
+down_revision = 'search_fold_20250909'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing items stay NULL and sort first (by id) when jobs are numbered
+    op.add_column('order_items', sa.Column('created_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('order_items', 'created_at')
@@ -0,0 +1,40 @@
+"""computed-day markers for production rollups in their own table
+
+Revision ID: production_rollup_days_20250911
+Revises: order_item_created_at_20250910
+Create Date: 2025-09-11
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = 'production_rollup_days_20250911'
+down_revision = 'order_item_created_at_20250910'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # NULL-station marker rows were never deduplicated by uq_production_daily_rollup
+    # (NULLs are distinct), so markers get a table keyed on (organization_id, day)
+    op.create_table(
+        'production_rollup_days',
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id'), primary_key=True),
+        sa.Column('day', sa.Date(), primary_key=True),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+    )
+    op.execute(
+        "INSERT INTO production_rollup_days (organization_id, day, computed_at) "
+        "SELECT organization_id, day, max(computed_at) FROM production_daily_rollups "
+        "WHERE station_id IS NULL GROUP BY organization_id, day"
+    )
+    op.execute("DELETE FROM production_daily_rollups WHERE station_id IS NULL")
+    op.alter_column('production_daily_rollups', 'station_id', nullable=False)
+
+
+def downgrade() -> None:
+    # Only a cache: idle days without a marker are simply recomputed
+    op.alter_column('production_daily_rollups', 'station_id', nullable=True)
+    op.drop_table('production_rollup_days')
@@ -0,0 +1,58 @@
+"""tr_fold() without collation-dependent lower()
+
+Revision ID: search_fold_explicit_20250912
+Revises: production_rollup_days_20250911
+Create Date: 2025-09-12
+"""
+
+from alembic import op
+
+
+revision = 'search_fold_explicit_20250912'
+down_revision = 'production_rollup_days_20250911'
+branch_labels = None
+depends_on = None
+
+# Must match app.core.textfold.FOLD_FROM / FOLD_TO
+FOLD_FROM = "İIıŞşĞğÜüÖöÇçÂâÎîÛû" + "ABCDEFGHJKLMNOPQRSTUVWXYZ"
+FOLD_TO = "iiissgguuooccaaiiuu" + "abcdefghjklmnopqrstuvwxyz"
+
+# Previous definition, from search_fold_20250909
+OLD_FOLD_FROM = "İIıŞşĞğÜüÖöÇçÂâÎîÛû"
+OLD_FOLD_TO = "iiissgguuooccaaiiuu"
+
+# The trigram indexes created by search_fold_20250909
+SEARCH_INDEXES = (
+    'ix_orders_order_number_trgm',
+    'ix_orders_project_name_trgm',
+    'ix_partners_name_trgm',
+    'ix_partners_email_trgm',
+    'ix_partners_phone_trgm',
+    'ix_products_name_trgm',
+    'ix_products_sku_trgm',
+    'ix_categories_name_trgm',
+    'ix_categories_code_trgm',
+)
+
+
+def _replace_function(body: str) -> None:
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION tr_fold(value text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$ SELECT {body} $$
+        """
+    )
+    # Indexed tr_fold() values may change (letters outside the mapping are no longer lower-cased)
+    for index in SEARCH_INDEXES:
+        op.execute(f"REINDEX INDEX {index}")
+
+
+def upgrade() -> None:
+    # lower() follows the database collation, which an IMMUTABLE function must
+    # not depend on; ASCII capitals are now part of the explicit mapping instead
+    _replace_function(f"translate(value, '{FOLD_FROM}', '{FOLD_TO}')")
+
+
+def downgrade() -> None:
+    _replace_function(f"lower(translate(value, '{OLD_FOLD_FROM}', '{OLD_FOLD_TO}'))")
@@ -0,0 +1,33 @@
+"""ledger date index in the ledger's own ordering
+
+Revision ID: ledger_date_index_desc_20250913
+Revises: search_fold_explicit_20250912
+Create Date: 2025-09-13
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'ledger_date_index_desc_20250913'
+down_revision = 'search_fold_explicit_20250912'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The ledger pages by transaction_date DESC NULLS LAST, id DESC; scanning the
+    # ascending index backwards gives NULLS FIRST, so every page needed a sort
+    op.drop_index('ix_financial_transactions_org_date', table_name='financial_transactions')
+    op.create_index(
+        'ix_financial_transactions_org_date',
+        'financial_transactions',
+        ['organization_id', sa.text('transaction_date DESC NULLS LAST'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_financial_transactions_org_date', table_name='financial_transactions')
+    op.create_index(
+        'ix_financial_transactions_org_date', 'financial_transactions', ['organization_id', 'transaction_date', 'id']
+    )
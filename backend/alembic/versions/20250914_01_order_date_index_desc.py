@@ -0,0 +1,29 @@
+"""order list index in the list's own ordering
+
+Revision ID: order_date_index_desc_20250914
+Revises: ledger_date_index_desc_20250913
+Create Date: 2025-09-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'order_date_index_desc_20250914'
+down_revision = 'ledger_date_index_desc_20250913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Orders page by order_date DESC NULLS LAST, id DESC; scanning the ascending
+    # index backwards gives NULLS FIRST, so every page needed a sort
+    op.drop_index('ix_orders_org_date', table_name='orders')
+    op.create_index(
+        'ix_orders_org_date', 'orders', ['organization_id', sa.text('order_date DESC NULLS LAST'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_org_date', table_name='orders')
+    op.create_index('ix_orders_org_date', 'orders', ['organization_id', 'order_date', 'id'])
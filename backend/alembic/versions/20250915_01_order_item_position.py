@@ -0,0 +1,38 @@
+"""explicit line position on order items, replacing created_at
+
+Revision ID: order_item_position_20250915
+Revises: order_date_index_desc_20250914
+Create Date: 2025-09-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'order_item_position_20250915'
+down_revision = 'order_date_index_desc_20250914'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # created_at ties within one executemany and is NULL on backfilled rows, so
+    # job numbers fell back to the random item id; items now carry their line number
+    op.add_column('order_items', sa.Column('position', sa.Integer(), nullable=True))
+    # Best effort for existing rows: the old ordering (their jobs are numbered already)
+    op.execute(
+        """
+        UPDATE order_items SET position = numbered.pos
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY order_id ORDER BY created_at NULLS FIRST, id) AS pos
+            FROM order_items
+        ) AS numbered
+        WHERE numbered.id = order_items.id
+        """
+    )
+    op.drop_column('order_items', 'created_at')
+
+
+def downgrade() -> None:
+    op.add_column('order_items', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.drop_column('order_items', 'position')
@@ -1,5 +1,9 @@
 import subprocess
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+
+from ..core.cache import auth_cache_stats
+from ..core.deps import has_permission
+from ..services import dashboard_cache
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -34,3 +38,9 @@ def run_migrations():
             status_code=500,
             detail="Alembic command not found. Is it installed in the container?"
         )
+
+
+@router.get("/cache-stats")
+def cache_stats(_user=Depends(has_permission("admin:view"))):
+    """Hit/miss counters for the in-process caches."""
+    return {**auth_cache_stats(), 'dashboard_snapshots': dashboard_cache.stats()}
@@ -5,20 +5,19 @@ from sqlalchemy.orm import Session
 
 from .. import models, schemas
 from ..database import get_db
-from ..dependencies import get_current_org
-from ..auth import get_current_user
+from ..dependencies import get_current_org, get_current_member
 from ..services.asset_service import list_assets, get_asset, create_asset, delete_asset, update_check_status
 
 router = APIRouter(prefix="/assets", tags=["assets"])
 
 
 @router.get('/', response_model=List[schemas.AssetRead])
-def list_all(db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_user)):
+def list_all(db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_member)):
     return list_assets(db, org.id)
 
 
 @router.get('/{asset_id}', response_model=schemas.AssetRead)
-def get_one(asset_id: UUID, db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_user)):
+def get_one(asset_id: UUID, db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_member)):
     a = get_asset(db, org.id, asset_id)
     if not a:
         raise HTTPException(status_code=404, detail='Asset not found')
@@ -26,7 +25,7 @@ def get_one(asset_id: UUID, db: Session = Depends(get_db), org: models.Organizat
 
 
 @router.post('/', response_model=schemas.AssetRead)
-def create(a_in: schemas.AssetCreate, db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_user)):
+def create(a_in: schemas.AssetCreate, db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_member)):
     return create_asset(
         db,
         org.id,
@@ -40,7 +39,7 @@ def create(a_in: schemas.AssetCreate, db: Session = Depends(get_db), org: models
 
 
 @router.delete('/{asset_id}')
-def remove(asset_id: UUID, db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_user)):
+def remove(asset_id: UUID, db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_member)):
     ok = delete_asset(db, org.id, asset_id)
     if not ok:
         raise HTTPException(status_code=404, detail='Asset not found')
@@ -48,7 +47,7 @@ def remove(asset_id: UUID, db: Session = Depends(get_db), org: models.Organizati
 
 
 @router.patch('/{asset_id}/check-status', response_model=schemas.AssetRead)
-def patch_check_status(asset_id: UUID, body: schemas.AssetCheckStatusUpdate, db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_user)):
+def patch_check_status(asset_id: UUID, body: schemas.AssetCheckStatusUpdate, db: Session = Depends(get_db), org: models.Organization = Depends(get_current_org), user=Depends(get_current_member)):
     asset = update_check_status(
         db, org.id, asset_id,
         status=body.status,
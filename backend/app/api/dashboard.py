@@ -3,18 +3,18 @@ from sqlalchemy.orm import Session
 
 from .. import models
 from ..database import get_db
-from ..auth import get_current_user
-from ..dependencies import get_current_org
-from ..services.dashboard_service import get_dashboard_summary
+from ..dependencies import get_current_org, get_current_member
+from ..services import dashboard_cache
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
 @router.get("/summary")
 def dashboard_summary(
+    fresh: bool = False,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: models.User = Depends(get_current_member),
     org: models.Organization = Depends(get_current_org),
 ):
     current_user.organization_id = org.id
-    return get_dashboard_summary(db, current_user)
+    return dashboard_cache.get_snapshot(db, org.id, fresh=fresh)
@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from ..auth import oauth2_scheme
+from ..core import events
+from ..database import SessionLocal
+from ..dependencies import get_auth_context
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+KEEPALIVE_SECONDS = 15
+
+
+def _sse(event_type: str, payload) -> str:
+    return f"event: {event_type}\ndata: {json.dumps(jsonable_encoder(payload), separators=(',', ':'))}\n\n"
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    x_org_slug: str = Header(..., alias="X-Org-Slug"),
+    token: str = Depends(oauth2_scheme),
+):
+    """Server-Sent Events for the caller's org.
+
+    Event types: ``job.status``, ``jobs.created``, ``production_log.created``,
+    ``production_logs.created`` (batches) and ``order.status``. A ``resync``
+    event means events were dropped for this client, so it should reload its
+    state (e.g. the board without ``since``).
+    """
+    # Authenticate with a session of our own, closed before streaming starts:
+    # a get_db dependency would hold its pooled connection for as long as the
+    # client stays connected. The stream itself only reads from the broker.
+    db = SessionLocal()
+    try:
+        ctx = await get_auth_context(x_org_slug, token, db)
+    finally:
+        db.close()
+    org_id = ctx.org.id
+
+    async def stream():
+        with events.subscription(org_id, asyncio.get_running_loop()) as sub:
+            yield _sse("ready", {'org_id': org_id})
+            while not await request.is_disconnected():
+                try:
+                    evt = await asyncio.wait_for(sub.queue.get(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if sub.overflowed:
+                    while not sub.queue.empty():
+                        sub.queue.get_nowait()
+                    sub.overflowed = False
+                    yield _sse("resync", {})
+                    continue
+                yield _sse(evt['type'], evt)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
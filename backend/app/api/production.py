@@ -1,16 +1,21 @@
-from typing import List
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 from .. import models
 from ..database import get_db
-from ..dependencies import get_current_org
+from ..dependencies import get_current_member, get_current_org
+from ..services import dashboard_cache, production_analytics, production_service
 
 router = APIRouter(prefix="/production", tags=["production"])
 
+BOARD_VERSION_HEADER = "X-Board-Version"
+
 
 class ActiveJob(BaseModel):
     id: UUID
@@ -21,6 +26,10 @@ class ActiveJob(BaseModel):
     width: int | None = None
     height: int | None = None
     quantity: int | None = None
+    version: int = 0
+    updated_at: datetime | None = None
+    current_station_id: UUID | None = None
+    last_log_at: datetime | None = None
 
     class Config:
         orm_mode = True
@@ -30,43 +39,162 @@ class StatusUpdate(BaseModel):
     status: str
 
 
+class JobStatusBatch(BaseModel):
+    job_ids: List[UUID] = Field(..., min_length=1, max_length=500)
+    status: str
+
+
+class JobStatusBatchResult(BaseModel):
+    updated: List[ActiveJob]
+    not_found: List[UUID] = []
+
+
+class LogEntry(BaseModel):
+    job_id: UUID
+    station_id: UUID
+    completed_at: datetime | None = None
+    quantity: int | None = Field(None, ge=0)
+    notes: str | None = None
+
+    @field_validator("completed_at")
+    @classmethod
+    def _completed_at_utc(cls, value):
+        return production_service.naive_utc(value)
+
+
+class LogBatch(BaseModel):
+    logs: List[LogEntry] = Field(..., min_length=1, max_length=1000)
+
+
+class LogRejection(BaseModel):
+    index: int
+    error: str
+
+
+class LogBatchResult(BaseModel):
+    accepted: int
+    rejected: List[LogRejection] = []
+    completed_job_ids: List[UUID] = []
+
+
+class StationAnalytics(BaseModel):
+    station_id: UUID
+    name: str
+    order_index: int | None = None
+    log_count: int
+    quantity: int
+    throughput_per_day: Decimal
+    avg_cycle_seconds: Decimal | None = None
+    cycle_count: int
+    wip: int
+    estimated_wait_days: Decimal | None = None
+
+
+class ProductionAnalytics(BaseModel):
+    start_date: date
+    end_date: date
+    days: int
+    stations: List[StationAnalytics]
+    bottleneck_station_id: UUID | None = None
+
+
+def _to_active_job(job, order, partner, product, item) -> ActiveJob:
+    return ActiveJob(
+        id=job.id,
+        status=job.status,
+        order_number=getattr(order, "order_number", None),
+        partner_name=getattr(partner, "name", None),
+        product_name=getattr(product, "name", None),
+        width=getattr(item, "width", None),
+        height=getattr(item, "height", None),
+        quantity=getattr(item, "quantity", None),
+        version=job.version or 0,
+        updated_at=job.updated_at,
+        current_station_id=job.current_station_id,
+        last_log_at=job.last_log_at,
+    )
+
+
 @router.get("/active-jobs", response_model=List[ActiveJob])
 def get_active_jobs(
+    response: Response,
+    since: Optional[int] = Query(None, ge=0, description="Board version from a previous X-Board-Version header"),
     db: Session = Depends(get_db),
     org: models.Organization = Depends(get_current_org),
 ):
-    rows = (
-        db.query(
-            models.ProductionJob,
-            models.Order,
-            models.Partner,
-            models.Product,
-            models.OrderItem,
-        )
-        .join(models.OrderItem, models.ProductionJob.order_item_id == models.OrderItem.id)
-        .join(models.Order, models.OrderItem.order_id == models.Order.id)
-        .outerjoin(models.Partner, models.Order.partner_id == models.Partner.id)
-        .outerjoin(models.Product, models.OrderItem.product_id == models.Product.id)
-        .filter(models.ProductionJob.organization_id == org.id)
-        .filter(~models.ProductionJob.status.in_(["TAMAMLANDI", "COMPLETED"]))
-        .all()
-    )
+    """Active jobs board. Pass ``since`` to get only jobs changed after that
+    version (completed jobs included, so the client can drop them)."""
+    rows, version = production_service.list_active_jobs(db, org.id, since=since)
+    response.headers[BOARD_VERSION_HEADER] = str(version)
+    return [_to_active_job(*row) for row in rows]
 
-    jobs: List[ActiveJob] = []
-    for job, order, partner, product, item in rows:
-        jobs.append(
-            ActiveJob(
-                id=job.id,
-                status=job.status,
-                order_number=getattr(order, "order_number", None),
-                partner_name=getattr(partner, "name", None),
-                product_name=getattr(product, "name", None),
-                width=getattr(item, "width", None),
-                height=getattr(item, "height", None),
-                quantity=getattr(item, "quantity", None),
-            )
-        )
-    return jobs
+
+@router.get("/analytics", response_model=ProductionAnalytics)
+def get_analytics(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Session = Depends(get_db),
+    org: models.Organization = Depends(get_current_org),
+):
+    """Per-station throughput, average cycle time from the previous station,
+    current WIP and the bottleneck station. Defaults to the last 7 days."""
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=6)
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+    if (end_date - start_date).days >= production_analytics.MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {production_analytics.MAX_RANGE_DAYS} days")
+    return production_analytics.station_analytics(db, org.id, start_date, end_date)
+
+
+@router.post("/logs/batch", response_model=LogBatchResult)
+def ingest_logs(
+    batch: LogBatch,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_member),
+    org: models.Organization = Depends(get_current_org),
+):
+    """Write a batch of station logs in one transaction (e.g. a scanner's offline buffer).
+
+    Produced quantities roll up onto the jobs, and jobs reaching their required
+    quantity are completed. Entries for unknown jobs or stations are rejected
+    individually.
+    """
+    result = production_service.ingest_logs(db, org.id, current_user.id, batch.logs)
+    if result['accepted']:
+        dashboard_cache.invalidate(org.id)
+    return result
+
+
+@router.get("/stations/{station_id}/queue", response_model=List[ActiveJob])
+def get_station_queue(
+    station_id: UUID,
+    db: Session = Depends(get_db),
+    org: models.Organization = Depends(get_current_org),
+):
+    """Active jobs whose latest log is at this station, longest waiting first."""
+    station = db.get(models.ProductionStation, station_id)
+    if not station or station.organization_id != org.id:
+        raise HTTPException(status_code=404, detail="Station not found")
+    return [_to_active_job(*row) for row in production_service.station_queue(db, org.id, station_id)]
+
+
+@router.post("/jobs/status", response_model=JobStatusBatchResult)
+def update_jobs_status(
+    batch: JobStatusBatch,
+    db: Session = Depends(get_db),
+    org: models.Organization = Depends(get_current_org),
+):
+    """Apply one status to many jobs at once (barcode scanner bursts)."""
+    updated = production_service.set_jobs_status(db, org.id, batch.job_ids, batch.status)
+    db.commit()
+    if updated:
+        dashboard_cache.invalidate(org.id)
+    found = set(updated)
+    return JobStatusBatchResult(
+        updated=[_to_active_job(*row) for row in production_service.get_board_jobs(db, org.id, updated)],
+        not_found=[job_id for job_id in dict.fromkeys(batch.job_ids) if job_id not in found],
+    )
 
 
 @router.post("/jobs/{job_id}/status", response_model=ActiveJob)
@@ -76,45 +204,9 @@ def update_job_status(
     db: Session = Depends(get_db),
     org: models.Organization = Depends(get_current_org),
 ):
-    job = (
-        db.query(models.ProductionJob)
-        .filter(
-            models.ProductionJob.id == job_id,
-            models.ProductionJob.organization_id == org.id,
-        )
-        .first()
-    )
-    if not job:
+    if not production_service.set_jobs_status(db, org.id, [job_id], status_in.status):
+        db.rollback()
         raise HTTPException(status_code=404, detail="Job not found")
-
-    job.status = status_in.status
     db.commit()
-    db.refresh(job)
-
-    item = db.query(models.OrderItem).filter(models.OrderItem.id == job.order_item_id).first()
-    order = (
-        db.query(models.Order).filter(models.Order.id == item.order_id).first()
-        if item
-        else None
-    )
-    partner = (
-        db.query(models.Partner).filter(models.Partner.id == order.partner_id).first()
-        if order
-        else None
-    )
-    product = (
-        db.query(models.Product).filter(models.Product.id == item.product_id).first()
-        if item
-        else None
-    )
-
-    return ActiveJob(
-        id=job.id,
-        status=job.status,
-        order_number=getattr(order, "order_number", None),
-        partner_name=getattr(partner, "name", None),
-        product_name=getattr(product, "name", None),
-        width=getattr(item, "width", None),
-        height=getattr(item, "height", None),
-        quantity=getattr(item, "quantity", None),
-    )
+    dashboard_cache.invalidate(org.id)
+    return _to_active_job(*production_service.get_board_jobs(db, org.id, [job_id])[0])
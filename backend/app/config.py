@@ -6,5 +6,16 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY", "supersecret")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # In-process cache for org / membership / role lookups (0 disables)
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAX_ENTRIES: int = 1024
+    # Dashboard snapshots: max age served from memory, background refresh interval
+    # (0 disables the refresher) and how long an org stays refreshed after its last poll
+    DASHBOARD_SNAPSHOT_TTL_SECONDS: int = 60
+    DASHBOARD_REFRESH_SECONDS: int = 15
+    DASHBOARD_WATCH_SECONDS: int = 300
+    DASHBOARD_CACHE_MAX_ORGS: int = 256
+    # Threads used to run dashboard sections in parallel (1 runs them sequentially)
+    DASHBOARD_WORKERS: int = 4
 
 settings = Settings()
@@ -0,0 +1,144 @@
+"""Per-organization event fan-out for push clients (see api/events.py).
+
+Writers call ``publish(db, org_id, type, data)``; the event is held on the
+session and only delivered once that session commits, so subscribers never
+see changes that were rolled back. Delivery goes through a ``Broker``. The
+default ``InProcessBroker`` fans out to subscribers of this process. A
+multi-process deployment can install a broker backed by Postgres
+LISTEN/NOTIFY with ``set_broker``: NOTIFY in ``publish``, and a listener
+thread feeding an ``InProcessBroker`` for local fan-out.
+"""
+import asyncio
+import logging
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_SIZE = 256
+_PENDING_KEY = "pending_events"
+
+
+class Subscription:
+    """One client's queue, bound to the event loop that consumes it."""
+
+    def __init__(self, org_key: str, loop: asyncio.AbstractEventLoop, maxsize: int = SUBSCRIBER_QUEUE_SIZE):
+        self.org_key = org_key
+        self.loop = loop
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize)
+        # Set when events were dropped; the client should reload its state
+        self.overflowed = False
+
+    def offer(self, evt: Dict[str, Any]) -> None:
+        # Runs on self.loop
+        try:
+            self.queue.put_nowait(evt)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class Broker(ABC):
+    @abstractmethod
+    def publish(self, org_id, evt: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    def subscribe(self, org_id, loop: asyncio.AbstractEventLoop) -> Subscription:
+        ...
+
+    @abstractmethod
+    def unsubscribe(self, sub: Subscription) -> None:
+        ...
+
+
+class InProcessBroker(Broker):
+    def __init__(self):
+        self._subs: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, org_id, evt: Dict[str, Any]) -> None:
+        with self._lock:
+            subs = list(self._subs.get(str(org_id), ()))
+        for sub in subs:
+            # Publishers run on worker threads; hand the event to the subscriber's loop
+            try:
+                sub.loop.call_soon_threadsafe(sub.offer, evt)
+            except RuntimeError:
+                self.unsubscribe(sub)  # loop closed under us
+
+    def subscribe(self, org_id, loop: asyncio.AbstractEventLoop) -> Subscription:
+        sub = Subscription(str(org_id), loop)
+        with self._lock:
+            self._subs.setdefault(sub.org_key, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.org_key)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subs[sub.org_key]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(s) for s in self._subs.values())
+
+
+_broker: Broker = InProcessBroker()
+
+
+def get_broker() -> Broker:
+    return _broker
+
+
+def set_broker(broker: Broker) -> None:
+    global _broker
+    _broker = broker
+
+
+def make_event(event_type: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return {'type': event_type, 'data': data or {}, 'at': datetime.utcnow().isoformat()}
+
+
+def publish(db: Session, org_id, event_type: str, data: Optional[Dict[str, Any]] = None) -> None:
+    """Queue an event for the org, delivered when ``db`` commits (dropped on rollback)."""
+    if org_id is None:
+        return
+    db.info.setdefault(_PENDING_KEY, []).append((org_id, make_event(event_type, data)))
+
+
+def publish_now(org_id, event_type: str, data: Optional[Dict[str, Any]] = None) -> None:
+    _broker.publish(org_id, make_event(event_type, data))
+
+
+@contextmanager
+def subscription(org_id, loop: asyncio.AbstractEventLoop) -> Iterator[Subscription]:
+    sub = _broker.subscribe(org_id, loop)
+    try:
+        yield sub
+    finally:
+        _broker.unsubscribe(sub)
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_pending(session: Session) -> None:
+    if session.in_nested_transaction():
+        return  # savepoint released; wait for the real commit
+    for org_id, evt in session.info.pop(_PENDING_KEY, ()):
+        try:
+            _broker.publish(org_id, evt)
+        except Exception as e:
+            logger.warning(f"event publish failed for org {org_id}: {e}")
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
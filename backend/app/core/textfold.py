@@ -0,0 +1,21 @@
+"""Turkish-aware case folding shared by Python code and the SQL ``tr_fold`` function.
+
+Turkish letters and the I/İ/ı dotting are mapped to plain ASCII and ASCII
+capitals to lower case, so 'İSTANBUL', 'Istanbul' and 'istanbul' all fold to
+'istanbul', and 'IŞIK' and 'ışık' both fold to 'isik'. Folding is this one
+explicit mapping, with no lower(): that depends on the database collation,
+so SQL could fold differently from Python. Other characters are left as they
+are. Keep FOLD_FROM/FOLD_TO in step with the tr_fold function created by the
+search_fold_explicit_20250912 migration.
+"""
+
+FOLD_FROM = "İIıŞşĞğÜüÖöÇçÂâÎîÛû" + "ABCDEFGHJKLMNOPQRSTUVWXYZ"
+FOLD_TO = "iiissgguuooccaaiiuu" + "abcdefghjklmnopqrstuvwxyz"
+
+_TABLE = str.maketrans(FOLD_FROM, FOLD_TO)
+
+
+def tr_fold(value):
+    if value is None:
+        return None
+    return str(value).translate(_TABLE)
@@ -1,8 +1,16 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import sessionmaker, declarative_base
 from .config import settings
+from .core.textfold import tr_fold
 
 engine = create_engine(settings.DATABASE_URL)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _register_sqlite_functions(dbapi_connection, connection_record):
+        # PostgreSQL gets tr_fold() from a migration; see services.search_service
+        dbapi_connection.create_function("tr_fold", 1, tr_fold, deterministic=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -13,3 +21,10 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def dialect_insert(db, model):
+    """INSERT construct with ON CONFLICT support for the session's database."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
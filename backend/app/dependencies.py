@@ -1,16 +1,105 @@
-from fastapi import Depends, Header, HTTPException
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, Header, HTTPException, status
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
+
 from .database import get_db
 from . import models
-from .auth import get_current_active_user
+from .auth import oauth2_scheme, decode_access_token, credentials_exception
+from .core import cache
+
+
+@dataclass
+class AuthContext:
+    """Everything an endpoint needs to know about the caller, resolved once per request."""
+
+    user: models.User
+    org: models.Organization
+    role: str
+    permissions: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == 'admin'
+
+    def has(self, permission_name: str) -> bool:
+        return self.is_admin or bool(self.permissions.get(permission_name))
+
+
+async def get_auth_context(x_org_slug: str = Header(..., alias="X-Org-Slug"),
+                           token: str = Depends(oauth2_scheme),
+                           db: Session = Depends(get_db)) -> AuthContext:
+    """Resolve user, organization, membership and role permissions in a single query.
 
-async def get_current_org(x_org_slug: str = Header(..., alias="X-Org-Slug"),
-                          current_user: models.User = Depends(get_current_active_user),
-                          db: Session = Depends(get_db)):
-    org = db.query(models.Organization).filter(models.Organization.slug == x_org_slug).first()
-    if not org:
+    Org, membership and role lookups are served from ``core.cache`` when warm, leaving
+    only a primary-key read of the user. FastAPI caches dependency results per request, so ``get_current_org``,
+    ``get_current_member`` and ``has_permission`` all share this one lookup.
+    """
+    user_id = decode_access_token(token)
+    cached = _cached_auth(db, user_id, x_org_slug)
+    if cached is not None:
+        return cached
+    row = (
+        db.query(models.User, models.Organization, models.UserOrganization.role, models.Role.permissions)
+        .select_from(models.User)
+        .outerjoin(models.Organization, models.Organization.slug == x_org_slug)
+        .outerjoin(models.UserOrganization, and_(
+            models.UserOrganization.user_id == models.User.id,
+            models.UserOrganization.org_id == models.Organization.id,
+        ))
+        .outerjoin(models.Role, models.Role.name == models.UserOrganization.role)
+        .filter(models.User.id == user_id)
+        .first()
+    )
+    if row is None:
+        raise credentials_exception
+    user, org, role, permissions = row
+    # Only positive lookups are cached, so new orgs and memberships show up immediately.
+    if org is not None:
+        cache.org_by_slug.set(org.slug, (org.id, org.name, org.slug))
+        if role is not None:
+            cache.membership_role.set((str(user.id), str(org.id)), role)
+            cache.role_permissions.set(role, permissions or {})
+    return _build_context(user, org, role, permissions)
+
+
+def _cached_auth(db: Session, user_id, slug: str) -> Optional[AuthContext]:
+    """Build the context from the TTL caches, loading only the user row; None on any miss."""
+    org_entry = cache.org_by_slug.get(slug)
+    if org_entry is None:
+        return None
+    role = cache.membership_role.get((str(user_id), str(org_entry[0])))
+    if role is None:
+        return None
+    permissions = cache.role_permissions.get(role)
+    if permissions is None:
+        return None
+    user = db.get(models.User, user_id)
+    if user is None:
+        raise credentials_exception
+    org_id, name, org_slug = org_entry
+    org = models.Organization(id=org_id, name=name, slug=org_slug)
+    return _build_context(user, org, role, permissions)
+
+
+def _build_context(user: models.User, org: Optional[models.Organization], role: Optional[str],
+                   permissions: Optional[Dict[str, Any]]) -> AuthContext:
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    if org is None:
         raise HTTPException(status_code=404, detail="Organization not found")
-    membership = db.query(models.UserOrganization).filter_by(user_id=current_user.id, org_id=org.id).first()
-    if not membership:
-        raise HTTPException(status_code=403, detail="Not a member of this organization")
-    return org
+    if role is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a member of this organization")
+    user.organization_id = org.id
+    return AuthContext(user=user, org=org, role=role, permissions=permissions or {})
+
+
+async def get_current_org(ctx: AuthContext = Depends(get_auth_context)) -> models.Organization:
+    return ctx.org
+
+
+async def get_current_member(ctx: AuthContext = Depends(get_auth_context)) -> models.User:
+    """The authenticated user, scoped to the organization from ``X-Org-Slug``."""
+    return ctx.user
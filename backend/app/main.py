@@ -16,7 +16,7 @@ from .routers import (
     accounts,
     financial_transactions,
 )
-from .api import production, dashboard, assets, me
+from .api import production, dashboard, assets, me, events
 from .routers import invoices, roles, org_users, tenants, personnel
 from app.api.admin import router as admin_router
 from fastapi.middleware.cors import CORSMiddleware
@@ -25,7 +25,9 @@ import os
 from .config import settings
 from .routers import supplier_prices
 from .routers import connections
+from .routers import search
 from .database import Base, engine
+from .services import dashboard_cache
 
 app = FastAPI(title="ERP API")
 
@@ -55,6 +57,8 @@ app.add_middleware(
     allow_methods=["*"],
     # In dev, be permissive to avoid preflight/header mismatches hiding errors in the browser
     allow_headers=["*"],
+    # Let browsers read the keyset pagination cursor
+    expose_headers=["X-Next-Cursor", "X-Board-Version"],
 )
 
 
@@ -66,6 +70,16 @@ def ensure_tables():
     except Exception as e:
         logging.getLogger(__name__).warning(f"create_all failed: {e}")
 
+
+@app.on_event("startup")
+def start_dashboard_refresh():
+    dashboard_cache.start_background_refresh()
+
+
+@app.on_event("shutdown")
+def stop_dashboard_refresh():
+    dashboard_cache.stop_background_refresh()
+
 app.include_router(auth.router)
 app.include_router(organizations.router)
 app.include_router(partners.router)
@@ -83,6 +97,7 @@ app.include_router(accounts.router)
 app.include_router(financial_transactions.router)
 app.include_router(production.router)
 app.include_router(dashboard.router)
+app.include_router(events.router)
 app.include_router(admin_router)
 app.include_router(assets.router)
 app.include_router(invoices.router)
@@ -93,6 +108,7 @@ app.include_router(tenants.router)
 app.include_router(personnel.router)
 app.include_router(supplier_prices.router)
 app.include_router(connections.router)
+app.include_router(search.router)
 
 @app.get("/healthz")
 def healthz():
@@ -19,10 +19,21 @@ from .database import Base
 from enum import Enum as PyEnum
 from .models_asset import Asset, AssetDetailVehicle, AssetDetailRealEstate, AssetDetailCheck
 from .models_personnel import Employee, EmployeeLeave
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlalchemy.sql import func
 
 
+def _newest_first_index(name, organization_id, day, id_):
+    """Index serving ``WHERE organization_id = ? ORDER BY day DESC NULLS LAST, id DESC``.
+
+    PostgreSQL needs that ordering spelled out: a backward scan of an ascending
+    index yields DESC NULLS FIRST. SQLite allows no NULLS LAST in an index, but
+    sorts NULLs first, so a backward scan of the plain index already matches.
+    """
+    Index(name, organization_id, day.desc().nullslast(), id_.desc()).ddl_if(dialect="postgresql")
+    Index(name, organization_id, day, id_).ddl_if(dialect="sqlite")
+
+
 class Invoice(Base):
     __tablename__ = "invoices"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -73,6 +84,8 @@ class UserOrganization(Base):
 
     user = relationship("User", back_populates="organizations")
     organization = relationship("Organization", back_populates="users")
+    # The primary key leads with user_id; member lists filter by org
+    __table_args__ = (Index("ix_user_organizations_org_id", "org_id"),)
 
 
 class Role(Base):
@@ -93,6 +106,7 @@ class Partner(Base):
     address = Column(String)
     tax_number = Column(String)
     is_active = Column(Boolean, default=True)
+    __table_args__ = (Index("ix_partners_org_name", "organization_id", "name", "id"),)
 
 class Category(Base):
     __tablename__ = "categories"
@@ -100,6 +114,7 @@ class Category(Base):
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
     name = Column(String, nullable=False)
     code = Column(String, nullable=False)
+    __table_args__ = (Index("ix_categories_org_name", "organization_id", "name", "id"),)
 
 class Product(Base):
     __tablename__ = "products"
@@ -109,6 +124,7 @@ class Product(Base):
     sku = Column(String, nullable=False)
     category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id"))
     base_price_sqm = Column(Numeric)
+    __table_args__ = (Index("ix_products_org_name", "organization_id", "name", "id"),)
 
 class Material(Base):
     __tablename__ = "materials"
@@ -118,6 +134,7 @@ class Material(Base):
     sku = Column(String, nullable=False)
     stock_quantity = Column(DECIMAL)
     unit = Column(String, nullable=False)
+    __table_args__ = (Index("ix_materials_org_name", "organization_id", "name", "id"),)
 
 class Order(Base):
     __tablename__ = "orders"
@@ -135,6 +152,14 @@ class Order(Base):
     # New: pricing controls
     discount_percent = Column(Numeric)  # general discount on subtotal (%), nullable
     vat_inclusive = Column(Boolean, default=False)  # if True, unit prices include VAT
+    # Sum of item areas (m^2), kept in step with order_items by order_service
+    total_area_sqm = Column(Numeric)
+    __table_args__ = (
+        Index("ix_orders_org_status", "organization_id", "status"),
+        Index("ix_orders_partner_id", "partner_id"),
+    )
+
+_newest_first_index("ix_orders_org_date", Order.organization_id, Order.order_date, Order.id)
 
 class OrderItem(Base):
     __tablename__ = "order_items"
@@ -151,6 +176,9 @@ class OrderItem(Base):
     unit_price = Column(Numeric)
     total_price = Column(Numeric)
     notes = Column(String)
+    # 1-based line number within the order; production job numbers follow it
+    position = Column(Integer)
+    __table_args__ = (Index("ix_order_items_order_id", "order_id"),)
 
 class PurchaseOrder(Base):
     __tablename__ = "purchase_orders"
@@ -163,6 +191,10 @@ class PurchaseOrder(Base):
     expected_delivery_date = Column(Date)
     grand_total = Column(Numeric)
     sales_order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"))
+    __table_args__ = (
+        Index("ix_purchase_orders_org_date", "organization_id", "order_date"),
+        Index("ix_purchase_orders_sales_order_id", "sales_order_id"),
+    )
 
 class PurchaseOrderItem(Base):
     __tablename__ = "purchase_order_items"
@@ -173,6 +205,7 @@ class PurchaseOrderItem(Base):
     unit_price = Column(Numeric)
     total_price = Column(Numeric)
     sales_order_item_id = Column(UUID(as_uuid=True), ForeignKey("order_items.id"))
+    __table_args__ = (Index("ix_purchase_order_items_purchase_order_id", "purchase_order_id"),)
 
 class ProductionStation(Base):
     __tablename__ = "production_stations"
@@ -181,6 +214,12 @@ class ProductionStation(Base):
     name = Column(String, nullable=False)
     code = Column(String, nullable=False)
     order_index = Column(Integer)
+    __table_args__ = (Index("ix_production_stations_org_order", "organization_id", "order_index"),)
+
+# Job statuses that count as done; production_service.is_active_job() excludes
+# them in the same terms as this predicate, so the planner can use the partial index
+COMPLETED_JOB_STATUSES = ("TAMAMLANDI", "COMPLETED")
+_ACTIVE_JOB_PREDICATE = "status NOT IN ({})".format(", ".join(f"'{s}'" for s in COMPLETED_JOB_STATUSES))
 
 class ProductionJob(Base):
     __tablename__ = "production_jobs"
@@ -191,6 +230,26 @@ class ProductionJob(Base):
     status = Column(String)
     quantity_required = Column(Integer)
     quantity_produced = Column(Integer)
+    # Change tracking for the board feed, see services.production_service
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    version = Column(Integer, nullable=False, default=0)
+    # Station of the latest log, maintained by production_service.apply_logs
+    current_station_id = Column(UUID(as_uuid=True), ForeignKey("production_stations.id"))
+    last_log_at = Column(DateTime)
+    # One job per order item; makes job spawning idempotent
+    __table_args__ = (
+        UniqueConstraint("order_item_id", name="uq_production_job_order_item"),
+        Index("ix_production_jobs_org_version", "organization_id", "version"),
+        Index("ix_production_jobs_org_station", "organization_id", "current_station_id"),
+        Index("ix_production_jobs_org_status", "organization_id", "status"),
+        # Station queues only read active jobs; must match production_service.is_active_job
+        Index(
+            "ix_production_jobs_active_station",
+            "organization_id", "current_station_id", "last_log_at",
+            postgresql_where=text(_ACTIVE_JOB_PREDICATE),
+            sqlite_where=text(_ACTIVE_JOB_PREDICATE),
+        ),
+    )
 
 class ProductionLog(Base):
     __tablename__ = "production_logs"
@@ -201,6 +260,10 @@ class ProductionLog(Base):
     completed_at = Column(DateTime, default=datetime.utcnow)
     quantity = Column(Integer)
     notes = Column(String)
+    __table_args__ = (
+        Index("ix_production_logs_completed_at", "completed_at"),
+        Index("ix_production_logs_job_completed_at", "job_id", "completed_at"),
+    )
 
 class Account(Base):
     __tablename__ = "accounts"
@@ -208,7 +271,11 @@ class Account(Base):
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
     name = Column(String, nullable=False)
     type = Column(Enum(AccountType), nullable=False)
+    # Maintained by ledger_service.apply_account_delta; equals opening_balance
+    # plus the account's transactions (see ledger_service.reconcile_account_balances)
     current_balance = Column(Numeric, default=0)
+    opening_balance = Column(Numeric, nullable=False, default=0)
+    __table_args__ = (Index("ix_accounts_organization_id", "organization_id"),)
 
 class FinancialTransaction(Base):
     __tablename__ = "financial_transactions"
@@ -223,6 +290,67 @@ class FinancialTransaction(Base):
     transaction_date = Column(Date)
     description = Column(String)
     method = Column(String)
+    # Ledger filters and statements, see services.transaction_service / statement_service
+    __table_args__ = (
+        Index("ix_financial_transactions_org_partner_date", "organization_id", "partner_id", "transaction_date"),
+        Index("ix_financial_transactions_org_account_date", "organization_id", "account_id", "transaction_date"),
+        Index("ix_financial_transactions_order_id", "order_id"),
+        Index("ix_financial_transactions_purchase_order_id", "purchase_order_id"),
+    )
+
+
+_newest_first_index(
+    "ix_financial_transactions_org_date",
+    FinancialTransaction.organization_id, FinancialTransaction.transaction_date, FinancialTransaction.id,
+)
+
+
+class NumberSequence(Base):
+    """Per-org counter for human-readable document numbers, see services.sequence_service."""
+    __tablename__ = "number_sequences"
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
+    name = Column(String, nullable=False)  # e.g. 'order', 'purchase_order'
+    period = Column(Integer, nullable=False, default=0)  # year for yearly sequences, 0 otherwise
+    last_value = Column(Integer, nullable=False, default=0)
+    __table_args__ = (
+        UniqueConstraint("organization_id", "name", "period", name="uq_number_sequence"),
+    )
+
+
+class PartnerBalance(Base):
+    """Running receivable balance per partner, maintained by services.ledger_service."""
+    __tablename__ = "partner_balances"
+    partner_id = Column(UUID(as_uuid=True), ForeignKey("partners.id"), primary_key=True)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False, index=True)
+    balance = Column(Numeric, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ProductionDailyRollup(Base):
+    """Cached per-station daily figures for finished days, see services.production_analytics."""
+    __tablename__ = "production_daily_rollups"
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
+    station_id = Column(UUID(as_uuid=True), ForeignKey("production_stations.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    log_count = Column(Integer, nullable=False, default=0)
+    quantity = Column(Integer, nullable=False, default=0)
+    cycle_count = Column(Integer, nullable=False, default=0)
+    cycle_seconds = Column(Numeric, nullable=False, default=0)
+    computed_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (
+        UniqueConstraint("organization_id", "station_id", "day", name="uq_production_daily_rollup"),
+        Index("ix_production_daily_rollups_org_day", "organization_id", "day"),
+    )
+
+
+class ProductionRollupDay(Base):
+    """Marks a day's rollups as computed, so idle days (no rollup rows) are not recomputed."""
+    __tablename__ = "production_rollup_days"
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    computed_at = Column(DateTime, default=datetime.utcnow)
 
 
 class SupplierPrice(Base):
@@ -1,3 +1,12 @@
 from .. import models, schemas
 from .common import get_crud_router
-router = get_crud_router(models.Account, schemas.AccountRead, schemas.AccountCreate, "/accounts")
+
+
+def _record_opening_balance(db, account, organization_id):
+    # The balance given at creation is the base the transactions add to
+    account.opening_balance = account.current_balance or 0
+
+
+router = get_crud_router(
+    models.Account, schemas.AccountRead, schemas.AccountCreate, "/accounts", on_create=_record_opening_balance
+)
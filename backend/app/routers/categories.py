@@ -1,14 +1,14 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
 from ..services import category_service
+from ..services.pagination import set_next_cursor
 from ..database import get_db
-from ..auth import get_current_user
-from ..dependencies import get_current_org
+from ..dependencies import get_current_org, get_current_member
 from ..core.deps import has_permission
 
 router = APIRouter(prefix="/categories", tags=["categories"])
@@ -16,18 +16,21 @@ router = APIRouter(prefix="/categories", tags=["categories"])
 
 @router.get("/", response_model=List[schemas.CategoryRead])
 def list_categories(
+    response: Response,
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: models.User = Depends(get_current_member),
     org: models.Organization = Depends(get_current_org),
 ):
     current_user.organization_id = org.id
-    categories = category_service.list_categories(
-        db, current_user, search=search, skip=skip, limit=limit
+    page = category_service.list_categories(
+        db, current_user, search=search, skip=skip, limit=limit, cursor=cursor
     )
-    return categories
+    set_next_cursor(response, page)
+    return page.items
 
 
 @router.post("/", response_model=schemas.CategoryRead)
@@ -43,7 +46,7 @@ def create_category(
 def get_category(
     category_id: UUID,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: models.User = Depends(get_current_member),
     org: models.Organization = Depends(get_current_org),
 ):
     current_user.organization_id = org.id
@@ -1,21 +1,36 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from typing import Type
+from typing import Optional, Type
 from pydantic import BaseModel
-from ..services.crud import CRUDService
+from ..services.crud import CRUDService, CreateHook, ScopeFn, DEFAULT_LIST_LIMIT, MAX_LIST_LIMIT
+from ..services.pagination import NEXT_CURSOR_HEADER, set_next_cursor
 from ..database import get_db
 from ..dependencies import get_current_org
 from ..core.deps import has_permission
 
+# Query params consumed by the list endpoint itself; everything else is a field filter
+LIST_PARAMS = {'limit', 'cursor', 'sort', 'fields'}
 
-def get_crud_router(model: Type, read_schema: Type[BaseModel], create_schema: Type[BaseModel], prefix: str, perm_prefix: str | None = None):
+
+def get_crud_router(
+    model: Type,
+    read_schema: Type[BaseModel],
+    create_schema: Type[BaseModel],
+    prefix: str,
+    perm_prefix: str | None = None,
+    scope: Optional[ScopeFn] = None,
+    on_create: Optional[CreateHook] = None,
+):
     router = APIRouter(prefix=prefix, tags=[prefix.strip('/')])
-    service = CRUDService(model)
+    service = CRUDService(model, scope=scope, on_create=on_create)
     # Derive a sane permission namespace like 'account', 'order_item', etc.
     base = perm_prefix or prefix.strip('/').rstrip('/')
     # crude singularize: drop trailing 's' only
     if base.endswith('s'):
         base = base[:-1]
+    readable_fields = set(read_schema.model_fields)
 
     @router.post('/', response_model=read_schema)
     def create_item(
@@ -28,10 +43,32 @@ def get_crud_router(model: Type, read_schema: Type[BaseModel], create_schema: Ty
 
     @router.get('/', response_model=list[read_schema])
     def list_items(
+        request: Request,
+        response: Response,
+        limit: int = Query(DEFAULT_LIST_LIMIT, ge=1, le=MAX_LIST_LIMIT),
+        cursor: Optional[str] = None,
+        sort: Optional[str] = Query(None, description="Column to sort by; prefix with '-' for descending"),
+        fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return"),
         db: Session = Depends(get_db),
         org=Depends(get_current_org),
         user=Depends(has_permission(f"{base}:view")),
     ):
-        return service.list(db, organization_id=org.id)
+        selected = None
+        if fields:
+            selected = [f.strip() for f in fields.split(',') if f.strip()]
+            unknown = [f for f in selected if f not in readable_fields]
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+            if 'id' in readable_fields and 'id' not in selected:
+                selected.insert(0, 'id')
+        filters = {k: v for k, v in request.query_params.items() if k not in LIST_PARAMS}
+        page = service.list(db, organization_id=org.id, filters=filters, sort=sort, cursor=cursor, limit=limit)
+        if selected is None:
+            set_next_cursor(response, page)
+            return page.items
+        # Sparse rows don't match read_schema, so bypass response_model validation
+        rows = [{f: getattr(item, f, None) for f in selected} for item in page.items]
+        headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+        return JSONResponse(jsonable_encoder(rows), headers=headers)
 
     return router
@@ -1,7 +1,11 @@
-﻿from typing import List, Optional
+﻿import json
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
@@ -9,26 +13,67 @@ from ..database import get_db
 from ..dependencies import get_current_org
 from ..auth import get_current_user
 from ..core.deps import has_permission
+from ..services import dashboard_cache, ledger_service, transaction_service
+from ..services.crud import MAX_LIST_LIMIT
+from ..services.pagination import set_next_cursor
 
 router = APIRouter(prefix="/financial_transactions", tags=["financial_transactions"])
 
 
+def ledger_filters(
+    partner_id: Optional[UUID] = None,
+    account_id: Optional[UUID] = None,
+    order_id: Optional[UUID] = None,
+    purchase_order_id: Optional[UUID] = None,
+    direction: Optional[models.TransactionDirection] = None,
+    method: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    min_amount: Optional[Decimal] = None,
+    max_amount: Optional[Decimal] = None,
+    search: Optional[str] = Query(None, description="Matches description or method"),
+) -> dict:
+    return dict(
+        partner_id=partner_id,
+        account_id=account_id,
+        order_id=order_id,
+        purchase_order_id=purchase_order_id,
+        direction=direction,
+        method=method,
+        start_date=start_date,
+        end_date=end_date,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        search=search,
+    )
+
+
 @router.get('/', response_model=List[schemas.FinancialTransactionRead])
 def list_tx(
-    partner_id: Optional[UUID] = None,
-    limit: int = 100,
+    response: Response,
+    filters: dict = Depends(ledger_filters),
+    limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     org: models.Organization = Depends(get_current_org),
     user=Depends(has_permission("finance:view")),
 ):
-    q = db.query(models.FinancialTransaction).filter(models.FinancialTransaction.organization_id == org.id)
-    if partner_id:
-        q = q.filter(models.FinancialTransaction.partner_id == partner_id)
-    return (
-        q.order_by(models.FinancialTransaction.transaction_date.desc().nullslast(), models.FinancialTransaction.id.desc())
-        .limit(limit)
-        .all()
-    )
+    page = transaction_service.list_transactions(db, org.id, cursor=cursor, limit=limit, **filters)
+    set_next_cursor(response, page)
+    return page.items
+
+
+@router.get('/ledger', response_model=schemas.FinancialTransactionLedger)
+def ledger(
+    filters: dict = Depends(ledger_filters),
+    limit: int = Query(100, ge=1, le=MAX_LIST_LIMIT),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    org: models.Organization = Depends(get_current_org),
+    user=Depends(has_permission("finance:view")),
+):
+    """Filtered transactions newest first, with totals for the page and the whole filtered set."""
+    return transaction_service.ledger_page(db, org.id, cursor=cursor, limit=limit, **filters)
 
 
 @router.post('/', response_model=schemas.FinancialTransactionRead)
@@ -62,15 +107,58 @@ def create_tx(
         method=body.method,
     )
     db.add(tx)
+    ledger_service.record_transaction(db, tx)
 
     # Update account balance: IN -> +, OUT -> -
     if account is not None:
-        if body.direction == models.TransactionDirection.IN:
-            account.current_balance = (account.current_balance or 0) + (body.amount or 0)
-        else:
-            account.current_balance = (account.current_balance or 0) - (body.amount or 0)
-        db.add(account)
+        ledger_service.apply_account_delta(db, account.id, ledger_service.account_delta(body.direction, body.amount))
 
     db.commit()
+    dashboard_cache.invalidate(org.id)
     db.refresh(tx)
     return tx
+
+
+@router.post('/bulk', response_model=schemas.FinancialTransactionImportResponse)
+async def import_tx(
+    request: Request,
+    atomic: bool = False,
+    skip_duplicates: bool = True,
+    db: Session = Depends(get_db),
+    org: models.Organization = Depends(get_current_org),
+    user=Depends(has_permission("finance:edit")),
+):
+    """Import many transactions at once, e.g. a bank statement.
+
+    The body is either a JSON array of transactions or CSV (``Content-Type:
+    text/csv``) with a header row of the same field names.
+    """
+    body = await request.body()
+    if "csv" in request.headers.get("content-type", ""):
+        try:
+            rows = transaction_service.parse_csv(body.decode("utf-8"))
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=400, detail="CSV must be UTF-8 encoded")
+    else:
+        try:
+            rows = json.loads(body or b"null")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or CSV")
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array of transactions")
+    if not rows:
+        raise HTTPException(status_code=400, detail="No transactions to import")
+    if len(rows) > transaction_service.MAX_IMPORT_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {transaction_service.MAX_IMPORT_ROWS} transactions per import")
+    # The import is blocking database work; keep it off the event loop
+    results = await run_in_threadpool(
+        transaction_service.import_transactions, db, org.id, rows, atomic=atomic, skip_duplicates=skip_duplicates
+    )
+    created = sum(1 for r in results if r['ok'])
+    duplicates = sum(1 for r in results if r['duplicate'])
+    return schemas.FinancialTransactionImportResponse(
+        created=created,
+        duplicates=duplicates,
+        failed=sum(1 for r in results if not r['ok'] and not r['duplicate']),
+        results=results,
+    )
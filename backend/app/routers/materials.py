@@ -1,7 +1,7 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
@@ -10,6 +10,7 @@ from ..dependencies import get_current_org
 from ..auth import get_current_user
 from ..core.deps import has_permission
 from ..services import material_service
+from ..services.pagination import set_next_cursor
 
 router = APIRouter(prefix="/materials", tags=["materials"])
 
@@ -26,13 +27,17 @@ def create_material(
 
 @router.get('/', response_model=List[schemas.MaterialRead])
 def list_materials(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     org: models.Organization = Depends(get_current_org),
     user=Depends(has_permission("material:view")),
 ):
-    return material_service.list_materials(db, org.id, skip=skip, limit=limit)
+    page = material_service.list_materials(db, org.id, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, page)
+    return page.items
 
 
 @router.put('/{material_id}', response_model=schemas.MaterialRead)
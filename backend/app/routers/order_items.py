@@ -1,3 +1,14 @@
 from .. import models, schemas
+from ..services import order_service
 from .common import get_crud_router
-router = get_crud_router(models.OrderItem, schemas.OrderItemRead, schemas.OrderItemCreate, "/order_items")
+
+
+def _after_item_created(db, item, organization_id):
+    if item.position is None:
+        item.position = order_service.next_item_position(db, organization_id, item.order_id)
+    order_service.refresh_order_area(db, organization_id, item.order_id)
+
+
+router = get_crud_router(
+    models.OrderItem, schemas.OrderItemRead, schemas.OrderItemCreate, "/order_items", on_create=_after_item_created
+)
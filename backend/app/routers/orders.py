@@ -1,12 +1,13 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from .. import models, schemas
-from ..services import order_service
+from ..services import order_service, pricing
+from ..services.pagination import set_next_cursor
 from ..database import get_db
 from ..auth import get_current_user
 from ..dependencies import get_current_org
@@ -41,6 +42,41 @@ def create_order(
     )
 
 
+@router.post("/quote", response_model=schemas.OrderQuote)
+def quote_order(
+    order_in: schemas.OrderCreateWithItems,
+    current_user: models.User = Depends(has_permission("order:view")),
+):
+    """Price an order exactly as create would, without writing anything."""
+    return pricing.price_order(
+        order_in.items, discount_percent=order_in.discount_percent, vat_inclusive=order_in.vat_inclusive
+    )
+
+
+@router.post("/bulk", response_model=schemas.OrderBulkResponse)
+def create_orders_bulk(
+    payload: schemas.OrderBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(has_permission("order:create")),
+):
+    results = order_service.create_orders_bulk(db, payload.orders, current_user, atomic=payload.atomic)
+    created = sum(1 for r in results if r['ok'])
+    return schemas.OrderBulkResponse(created=created, failed=len(results) - created, results=results)
+
+
+@router.post("/status/bulk", response_model=schemas.OrderStatusBulkResponse)
+def change_status_bulk(
+    payload: schemas.OrderStatusBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(has_permission("order:update")),
+):
+    results, jobs_created = order_service.update_orders_status_bulk(db, payload.order_ids, payload.status, current_user)
+    updated = sum(1 for r in results if r['ok'])
+    return schemas.OrderStatusBulkResponse(
+        updated=updated, failed=len(results) - updated, jobs_created=jobs_created, results=results
+    )
+
+
 @router.get("/{order_id}/linked-purchase-orders", response_model=List[schemas.PurchaseOrderRead])
 def linked_purchase_orders(
     order_id: UUID,
@@ -61,17 +97,19 @@ def linked_purchase_orders(
 
 @router.get("/", response_model=List[schemas.OrderRead])
 def list_orders(
+    response: Response,
     status: Optional[str] = None,
     partner_id: Optional[UUID] = None,
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(has_permission("order:view")),
     org: models.Organization = Depends(get_current_org),
 ):
     current_user.organization_id = org.id
-    orders = order_service.list_orders(
+    page = order_service.list_orders(
         db,
         current_user,
         status=status,
@@ -79,8 +117,10 @@ def list_orders(
         search=search,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
-    return orders
+    set_next_cursor(response, page)
+    return page.items
 
 
 @router.get("/{order_id}", response_model=schemas.OrderDetail)
@@ -8,6 +8,7 @@ from ..dependencies import get_current_org
 from ..auth import get_current_user
 from ..core.deps import has_permission
 from ..auth import get_password_hash
+from ..core import cache
 
 router = APIRouter(prefix="/org-users", tags=["org-users"])
 
@@ -48,6 +49,7 @@ def assign_role(
     ou.role = role
     db.add(ou)
     db.commit()
+    cache.invalidate_membership(ou.user_id, org.id)
     return {"ok": True}
 
 
@@ -83,4 +85,5 @@ def create_org_user(
         db.add(ou)
 
     db.commit()
+    cache.invalidate_membership(user.id, org.id)
     return {"ok": True, "user_id": str(user.id)}
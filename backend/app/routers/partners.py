@@ -1,12 +1,14 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
-from ..services import partner_service
-from ..database import get_db
+from ..services import partner_service, statement_service
+from ..services.pagination import set_next_cursor
+from ..database import SessionLocal, get_db
 from ..auth import get_current_user
 from ..dependencies import get_current_org
 from ..core.deps import has_permission
@@ -16,17 +18,19 @@ router = APIRouter(prefix="/partners", tags=["partners"])
 
 @router.get("/", response_model=List[schemas.PartnerRead])
 def list_partners(
+    response: Response,
     partner_type: Optional[schemas.PartnerType] = None,
     search: Optional[str] = None,
     is_active: Optional[bool] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(has_permission("partner:view")),
     org: models.Organization = Depends(get_current_org),
 ):
     current_user.organization_id = org.id
-    partners = partner_service.list_partners(
+    page = partner_service.list_partners(
         db,
         current_user,
         partner_type=partner_type,
@@ -34,8 +38,10 @@ def list_partners(
         search=search,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
-    return partners
+    set_next_cursor(response, page)
+    return page.items
 
 
 @router.post("/", response_model=schemas.PartnerRead)
@@ -88,8 +94,6 @@ def delete_partner(
 
 # New: partner-related resources (orders and statement)
 from pydantic import BaseModel
-from sqlalchemy import func
-import sqlalchemy as sa
 from datetime import datetime, date
 
 
@@ -145,32 +149,14 @@ def get_partner_statement(
     end_date: Optional[date] = None,
 ):
     current_user.organization_id = org.id
-    # Precompute total area per sales order (sum of item areas in m^2)
-    area_expr = func.coalesce(
-        models.OrderItem.area_sqm,
-        (sa.cast(models.OrderItem.width, sa.Numeric()) / 1000)
-        * (sa.cast(models.OrderItem.height, sa.Numeric()) / 1000)
-        * sa.cast(func.coalesce(models.OrderItem.quantity, 0), sa.Numeric()),
-    )
-    order_area_sq = (
-        db.query(
-            models.OrderItem.order_id.label("order_id"),
-            func.sum(area_expr).label("total_area_sqm"),
-        )
-        .group_by(models.OrderItem.order_id)
-        .subquery()
-    )
-
     q = (
         db.query(
             models.FinancialTransaction,
             models.Order,
             models.PurchaseOrder,
-            order_area_sq.c.total_area_sqm,
         )
         .outerjoin(models.Order, models.Order.id == models.FinancialTransaction.order_id)
         .outerjoin(models.PurchaseOrder, models.PurchaseOrder.id == models.FinancialTransaction.purchase_order_id)
-        .outerjoin(order_area_sq, order_area_sq.c.order_id == models.Order.id)
         .filter(
             models.FinancialTransaction.organization_id == org.id,
             models.FinancialTransaction.partner_id == partner_id,
@@ -187,7 +173,7 @@ def get_partner_statement(
     payments_out = 0.0    # cash paid to partner (refunds, etc.)
     postings_total = 0.0  # posted amounts from orders/purchases increasing balance
 
-    for t, order, po, total_area in rows:
+    for t, order, po in rows:
         amt = float(t.amount or 0)
         # Classify
         if (t.method or "").upper() in ("ORDER", "PURCHASE"):
@@ -213,7 +199,7 @@ def get_partner_statement(
                 description=t.description,
                 document_name=doc_name,
                 method=t.method,
-                area_sqm=float(total_area) if total_area is not None else None,
+                area_sqm=float(order.total_area_sqm) if order is not None and order.total_area_sqm is not None else None,
             )
         )
 
@@ -221,3 +207,39 @@ def get_partner_statement(
     summary = StatementSummary(incoming=payments_in, outgoing=payments_out, balance=balance)
     return PartnerStatementResponse(items=items, summary=summary)
 
+
+
+class StatementStreamItem(StatementItem):
+    running_balance: float
+
+
+@router.get("/{partner_id}/statement/stream")
+def stream_partner_statement(
+    partner_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(has_permission("partner:view")),
+    org: models.Organization = Depends(get_current_org),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """NDJSON statement, oldest first: one line per transaction with its running balance,
+    then a final ``{"summary": ...}`` line. Rows are streamed as they are fetched."""
+    current_user.organization_id = org.id
+    if not partner_service.get_partner(db, partner_id, current_user):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Partner not found")
+    org_id = org.id
+    # get_db only closes the request session once the body has been sent; give
+    # its connection back now so a download holds just the stream's own
+    db.close()
+
+    def lines():
+        stream_db = SessionLocal()
+        try:
+            for row in statement_service.iter_statement_rows(stream_db, org_id, partner_id, start_date, end_date):
+                yield StatementStreamItem(**row).model_dump_json() + "\n"
+            summary = StatementSummary(**statement_service.statement_summary(stream_db, org_id, partner_id, start_date, end_date))
+            yield '{"summary":' + summary.model_dump_json() + "}\n"
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
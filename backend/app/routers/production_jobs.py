@@ -1,3 +1,13 @@
 from .. import models, schemas
+from ..services import production_service
 from .common import get_crud_router
-router = get_crud_router(models.ProductionJob, schemas.ProductionJobRead, schemas.ProductionJobCreate, "/production_jobs")
+
+
+def _after_job_created(db, job, organization_id):
+    production_service.touch_job(db, job)
+
+
+router = get_crud_router(
+    models.ProductionJob, schemas.ProductionJobRead, schemas.ProductionJobCreate, "/production_jobs",
+    on_create=_after_job_created,
+)
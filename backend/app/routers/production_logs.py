@@ -1,3 +1,34 @@
+from datetime import datetime
+
+from fastapi import HTTPException
+
 from .. import models, schemas
+from ..core import events
+from ..services import production_service
 from .common import get_crud_router
-router = get_crud_router(models.ProductionLog, schemas.ProductionLogRead, schemas.ProductionLogCreate, "/production_logs")
+
+
+def _org_scope(query, organization_id):
+    # Logs carry no organization_id of their own; scope them through their job
+    return query.join(models.ProductionJob, models.ProductionJob.id == models.ProductionLog.job_id).filter(
+        models.ProductionJob.organization_id == organization_id
+    )
+
+
+def _after_log_created(db, log, organization_id):
+    job = db.get(models.ProductionJob, log.job_id)
+    if job is None or job.organization_id != organization_id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    log.completed_at = production_service.naive_utc(log.completed_at) or datetime.utcnow()
+    production_service.apply_logs(db, organization_id, [{
+        'job_id': log.job_id, 'station_id': log.station_id, 'completed_at': log.completed_at, 'quantity': log.quantity,
+    }])
+    events.publish(db, organization_id, "production_log.created", {
+        'log_id': log.id, 'job_id': log.job_id, 'station_id': log.station_id, 'quantity': log.quantity,
+    })
+
+
+router = get_crud_router(
+    models.ProductionLog, schemas.ProductionLogRead, schemas.ProductionLogCreate, "/production_logs",
+    scope=_org_scope, on_create=_after_log_created,
+)
@@ -1,14 +1,14 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
 from ..services import product_service
+from ..services.pagination import set_next_cursor
 from ..database import get_db
-from ..auth import get_current_user
-from ..dependencies import get_current_org
+from ..dependencies import get_current_org, get_current_member
 from ..core.deps import has_permission
 
 router = APIRouter(prefix="/products", tags=["products"])
@@ -16,24 +16,28 @@ router = APIRouter(prefix="/products", tags=["products"])
 
 @router.get("/", response_model=List[schemas.ProductRead])
 def list_products(
+    response: Response,
     category_id: Optional[UUID] = None,
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: models.User = Depends(get_current_member),
     org: models.Organization = Depends(get_current_org),
 ):
     current_user.organization_id = org.id
-    products = product_service.list_products(
+    page = product_service.list_products(
         db,
         current_user,
         category_id=category_id,
         search=search,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
-    return products
+    set_next_cursor(response, page)
+    return page.items
 
 
 @router.post("/", response_model=schemas.ProductRead)
@@ -49,7 +53,7 @@ def create_product(
 def get_product(
     product_id: UUID,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    current_user: models.User = Depends(get_current_member),
     org: models.Organization = Depends(get_current_org),
 ):
     current_user.organization_id = org.id
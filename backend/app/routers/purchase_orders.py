@@ -6,8 +6,40 @@ from ..database import get_db
 from ..dependencies import get_current_org
 from .common import get_crud_router
 from ..core.deps import has_permission
+from ..services import dashboard_cache, ledger_service, sequence_service
 
-router = get_crud_router(models.PurchaseOrder, schemas.PurchaseOrderRead, schemas.PurchaseOrderCreate, "/purchase_orders")
+
+def _assign_po_number(db: Session, po: models.PurchaseOrder, organization_id) -> None:
+    """Number POs like 'PO-2025-001' from the org's yearly sequence unless one was given."""
+    if po.po_number:
+        return
+    year = (po.order_date or date.today()).year
+    prefix = f"PO-{year}-"
+
+    def legacy_max() -> int:
+        rows = (
+            db.query(models.PurchaseOrder.po_number)
+            .filter(
+                models.PurchaseOrder.organization_id == po.organization_id,
+                models.PurchaseOrder.po_number.like(f"{prefix}%"),
+            )
+            .all()
+        )
+        return sequence_service.max_numeric_suffix((r[0] for r in rows), prefix)
+
+    seq = sequence_service.next_value(
+        db, po.organization_id, sequence_service.PURCHASE_ORDER_SEQUENCE, year, seed=legacy_max
+    )
+    po.po_number = f"{prefix}{seq:03d}"
+
+
+router = get_crud_router(
+    models.PurchaseOrder,
+    schemas.PurchaseOrderRead,
+    schemas.PurchaseOrderCreate,
+    "/purchase_orders",
+    on_create=_assign_po_number,
+)
 
 
 @router.post("/{po_id}/post", response_model=schemas.FinancialTransactionRead)
@@ -41,6 +73,8 @@ def post_purchase_order(
         method="PURCHASE",
     )
     db.add(tx)
+    ledger_service.record_transaction(db, tx)
     db.commit()
+    dashboard_cache.invalidate(org.id)
     db.refresh(tx)
     return tx
@@ -7,6 +7,7 @@ from ..database import get_db
 from ..dependencies import get_current_org
 from ..auth import get_current_user
 from ..core.deps import has_permission
+from ..core import cache
 
 router = APIRouter(prefix="/roles", tags=["roles"])
 
@@ -38,6 +39,7 @@ def create_role(
     db.add(r)
     db.commit()
     db.refresh(r)
+    cache.invalidate_role(name)
     return {"name": r.name, "permissions": r.permissions}
 
 
@@ -58,6 +60,7 @@ def update_role(
     db.add(r)
     db.commit()
     db.refresh(r)
+    cache.invalidate_role(name)
     return {"name": r.name, "permissions": r.permissions}
 
 
@@ -73,5 +76,6 @@ def delete_role(
         raise HTTPException(status_code=404, detail="role not found")
     db.delete(r)
     db.commit()
+    cache.invalidate_role(name)
     return {"ok": True}
 
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from .. import schemas
+from ..database import get_db
+from ..dependencies import AuthContext, get_auth_context
+from ..services import search_service
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+# Section -> permission needed to see it (None: any member, as for /products)
+SECTIONS = {'orders': "order:view", 'partners': "partner:view", 'products': None}
+
+
+@router.get("/", response_model=schemas.SearchResults)
+def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=search_service.MAX_RESULTS),
+    db: Session = Depends(get_db),
+    ctx: AuthContext = Depends(get_auth_context),
+):
+    """Orders, partners and products matching every word of ``q``, best matches first.
+
+    Case and Turkish letters are folded ('ışık' finds 'IŞIK' and 'Isik').
+    Sections the caller may not view come back empty.
+    """
+    include = [name for name, perm in SECTIONS.items() if perm is None or ctx.has(perm)]
+    return search_service.search_all(db, ctx.org.id, q, limit, include=include)
@@ -6,6 +6,7 @@ from .. import models
 from ..database import get_db
 from ..core.deps import has_permission
 from ..auth import get_password_hash, get_current_user
+from ..core import cache
 
 router = APIRouter(prefix="/tenants", tags=["tenants"])
 
@@ -42,5 +43,8 @@ def create_tenant(
             db.add(models.UserOrganization(user_id=user.id, org_id=org.id, role='admin'))
 
     db.commit()
+    cache.invalidate_org(org.slug)
+    if user is not None:
+        cache.invalidate_membership(user.id, org.id)
     return { 'id': str(org.id), 'name': org.name, 'slug': org.slug, 'admin_user_id': (str(user.id) if user else None) }
 
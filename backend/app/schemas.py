@@ -3,7 +3,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
 from enum import Enum
 from typing import Any, Dict
 
@@ -125,6 +125,7 @@ class OrderCreate(OrderBase):
 
 class OrderRead(OrderBase):
     id: UUID
+    total_area_sqm: Optional[Decimal] = None
     model_config = ConfigDict(from_attributes=True)
 
 class OrderItemBase(BaseModel):
@@ -165,6 +166,62 @@ class OrderCreateWithItems(OrderBase):
 class OrderDetail(OrderRead):
     items: List[OrderItemRead] = []
 
+
+class OrderStatusBulkUpdate(BaseModel):
+    order_ids: List[UUID] = Field(..., min_length=1, max_length=500)
+    status: str
+
+
+class OrderStatusBulkResult(BaseModel):
+    order_id: UUID
+    ok: bool
+    error: Optional[str] = None
+
+
+class OrderStatusBulkResponse(BaseModel):
+    updated: int
+    failed: int
+    jobs_created: int
+    results: List[OrderStatusBulkResult]
+
+
+class OrderQuoteLine(BaseModel):
+    area_sqm: Decimal
+    quantity: int
+    unit_price: Decimal
+    total_price: Decimal
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrderQuote(BaseModel):
+    subtotal: Decimal
+    discount: Decimal
+    vat: Decimal
+    grand_total: Decimal
+    total_area_sqm: Decimal
+    lines: List[OrderQuoteLine] = []
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OrderBulkCreate(BaseModel):
+    orders: List[OrderCreateWithItems] = Field(..., min_length=1, max_length=500)
+    atomic: bool = False  # if True, any invalid order rejects the whole batch
+
+
+class OrderBulkResult(BaseModel):
+    index: int
+    ok: bool
+    id: Optional[UUID] = None
+    order_number: Optional[str] = None
+    grand_total: Optional[Decimal] = None
+    error: Optional[str] = None
+
+
+class OrderBulkResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[OrderBulkResult]
+
 class PurchaseOrderBase(BaseModel):
     partner_id: Optional[UUID] = None
     po_number: Optional[str] = None
@@ -247,6 +304,7 @@ class AccountCreate(AccountBase):
 
 class AccountRead(AccountBase):
     id: UUID
+    opening_balance: Optional[Decimal] = None
     model_config = ConfigDict(from_attributes=True)
 
 class FinancialTransactionBase(BaseModel):
@@ -268,6 +326,35 @@ class FinancialTransactionRead(FinancialTransactionBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class LedgerTotals(BaseModel):
+    count: int
+    incoming: Decimal
+    outgoing: Decimal
+    net: Decimal
+
+
+class FinancialTransactionLedger(BaseModel):
+    items: List[FinancialTransactionRead]
+    next_cursor: Optional[str] = None
+    page_totals: LedgerTotals
+    totals: LedgerTotals  # over every transaction matching the filters
+
+
+class FinancialTransactionImportResult(BaseModel):
+    index: int
+    ok: bool
+    id: Optional[UUID] = None
+    duplicate: bool = False  # same date, direction, account, amount and description as an existing or earlier row
+    error: Optional[str] = None
+
+
+class FinancialTransactionImportResponse(BaseModel):
+    created: int
+    duplicates: int
+    failed: int
+    results: List[FinancialTransactionImportResult]
+
+
 class SupplierPriceBase(BaseModel):
     supplier_id: UUID
     product_id: UUID
@@ -435,3 +522,7 @@ class ConnectionApplicationRead(ConnectionApplicationBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class SearchResults(BaseModel):
+    orders: List[OrderRead] = []
+    partners: List[PartnerRead] = []
+    products: List[ProductRead] = []
@@ -1,12 +1,14 @@
-from typing import List, Optional
-from typing import List, Optional
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from fastapi import HTTPException
 
 from .. import models, schemas
+from . import search_service
+from .pagination import Page, SortKey, paginate
+
+CATEGORY_LIST_KEYS = (SortKey(models.Category.name), SortKey(models.Category.id))
 
 
 def create_category(db: Session, category_in: schemas.CategoryCreate, current_user: models.User):
@@ -36,17 +38,15 @@ def list_categories(
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-) -> List[models.Category]:
+    cursor: Optional[str] = None,
+) -> Page:
     """List categories for the current user's organization with optional search."""
     query = db.query(models.Category).filter(
         models.Category.organization_id == current_user.organization_id
     )
     if search:
-        like = f"%{search}%"
-        query = query.filter(
-            or_(models.Category.name.ilike(like), models.Category.code.ilike(like))
-        )
-    return query.offset(skip).limit(limit).all()
+        query = query.filter(search_service.match((models.Category.name, models.Category.code), search))
+    return paginate(query, CATEGORY_LIST_KEYS, cursor=cursor, limit=limit, skip=skip)
 
 
 def update_category(
@@ -6,6 +6,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from .. import models
+from . import dashboard_cache, ledger_service
 
 
 def create_connection(
@@ -162,6 +163,7 @@ def apply_connection(
         )
         .first()
     )
+    previous_amount = None
     if tx is None:
         tx = models.FinancialTransaction(
             organization_id=organization_id,
@@ -176,9 +178,12 @@ def apply_connection(
             method="CONNECTION_APPLY",
         )
     else:
+        previous_amount = tx.amount
         tx.amount = amt
     db.add(tx)
+    ledger_service.record_transaction(db, tx, previous_amount=previous_amount)
 
     db.commit()
+    dashboard_cache.invalidate(organization_id)
     db.refresh(app)
     return app
@@ -1,20 +1,118 @@
-from typing import Type, TypeVar, Generic, List
-from sqlalchemy.orm import Session
+from decimal import InvalidOperation
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session
 from pydantic import BaseModel
+from . import dashboard_cache
+from .pagination import Page, SortKey, coerce_value, paginate
 
 ModelType = TypeVar('ModelType')
 CreateSchemaType = TypeVar('CreateSchemaType', bound=BaseModel)
 
+DEFAULT_LIST_LIMIT = 100
+MAX_LIST_LIMIT = 500
+
+# Comparison suffixes accepted on filter params, e.g. ?completed_at__gte=2025-01-01
+FILTER_OPERATORS = {
+    'eq': lambda col, v: col == v,
+    'ne': lambda col, v: col != v,
+    'gte': lambda col, v: col >= v,
+    'lte': lambda col, v: col <= v,
+    'in': lambda col, v: col.in_(v),
+}
+
+ScopeFn = Callable[[Query, Any], Query]
+# Runs as hook(db, obj, organization_id) after a created row is flushed and
+# before commit, e.g. to maintain rollups or reject cross-org references
+CreateHook = Callable[[Session, Any, Any], None]
+
+
 class CRUDService(Generic[ModelType, CreateSchemaType]):
-    def __init__(self, model: Type[ModelType]):
+    def __init__(self, model: Type[ModelType], scope: Optional[ScopeFn] = None, on_create: Optional[CreateHook] = None):
         self.model = model
+        self.on_create = on_create
+        self.columns = {c.key: c for c in model.__table__.columns}
+        # Models without their own organization_id pass a scope that joins to a parent that has one
+        self.scope = scope or (lambda query, organization_id: query.filter(model.organization_id == organization_id))
 
     def create(self, db: Session, obj_in: CreateSchemaType, organization_id):
-        obj = self.model(**obj_in.dict(), organization_id=organization_id)
-        db.add(obj)
-        db.commit()
+        data = obj_in.dict()
+        if 'organization_id' in self.columns:
+            data['organization_id'] = organization_id
+        obj = self.model(**data)
+        try:
+            db.add(obj)
+            if self.on_create:
+                db.flush()
+                self.on_create(db, obj, organization_id)
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(status_code=409, detail="Conflicts with an existing record")
+        except Exception:
+            db.rollback()
+            raise
+        dashboard_cache.invalidate(organization_id)
         db.refresh(obj)
         return obj
 
-    def list(self, db: Session, organization_id) -> List[ModelType]:
-        return db.query(self.model).filter(self.model.organization_id == organization_id).all()
+    def list(
+        self,
+        db: Session,
+        organization_id,
+        filters: Optional[Dict[str, str]] = None,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_LIST_LIMIT,
+    ) -> Page:
+        query = self.scope(db.query(self.model), organization_id)
+        for param, raw in (filters or {}).items():
+            query = query.filter(self._filter_clause(param, raw))
+        limit = min(max(int(limit), 1), MAX_LIST_LIMIT)
+        return paginate(query, self.sort_keys(sort), cursor=cursor, limit=limit)
+
+    def sort_keys(self, sort: Optional[str]) -> List[SortKey]:
+        """Keyset ordering for ``sort`` ("col" or "-col"), always ending with the id tiebreaker."""
+        id_col = self.model.id
+        if not sort:
+            return [SortKey(id_col)]
+        descending = sort.startswith('-')
+        name = sort.lstrip('-+')
+        col = self.columns.get(name)
+        if col is None:
+            raise HTTPException(status_code=400, detail=f"Cannot sort by '{name}'")
+        if name == 'id':
+            return [SortKey(id_col, descending=descending)]
+        return [
+            SortKey(getattr(self.model, name), descending=descending, nullable=col.nullable),
+            SortKey(id_col, descending=descending),
+        ]
+
+    def _filter_clause(self, param: str, raw: str):
+        name, _, op = param.partition('__')
+        op = op or 'eq'
+        col = self.columns.get(name)
+        if col is None or name == 'organization_id' or op not in FILTER_OPERATORS:
+            raise HTTPException(status_code=400, detail=f"Unknown filter '{param}'")
+        attr = getattr(self.model, name)
+        try:
+            if op == 'in':
+                value = [_coerce_filter(v, attr) for v in raw.split(',') if v != '']
+            elif raw.lower() == 'null' and op in ('eq', 'ne'):
+                return attr.is_(None) if op == 'eq' else attr.isnot(None)
+            else:
+                value = _coerce_filter(raw, attr)
+        except (TypeError, ValueError, InvalidOperation):
+            raise HTTPException(status_code=400, detail=f"Invalid value for filter '{param}'")
+        return FILTER_OPERATORS[op](attr, value)
+
+
+def _coerce_filter(raw: str, attr):
+    if attr.type.python_type is bool:
+        if raw.lower() in ('true', '1', 'yes'):
+            return True
+        if raw.lower() in ('false', '0', 'no'):
+            return False
+        raise ValueError(raw)
+    return coerce_value(raw, attr)
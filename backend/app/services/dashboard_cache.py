@@ -0,0 +1,107 @@
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..core.cache import TTLCache
+from ..database import SessionLocal
+from .dashboard_service import build_dashboard_summary
+
+logger = logging.getLogger(__name__)
+
+# Per-organization dashboard snapshots, served from memory. The background
+# refresher rebuilds snapshots for orgs whose screens are still polling, and
+# write paths call ``invalidate`` so changes show up without waiting for the TTL.
+_snapshots = TTLCache("dashboard_snapshots", settings.DASHBOARD_CACHE_MAX_ORGS, settings.DASHBOARD_SNAPSHOT_TTL_SECONDS)
+_lock = threading.Lock()
+_generations: Dict[str, int] = {}
+_last_requested: Dict[str, float] = {}
+_wakeup = threading.Event()
+_stop = threading.Event()
+_thread: Optional[threading.Thread] = None
+
+
+def get_snapshot(db: Session, org_id, fresh: bool = False) -> Dict[str, Any]:
+    """Return the cached snapshot for the org, building it on a miss or when ``fresh``."""
+    key = str(org_id)
+    with _lock:
+        _last_requested[key] = time.monotonic()
+    if not fresh:
+        snapshot = _snapshots.get(key)
+        if snapshot is not None:
+            return snapshot
+    return refresh(db, org_id)
+
+
+def refresh(db: Session, org_id) -> Dict[str, Any]:
+    key = str(org_id)
+    with _lock:
+        generation = _generations.get(key, 0)
+    snapshot = build_dashboard_summary(db, org_id)
+    snapshot['generated_at'] = datetime.utcnow().isoformat()
+    with _lock:
+        # Skip storing if a write invalidated the org while we were building
+        if _generations.get(key, 0) == generation:
+            _snapshots.set(key, snapshot)
+    return snapshot
+
+
+def invalidate(org_id) -> None:
+    """Drop the org's snapshot after a write to orders, jobs or transactions."""
+    if org_id is None:
+        return
+    key = str(org_id)
+    with _lock:
+        _generations[key] = _generations.get(key, 0) + 1
+        _snapshots.invalidate(key)
+    _wakeup.set()
+
+
+def stats() -> Dict[str, Any]:
+    return _snapshots.stats()
+
+
+def _watched_orgs() -> list:
+    cutoff = time.monotonic() - settings.DASHBOARD_WATCH_SECONDS
+    with _lock:
+        for key in [k for k, t in _last_requested.items() if t < cutoff]:
+            del _last_requested[key]
+        return list(_last_requested.keys())
+
+
+def _refresh_loop() -> None:
+    while not _stop.is_set():
+        # Woken early by invalidate(): rebuild only the dropped snapshots
+        invalidated_only = _wakeup.wait(settings.DASHBOARD_REFRESH_SECONDS)
+        _wakeup.clear()
+        if _stop.is_set():
+            break
+        for key in _watched_orgs():
+            if invalidated_only and key in _snapshots:
+                continue
+            db = SessionLocal()
+            try:
+                refresh(db, uuid.UUID(key))
+            except Exception as e:
+                logger.warning(f"dashboard refresh failed for org {key}: {e}")
+            finally:
+                db.close()
+
+
+def start_background_refresh() -> None:
+    global _thread
+    if settings.DASHBOARD_REFRESH_SECONDS <= 0 or (_thread is not None and _thread.is_alive()):
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_refresh_loop, name="dashboard-refresh", daemon=True)
+    _thread.start()
+
+
+def stop_background_refresh() -> None:
+    _stop.set()
+    _wakeup.set()
@@ -1,12 +1,21 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_
+from sqlalchemy import func, desc, case
 from datetime import date, timedelta
+from decimal import Decimal
 
 from .. import models
+from ..config import settings
+from ..database import SessionLocal
+from . import ledger_service, production_service
 
 
 def get_dashboard_summary(db: Session, current_user: models.User):
-    org_id = getattr(current_user, 'organization_id', None)
+    return build_dashboard_summary(db, getattr(current_user, 'organization_id', None))
+
+
+def build_dashboard_summary(db: Session, org_id):
     if not org_id:
         return {
             'total_balance': 0,
@@ -18,56 +27,40 @@ def get_dashboard_summary(db: Session, current_user: models.User):
             'todays_deliveries': [],
         }
 
+    if settings.DASHBOARD_WORKERS > 1:
+        summary = _run_sections_concurrently(org_id)
+    else:
+        summary = {}
+        for section in SECTIONS:
+            summary.update(section(db, org_id))
+    return summary
+
+
+def _to_decimal(value) -> Decimal:
+    # SQLite hands back floats for some aggregates; go through str to keep them exact
+    return value if isinstance(value, Decimal) else Decimal(str(value or 0))
+
+
+def _balance_section(db: Session, org_id):
     # Financial summary
     total_balance = (
         db.query(func.coalesce(func.sum(models.Account.current_balance), 0))
         .filter(models.Account.organization_id == org_id)
         .scalar()
     ) or 0
+    return {'total_balance': _to_decimal(total_balance)}
 
-    # Compute receivables/payables from FinancialTransaction ledger per partner
-    txs = (
-        db.query(models.FinancialTransaction)
-        .filter(models.FinancialTransaction.organization_id == org_id)
-        .all()
-    )
-    partner_balances = {}
-    for t in txs:
-        if not t.partner_id:
-            continue
-        bal = partner_balances.get(t.partner_id, 0.0)
-        amt = float(t.amount or 0)
-        method = (t.method or "").upper()
-        if method in ("ORDER", "PURCHASE"):
-            bal += amt  # sales posted increases receivable
-        else:
-            # payments: IN (received) reduce receivable; OUT (paid) also reduce receivable
-            if t.direction == models.TransactionDirection.IN:
-                bal -= amt
-            else:
-                bal -= amt
-        partner_balances[t.partner_id] = bal
-
-    # Split totals by partner type: customers' positive -> receivables, negative -> payables;
-    # suppliers' positive -> payables, negative -> receivables.
-    total_receivables = 0.0
-    total_payables = 0.0
-    if partner_balances:
-        partners = db.query(models.Partner.id, models.Partner.type).filter(models.Partner.id.in_(partner_balances.keys())).all()
-        type_map = {pid: ptype for pid, ptype in partners}
-        for pid, bal in partner_balances.items():
-            ptype = type_map.get(pid)
-            if ptype == models.PartnerType.SUPPLIER:
-                if bal > 0:
-                    total_payables += bal
-                elif bal < 0:
-                    total_receivables += -bal
-            else:  # CUSTOMER or BOTH
-                if bal > 0:
-                    total_receivables += bal
-                elif bal < 0:
-                    total_payables += -bal
 
+def _receivables_section(db: Session, org_id):
+    # Receivables/payables come from the maintained per-partner balance ledger
+    total_receivables, total_payables = ledger_service.receivables_and_payables(db, org_id)
+    return {
+        'total_receivables': total_receivables,
+        'total_payables': total_payables,
+    }
+
+
+def _recent_transactions_section(db: Session, org_id):
     # Recent transactions (last 5 by date, then id desc)
     recent = (
         db.query(models.FinancialTransaction)
@@ -81,66 +74,56 @@ def get_dashboard_summary(db: Session, current_user: models.User):
             'id': str(t.id),
             'transaction_date': t.transaction_date.isoformat() if t.transaction_date else None,
             'direction': t.direction.value if hasattr(t.direction, 'value') else t.direction,
-            'amount': float(t.amount or 0),
+            'amount': _to_decimal(t.amount),
             'description': t.description,
             'method': t.method,
             'partner_id': str(t.partner_id) if t.partner_id else None,
         }
         for t in recent
     ]
+    return {'recent_transactions': recent_transactions}
+
 
+def _job_counts_section(db: Session, org_id):
     # Operational summary
     active_jobs = (
         db.query(func.count(models.ProductionJob.id))
         .filter(models.ProductionJob.organization_id == org_id)
-        .filter(~models.ProductionJob.status.in_(["TAMAMLANDI", "COMPLETED"]))
+        .filter(production_service.is_active_job())
         .scalar()
     ) or 0
 
     rows = (
         db.query(models.ProductionJob.status, func.count(models.ProductionJob.id))
         .filter(models.ProductionJob.organization_id == org_id)
-        .filter(~models.ProductionJob.status.in_(["TAMAMLANDI", "COMPLETED"]))
+        .filter(production_service.is_active_job())
         .group_by(models.ProductionJob.status)
         .all()
     )
     jobs_by_status = {status or 'UNKNOWN': int(cnt or 0) for status, cnt in rows}
+    return {'active_jobs': int(active_jobs), 'jobs_by_status': jobs_by_status}
 
-    # Jobs by latest station (approximate current station by last completed log)
-    sub_last = (
-        db.query(
-            models.ProductionLog.job_id.label('job_id'),
-            func.max(models.ProductionLog.completed_at).label('max_dt'),
-        )
-        .group_by(models.ProductionLog.job_id)
-        .subquery()
-    )
-    latest_logs = (
-        db.query(models.ProductionLog.station_id, func.count(models.ProductionLog.id))
-        .join(sub_last, and_(
-            models.ProductionLog.job_id == sub_last.c.job_id,
-            models.ProductionLog.completed_at == sub_last.c.max_dt,
-        ))
-        .join(models.ProductionJob, models.ProductionJob.id == models.ProductionLog.job_id)
-        .filter(models.ProductionJob.organization_id == org_id)
-        .filter(~models.ProductionJob.status.in_(["TAMAMLANDI", "COMPLETED"]))
-        .group_by(models.ProductionLog.station_id)
+
+def _jobs_by_station_section(db: Session, org_id):
+    # Active jobs grouped by the station of their latest log (kept on the job)
+    job = models.ProductionJob
+    rows = (
+        db.query(models.ProductionStation.name, func.count(job.id))
+        .select_from(job)
+        .outerjoin(models.ProductionStation, models.ProductionStation.id == job.current_station_id)
+        .filter(job.organization_id == org_id)
+        .filter(production_service.is_active_job())
+        .group_by(job.current_station_id, models.ProductionStation.name)
         .all()
     )
-    station_ids_counts = {sid: int(cnt or 0) for sid, cnt in latest_logs}
-    # Map station ids to names
-    if station_ids_counts:
-        stations = db.query(models.ProductionStation).filter(models.ProductionStation.id.in_(station_ids_counts.keys())).all()
-    else:
-        stations = []
-    id_to_name = {s.id: s.name for s in stations}
-    jobs_by_station = {id_to_name.get(sid, 'UNASSIGNED'): cnt for sid, cnt in station_ids_counts.items()}
-    # Count active jobs with no logs (unassigned)
-    active_total = int(active_jobs or 0)
-    assigned_sum = sum(jobs_by_station.values()) if jobs_by_station else 0
-    if active_total > assigned_sum:
-        jobs_by_station['UNASSIGNED'] = jobs_by_station.get('UNASSIGNED', 0) + (active_total - assigned_sum)
+    jobs_by_station = {}
+    for name, cnt in rows:
+        key = name or 'UNASSIGNED'
+        jobs_by_station[key] = jobs_by_station.get(key, 0) + int(cnt or 0)
+    return {'jobs_by_station': jobs_by_station}
 
+
+def _deliveries_section(db: Session, org_id):
     # Today's deliveries
     today = date.today()
     deliveries = (
@@ -158,36 +141,64 @@ def get_dashboard_summary(db: Session, current_user: models.User):
         }
         for o, p in deliveries
     ]
+    return {'todays_deliveries': todays_deliveries}
+
 
-    # Cash flow last 7 days (payments only, exclude ORDER postings)
+def _cash_flow_section(db: Session, org_id):
+    # Cash flow last 7 days (payments only, exclude ORDER postings), netted per day in SQL
+    t = models.FinancialTransaction
     start_day = date.today() - timedelta(days=6)
-    recent_payments = (
-        db.query(models.FinancialTransaction)
-        .filter(models.FinancialTransaction.organization_id == org_id)
-        .filter(models.FinancialTransaction.transaction_date != None)
-        .filter(models.FinancialTransaction.transaction_date >= start_day)
-        .filter(func.coalesce(models.FinancialTransaction.method, '') != 'ORDER')
+    net = func.sum(case((t.direction == models.TransactionDirection.IN, t.amount), else_=-t.amount))
+    rows = (
+        db.query(t.transaction_date, func.coalesce(net, 0))
+        .filter(t.organization_id == org_id)
+        .filter(t.transaction_date >= start_day)
+        .filter(func.coalesce(t.method, '') != 'ORDER')
+        .group_by(t.transaction_date)
         .all()
     )
-    flow_map = { (start_day + timedelta(days=i)): 0.0 for i in range(7) }
-    for t in recent_payments:
-        d = t.transaction_date
-        if d in flow_map:
-            amt = float(t.amount or 0)
-            if t.direction == models.TransactionDirection.IN:
-                flow_map[d] += amt
-            else:
-                flow_map[d] -= amt
-    cash_flow_7d = [ flow_map[day] for day in sorted(flow_map.keys()) ]
+    flow_by_day = {d: _to_decimal(total) for d, total in rows}
+    cash_flow_7d = [flow_by_day.get(start_day + timedelta(days=i), Decimal("0")) for i in range(7)]
+    return {'cash_flow_7d': cash_flow_7d}
 
-    return {
-        'total_balance': float(total_balance),
-        'total_receivables': float(total_receivables),
-        'total_payables': float(total_payables),
-        'recent_transactions': recent_transactions,
-        'active_jobs': int(active_jobs),
-        'jobs_by_status': jobs_by_status,
-        'jobs_by_station': jobs_by_station,
-        'todays_deliveries': todays_deliveries,
-        'cash_flow_7d': cash_flow_7d,
-    }
+
+# Independent dashboard sections; each returns a fragment of the summary dict.
+SECTIONS = (
+    _balance_section,
+    _receivables_section,
+    _recent_transactions_section,
+    _job_counts_section,
+    _jobs_by_station_section,
+    _deliveries_section,
+    _cash_flow_section,
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.DASHBOARD_WORKERS, thread_name_prefix="dashboard")
+        return _executor
+
+
+def _run_section(section, org_id):
+    # Each worker gets its own pooled session; sessions are not thread-safe.
+    db = SessionLocal()
+    try:
+        return section(db, org_id)
+    finally:
+        db.close()
+
+
+def _run_sections_concurrently(org_id):
+    """Run every section in parallel so latency is bounded by the slowest one."""
+    executor = _get_executor()
+    futures = [executor.submit(_run_section, section, org_id) for section in SECTIONS]
+    summary = {}
+    for future in futures:
+        summary.update(future.result())
+    return summary
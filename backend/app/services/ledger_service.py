@@ -0,0 +1,205 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import DateTime, and_, case, delete, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .. import models
+
+# Transaction methods that post a document (sale or purchase) and so increase
+# the partner balance; every other method is a payment and decreases it.
+POSTING_METHODS = ("ORDER", "PURCHASE")
+
+
+def signed_amount(method: Optional[str], amount) -> Decimal:
+    amt = Decimal(str(amount or 0))
+    return amt if (method or "").upper() in POSTING_METHODS else -amt
+
+
+def signed_amount_expr():
+    """SQL counterpart of ``signed_amount`` over ``financial_transactions``."""
+    t = models.FinancialTransaction
+    return case(
+        (func.upper(func.coalesce(t.method, "")).in_(POSTING_METHODS), t.amount),
+        else_=-t.amount,
+    )
+
+
+def apply_delta(db: Session, organization_id: UUID, partner_id: Optional[UUID], delta: Decimal) -> None:
+    """Atomically add ``delta`` to the partner's balance row, creating it if needed.
+
+    Runs inside the caller's transaction so the balance commits (or rolls back)
+    together with the financial transaction that caused it.
+    """
+    if partner_id is None or not delta:
+        return
+    pb = models.PartnerBalance
+    stmt = (
+        update(pb)
+        .where(pb.partner_id == partner_id, pb.organization_id == organization_id)
+        .values(balance=pb.balance + delta, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if db.execute(stmt).rowcount:
+        return
+    try:
+        with db.begin_nested():
+            db.add(pb(partner_id=partner_id, organization_id=organization_id, balance=delta, updated_at=datetime.utcnow()))
+    except IntegrityError:
+        # Another transaction created the row first; increment it instead.
+        db.execute(stmt)
+
+
+def record_transaction(db: Session, tx: models.FinancialTransaction, previous_amount=None) -> None:
+    """Reflect a new transaction (or an amount change on an existing one) in the ledger."""
+    delta = signed_amount(tx.method, tx.amount)
+    if previous_amount is not None:
+        delta -= signed_amount(tx.method, previous_amount)
+    apply_delta(db, tx.organization_id, tx.partner_id, delta)
+
+
+def rebuild_partner_balances(db: Session, organization_id: Optional[UUID] = None) -> int:
+    """Recompute balances from the transaction history in one grouped pass.
+
+    Used to backfill existing data and to repair drift. Commits and returns the
+    number of balance rows written.
+    """
+    t = models.FinancialTransaction
+    pb = models.PartnerBalance
+    clear = delete(pb)
+    totals = (
+        select(
+            t.partner_id,
+            t.organization_id,
+            func.coalesce(func.sum(signed_amount_expr()), 0),
+            literal(datetime.utcnow(), DateTime()),
+        )
+        .where(t.partner_id.isnot(None))
+        .group_by(t.partner_id, t.organization_id)
+    )
+    if organization_id is not None:
+        clear = clear.where(pb.organization_id == organization_id)
+        totals = totals.where(t.organization_id == organization_id)
+    db.execute(clear)
+    result = db.execute(
+        insert(pb).from_select(["partner_id", "organization_id", "balance", "updated_at"], totals)
+    )
+    db.commit()
+    return result.rowcount or 0
+
+
+def account_amount_expr():
+    """Signed effect of a transaction on its cash/bank account: IN adds, OUT subtracts."""
+    t = models.FinancialTransaction
+    return case((t.direction == models.TransactionDirection.IN, t.amount), else_=-t.amount)
+
+
+def account_delta(direction, amount) -> Decimal:
+    amt = Decimal(str(amount or 0))
+    return amt if direction == models.TransactionDirection.IN else -amt
+
+
+def apply_account_delta(db: Session, account_id: Optional[UUID], delta: Decimal) -> None:
+    """Add ``delta`` to the account balance with one UPDATE, in the caller's transaction.
+
+    The increment happens in SQL, so concurrent postings to the same account
+    serialize on the row lock instead of overwriting each other.
+    """
+    if account_id is None or not delta:
+        return
+    a = models.Account
+    db.execute(
+        update(a)
+        .where(a.id == account_id)
+        .values(current_balance=func.coalesce(a.current_balance, 0) + delta)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _computed_account_balance():
+    t = models.FinancialTransaction
+    a = models.Account
+    moved = (
+        select(func.coalesce(func.sum(account_amount_expr()), 0))
+        .where(t.account_id == a.id)
+        .scalar_subquery()
+    )
+    return func.coalesce(a.opening_balance, 0) + moved
+
+
+def account_balance_drift(db: Session, organization_id: Optional[UUID] = None) -> List[Dict[str, Any]]:
+    """Accounts whose stored balance differs from opening balance plus their transactions."""
+    a = models.Account
+    t = models.FinancialTransaction
+    moved = (
+        select(t.account_id, func.sum(account_amount_expr()).label("moved"))
+        .where(t.account_id.isnot(None))
+        .group_by(t.account_id)
+        .subquery()
+    )
+    computed = func.coalesce(a.opening_balance, 0) + func.coalesce(moved.c.moved, 0)
+    stored = func.coalesce(a.current_balance, 0)
+    q = select(a.id, a.organization_id, a.name, stored, computed).outerjoin(moved, moved.c.account_id == a.id)
+    if organization_id is not None:
+        q = q.where(a.organization_id == organization_id)
+    drift = []
+    for account_id, org_id, name, stored_value, computed_value in db.execute(q.where(stored != computed)):
+        stored_value, computed_value = Decimal(str(stored_value)), Decimal(str(computed_value))
+        drift.append({
+            'account_id': account_id,
+            'organization_id': org_id,
+            'name': name,
+            'stored': stored_value,
+            'computed': computed_value,
+            'drift': stored_value - computed_value,
+        })
+    return drift
+
+
+def reconcile_account_balances(db: Session, organization_id: Optional[UUID] = None, fix: bool = False) -> List[Dict[str, Any]]:
+    """Report account balance drift and, with ``fix``, reset balances from the transactions.
+
+    Returns the drift found before fixing; commits only when fixing.
+    """
+    drift = account_balance_drift(db, organization_id)
+    if fix and drift:
+        a = models.Account
+        db.execute(
+            update(a)
+            .where(a.id.in_([d['account_id'] for d in drift]))
+            .values(current_balance=_computed_account_balance())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    return drift
+
+
+def receivables_and_payables(db: Session, organization_id: UUID) -> Tuple[Decimal, Decimal]:
+    """Split partner balances into totals with a single aggregate.
+
+    Customers' positive balances are receivables and negative ones payables;
+    for suppliers it is the other way round.
+    """
+    pb = models.PartnerBalance
+    is_supplier = models.Partner.type == models.PartnerType.SUPPLIER
+    receivable = case(
+        (and_(is_supplier, pb.balance < 0), -pb.balance),
+        (and_(~is_supplier, pb.balance > 0), pb.balance),
+        else_=0,
+    )
+    payable = case(
+        (and_(is_supplier, pb.balance > 0), pb.balance),
+        (and_(~is_supplier, pb.balance < 0), -pb.balance),
+        else_=0,
+    )
+    receivables, payables = (
+        db.query(func.coalesce(func.sum(receivable), 0), func.coalesce(func.sum(payable), 0))
+        .select_from(pb)
+        .join(models.Partner, models.Partner.id == pb.partner_id)
+        .filter(pb.organization_id == organization_id)
+        .one()
+    )
+    return Decimal(str(receivables or 0)), Decimal(str(payables or 0))
@@ -1,9 +1,12 @@
-from typing import List, Optional
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
+from .pagination import Page, SortKey, paginate
+
+MATERIAL_LIST_KEYS = (SortKey(models.Material.name), SortKey(models.Material.id))
 
 
 def create_material(db: Session, material_in: schemas.MaterialCreate, organization_id: UUID) -> models.Material:
@@ -20,15 +23,11 @@ def create_material(db: Session, material_in: schemas.MaterialCreate, organizati
     return obj
 
 
-def list_materials(db: Session, organization_id: UUID, skip: int = 0, limit: int = 100) -> List[models.Material]:
-    return (
-        db.query(models.Material)
-        .filter(models.Material.organization_id == organization_id)
-        .order_by(models.Material.name.asc())
-        .offset(int(skip))
-        .limit(int(limit))
-        .all()
-    )
+def list_materials(
+    db: Session, organization_id: UUID, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> Page:
+    query = db.query(models.Material).filter(models.Material.organization_id == organization_id)
+    return paginate(query, MATERIAL_LIST_KEYS, cursor=cursor, limit=limit, skip=skip)
 
 
 def get_material(db: Session, material_id: UUID, organization_id: UUID) -> Optional[models.Material]:
@@ -1,60 +1,106 @@
-from datetime import date
+from collections import defaultdict
+from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional, Tuple
-from uuid import UUID
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
+import sqlalchemy as sa
+from sqlalchemy import exists, func, insert, select, update
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
+from ..core import events
+from ..database import dialect_insert
+from . import dashboard_cache, ledger_service, pricing, production_service, search_service, sequence_service
+from .pagination import Page, SortKey, paginate
 
 
-def _generate_order_number(db: Session, org_id: UUID, order_date: date) -> str:
-    """Generate sequential order number like '2025-001' per organization per year."""
-    year = order_date.year
+def allocate_order_numbers(db: Session, org_id: UUID, year: int, count: int = 1) -> List[str]:
+    """Reserve ``count`` order numbers like '2025-001' from the org's yearly sequence."""
     prefix = f"{year}-"
-    last_order = (
-        db.query(models.Order)
-        .filter(
-            models.Order.organization_id == org_id,
-            models.Order.order_number.like(f"{prefix}%"),
+
+    def legacy_max() -> int:
+        # One-off scan when the year's sequence row is first created
+        rows = (
+            db.query(models.Order.order_number)
+            .filter(
+                models.Order.organization_id == org_id,
+                models.Order.order_number.like(f"{prefix}%"),
+            )
+            .all()
         )
-        .order_by(models.Order.order_number.desc())
-        .first()
+        return sequence_service.max_numeric_suffix((r[0] for r in rows), prefix)
+
+    values = sequence_service.allocate(db, org_id, sequence_service.ORDER_SEQUENCE, year, count, seed=legacy_max)
+    return [f"{prefix}{seq:03d}" for seq in values]
+
+
+def _generate_order_number(db: Session, org_id: UUID, order_date: date) -> str:
+    """Generate sequential order number like '2025-001' per organization per year."""
+    return allocate_order_numbers(db, org_id, order_date.year)[0]
+
+
+def order_item_area_expr():
+    """SQL area of one order item: explicit area_sqm, else width x height (mm) x quantity."""
+    item = models.OrderItem
+    return func.coalesce(
+        item.area_sqm,
+        (sa.cast(item.width, sa.Numeric()) / 1000)
+        * (sa.cast(item.height, sa.Numeric()) / 1000)
+        * sa.cast(func.coalesce(item.quantity, 0), sa.Numeric()),
     )
-    seq = 1
-    if last_order and last_order.order_number:
-        try:
-            seq = int(last_order.order_number.split("-")[1]) + 1
-        except Exception:
-            seq = 1
-    return f"{year}-{seq:03d}"
 
 
-def _calc_grand_total(subtotal: Decimal, *, discount_percent: Decimal | None, vat_inclusive: bool, vat_rate: Decimal = Decimal("0.20")) -> Decimal:
-    discount = Decimal("0")
-    if discount_percent is not None:
-        try:
-            discount = (subtotal * Decimal(discount_percent)) / Decimal("100")
-        except Exception:
-            discount = Decimal("0")
-    if vat_inclusive:
-        # prices already include VAT; discount applies on gross
-        return (subtotal - discount).quantize(Decimal("0.01"))
-    # prices exclude VAT; add VAT after discount
-    net = subtotal - discount
-    vat = (net * vat_rate)
-    return (net + vat).quantize(Decimal("0.01"))
+def next_item_position(db: Session, org_id: UUID, order_id: UUID) -> int:
+    """Line number for an item appended to the org's order."""
+    item = models.OrderItem
+    last = db.execute(
+        select(func.max(item.position)).where(item.order_id == order_id, item.organization_id == org_id)
+    ).scalar()
+    return (last or 0) + 1
 
 
-def create_order(
-    db: Session, order_in: schemas.OrderCreateWithItems, current_user: models.User
-) -> models.Order:
-    """Create an order with items for the current organization."""
-    ord_date = order_in.order_date or date.today()
-    order_number = _generate_order_number(db, current_user.organization_id, ord_date)
+def refresh_order_area(db: Session, org_id: UUID, order_id: UUID) -> None:
+    """Recompute ``Order.total_area_sqm`` after items of the org's order were written."""
+    total = (
+        select(func.sum(order_item_area_expr()))
+        .where(models.OrderItem.order_id == order_id)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(models.Order)
+        .where(models.Order.id == order_id, models.Order.organization_id == org_id)
+        .values(total_area_sqm=total)
+        .execution_options(synchronize_session=False)
+    )
 
-    order = models.Order(
-        organization_id=current_user.organization_id,
+
+def _price_items(items) -> Tuple[List[dict], Decimal, Decimal]:
+    """Column values for nested order items (numbered in entry order), plus the order subtotal and total area."""
+    lines = pricing.price_lines(items)
+    rows = [
+        dict(
+            product_id=item_in.product_id,
+            description=item_in.description,
+            area_sqm=getattr(item_in, "area_sqm", None),
+            width=item_in.width,
+            height=item_in.height,
+            quantity=line.quantity,
+            unit_price=line.unit_price,
+            total_price=line.total_price,
+            notes=item_in.notes,
+            position=position,
+        )
+        for position, (item_in, line) in enumerate(zip(items, lines), start=1)
+    ]
+    subtotal = sum((line.total_price for line in lines), Decimal("0"))
+    total_area = sum((line.area_sqm for line in lines), Decimal("0"))
+    return rows, subtotal, total_area
+
+
+def _order_values(order_in: schemas.OrderCreateWithItems, org_id: UUID, order_number: str, ord_date: date) -> dict:
+    return dict(
+        organization_id=org_id,
         partner_id=order_in.partner_id,
         project_name=order_in.project_name,
         order_number=order_number,
@@ -67,72 +113,152 @@ def create_order(
         discount_percent=getattr(order_in, 'discount_percent', None),
         vat_inclusive=bool(getattr(order_in, 'vat_inclusive', False)),
     )
+
+
+def _posts_receivable(status: Optional[str], partner_id) -> bool:
+    # Orders created directly as SIPARIS (confirmed) post a receivable transaction
+    return (status or "").upper() == "SIPARIS" and partner_id is not None
+
+
+def _receivable_values(org_id: UUID, order_id: UUID, partner_id: UUID, order_number: str, amount) -> dict:
+    return dict(
+        organization_id=org_id,
+        account_id=None,
+        partner_id=partner_id,
+        order_id=order_id,
+        purchase_order_id=None,
+        direction=models.TransactionDirection.IN,
+        amount=amount or 0,
+        transaction_date=date.today(),
+        description=f"Order {order_number}",
+        method="ORDER",
+    )
+
+
+def create_order(
+    db: Session, order_in: schemas.OrderCreateWithItems, current_user: models.User
+) -> models.Order:
+    """Create an order with items for the current organization."""
+    org_id = current_user.organization_id
+    ord_date = order_in.order_date or date.today()
+    order_number = _generate_order_number(db, org_id, ord_date)
+
+    order = models.Order(**_order_values(order_in, org_id, order_number, ord_date))
     try:
         db.add(order)
         db.flush()  # obtain order.id
 
-        subtotal = Decimal("0")
-        for item_in in order_in.items:
-            unit_price = Decimal(item_in.unit_price or 0)
-
-            # Support either explicit area (m^2) or width/height/quantity
-            if getattr(item_in, "area_sqm", None) is not None:
-                area_m2 = Decimal(item_in.area_sqm)
-                quantity = item_in.quantity or 1  # default 1 for area-only items
-            else:
-                width_m = Decimal(item_in.width or 0) / Decimal(1000)
-                height_m = Decimal(item_in.height or 0) / Decimal(1000)
-                quantity = item_in.quantity or 0
-                area_m2 = width_m * height_m * quantity
-
-            total_price = area_m2 * unit_price
-            subtotal += total_price
-
-            order_item = models.OrderItem(
-                organization_id=current_user.organization_id,
-                order_id=order.id,
-                product_id=item_in.product_id,
-                description=item_in.description,
-                area_sqm=getattr(item_in, "area_sqm", None),
-                width=item_in.width,
-                height=item_in.height,
-                quantity=quantity,
-                unit_price=unit_price,
-                total_price=total_price,
-                notes=item_in.notes,
-            )
-            db.add(order_item)
+        item_rows, subtotal, total_area = _price_items(order_in.items)
+        for values in item_rows:
+            db.add(models.OrderItem(organization_id=org_id, order_id=order.id, **values))
 
-        order.grand_total = _calc_grand_total(
+        order.total_area_sqm = total_area if order_in.items else None
+        order.grand_total = pricing.grand_total(
             subtotal,
             discount_percent=getattr(order, "discount_percent", None),
             vat_inclusive=bool(getattr(order, "vat_inclusive", False)),
         )
 
-        # If created directly as SIPARIS (confirmed), post receivable transaction
-        if (order.status or "").upper() == "SIPARIS" and order.partner_id is not None:
+        if _posts_receivable(order.status, order.partner_id):
             tx = models.FinancialTransaction(
-                organization_id=current_user.organization_id,
-                account_id=None,
-                partner_id=order.partner_id,
-                order_id=order.id,
-                purchase_order_id=None,
-                direction=models.TransactionDirection.IN,
-                amount=order.grand_total or 0,
-                transaction_date=date.today(),
-                description=f"Order {order.order_number}",
-                method="ORDER",
+                **_receivable_values(org_id, order.id, order.partner_id, order.order_number, order.grand_total)
             )
             db.add(tx)
+            ledger_service.record_transaction(db, tx)
 
         db.commit()
     except Exception:
         db.rollback()
         raise
+    dashboard_cache.invalidate(order.organization_id)
     db.refresh(order)
     return order
 
 
+def _existing_ids(db: Session, model, org_id: UUID, ids) -> set:
+    if not ids:
+        return set()
+    rows = db.query(model.id).filter(model.organization_id == org_id, model.id.in_(ids)).all()
+    return {r[0] for r in rows}
+
+
+def create_orders_bulk(
+    db: Session, orders_in: List[schemas.OrderCreateWithItems], current_user: models.User, atomic: bool = False
+) -> List[dict]:
+    """Validate a batch of orders up front, then insert the valid ones with executemany.
+
+    Returns one result dict per input order (same order as the input). With
+    ``atomic`` a single invalid order means nothing is inserted.
+    """
+    org_id = current_user.organization_id
+    results = [{'index': i, 'ok': False} for i in range(len(orders_in))]
+
+    # Two queries validate every partner and product reference in the batch
+    known_partners = _existing_ids(db, models.Partner, org_id, {o.partner_id for o in orders_in if o.partner_id})
+    known_products = _existing_ids(
+        db, models.Product, org_id, {it.product_id for o in orders_in for it in o.items if it.product_id}
+    )
+    valid = []
+    for i, order_in in enumerate(orders_in):
+        missing_product = next(
+            (it.product_id for it in order_in.items if it.product_id and it.product_id not in known_products), None
+        )
+        if order_in.partner_id and order_in.partner_id not in known_partners:
+            results[i]['error'] = "Partner not found"
+        elif missing_product:
+            results[i]['error'] = f"Product not found: {missing_product}"
+        else:
+            valid.append(i)
+    if not valid or (atomic and len(valid) < len(orders_in)):
+        return results
+
+    try:
+        dates = {i: orders_in[i].order_date or date.today() for i in valid}
+        by_year: Dict[int, List[int]] = defaultdict(list)
+        for i in valid:
+            by_year[dates[i].year].append(i)
+        numbers = {}
+        for year, indexes in by_year.items():
+            numbers.update(zip(indexes, allocate_order_numbers(db, org_id, year, len(indexes))))
+
+        order_rows, item_rows, tx_rows = [], [], []
+        deltas: Dict[UUID, Decimal] = defaultdict(Decimal)
+        for i in valid:
+            order_in = orders_in[i]
+            order_id = uuid4()
+            values = _order_values(order_in, org_id, numbers[i], dates[i])
+            items, subtotal, total_area = _price_items(order_in.items)
+            values.update(
+                id=order_id,
+                total_area_sqm=total_area if items else None,
+                grand_total=pricing.grand_total(
+                    subtotal, discount_percent=values['discount_percent'], vat_inclusive=values['vat_inclusive']
+                ),
+            )
+            order_rows.append(values)
+            item_rows.extend(dict(it, id=uuid4(), organization_id=org_id, order_id=order_id) for it in items)
+            if _posts_receivable(values['status'], values['partner_id']):
+                tx = _receivable_values(org_id, order_id, values['partner_id'], values['order_number'], values['grand_total'])
+                tx_rows.append(dict(tx, id=uuid4()))
+                deltas[values['partner_id']] += ledger_service.signed_amount(tx['method'], tx['amount'])
+            results[i].update(ok=True, id=order_id, order_number=values['order_number'], grand_total=values['grand_total'])
+
+        db.execute(insert(models.Order), order_rows)
+        if item_rows:
+            db.execute(insert(models.OrderItem), item_rows)
+        if tx_rows:
+            db.execute(insert(models.FinancialTransaction), tx_rows)
+        # One ledger update per partner instead of one per transaction
+        for partner_id, delta in deltas.items():
+            ledger_service.apply_delta(db, org_id, partner_id, delta)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    dashboard_cache.invalidate(org_id)
+    return results
+
+
 def update_order_pricing(
     db: Session, order_id: UUID, current_user: models.User, *, discount_percent=None, vat_inclusive=None
 ) -> Optional[models.Order]:
@@ -154,19 +280,16 @@ def update_order_pricing(
         order.vat_inclusive = bool(vat_inclusive)
         changed = True
     if changed:
-        # Recalculate grand_total based on existing items
-        subtotal = Decimal("0")
-        items = (
-            db.query(models.OrderItem)
+        # Recalculate grand_total from the stored line totals, summed in SQL
+        subtotal = (
+            db.query(func.coalesce(func.sum(models.OrderItem.total_price), 0))
             .filter(
                 models.OrderItem.order_id == order.id,
                 models.OrderItem.organization_id == current_user.organization_id,
             )
-            .all()
+            .scalar()
         )
-        for it in items:
-            subtotal += Decimal(it.total_price or 0)
-        order.grand_total = _calc_grand_total(
+        order.grand_total = pricing.grand_total(
             subtotal,
             discount_percent=getattr(order, "discount_percent", None),
             vat_inclusive=bool(getattr(order, "vat_inclusive", False)),
@@ -183,13 +306,89 @@ def update_order_pricing(
             .first()
         )
         if tx is not None:
+            previous_amount = tx.amount
             tx.amount = order.grand_total or 0
             db.add(tx)
+            ledger_service.record_transaction(db, tx, previous_amount=previous_amount)
         db.commit()
+        dashboard_cache.invalidate(order.organization_id)
         db.refresh(order)
     return order
 
 
+def spawn_production_jobs(db: Session, org_id: UUID, order_ids: List[UUID]) -> int:
+    """Create one PENDING job per item of the given orders in a single bulk insert.
+
+    Items that already have a job are skipped, and ON CONFLICT on the unique
+    order_item_id backs this up against concurrent calls, so re-sending URETIMDE
+    never duplicates jobs. Job numbers follow the items' line positions. Returns the
+    number of jobs created.
+    """
+    if not order_ids:
+        return 0
+    item, order, job = models.OrderItem, models.Order, models.ProductionJob
+    numbered = (
+        select(
+            item.id.label("item_id"),
+            item.quantity,
+            order.order_number,
+            func.row_number().over(
+                partition_by=item.order_id, order_by=(item.position.asc().nullslast(), item.id)
+            ).label("idx"),
+        )
+        .join(order, order.id == item.order_id)
+        .where(item.order_id.in_(order_ids), item.organization_id == org_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(numbered).where(~exists().where(job.order_item_id == numbered.c.item_id))
+    ).all()
+    if not rows:
+        return 0
+    versions = production_service.allocate_job_versions(db, org_id, len(rows))
+    now = datetime.utcnow()
+    values = [
+        dict(
+            id=uuid4(),
+            organization_id=org_id,
+            order_item_id=r.item_id,
+            job_number=f"{r.order_number}-{r.idx:03d}",
+            status="PENDING",
+            quantity_required=r.quantity,
+            quantity_produced=0,
+            version=version,
+            updated_at=now,
+        )
+        for r, version in zip(rows, versions)
+    ]
+    # Items a concurrent request got to first are skipped, not the whole batch
+    stmt = dialect_insert(db, job).on_conflict_do_nothing(index_elements=[job.order_item_id]).returning(job.id)
+    return len(db.execute(stmt, values).all())
+
+
+def _apply_status(db: Session, orders: List[models.Order], status: str, org_id: UUID) -> int:
+    """Move loaded orders to ``status`` with its side effects; the caller commits."""
+    for order in orders:
+        # If moving to SIPARIS, record receivable transaction in same DB tx
+        if order.status != "SIPARIS" and _posts_receivable(status, order.partner_id):
+            tx = models.FinancialTransaction(
+                **_receivable_values(org_id, order.id, order.partner_id, order.order_number, order.grand_total)
+            )
+            db.add(tx)
+            ledger_service.record_transaction(db, tx)
+        order.status = status
+        events.publish(db, org_id, "order.status", {
+            'order_id': order.id, 'order_number': order.order_number, 'status': status,
+        })
+    if status != "URETIMDE":
+        return 0
+    db.flush()
+    created = spawn_production_jobs(db, org_id, [o.id for o in orders])
+    if created:
+        events.publish(db, org_id, "jobs.created", {'count': created, 'order_ids': [o.id for o in orders]})
+    return created
+
+
 def update_order_status(
     db: Session, order_id: UUID, status: str, current_user: models.User
 ) -> Optional[models.Order]:
@@ -203,55 +402,53 @@ def update_order_status(
     )
     if not order:
         return None
-    previous_status = order.status
-    order.status = status
     try:
-        db.add(order)
-
-        if status == "URETIMDE":
-            items = (
-                db.query(models.OrderItem)
-                .filter(
-                    models.OrderItem.order_id == order.id,
-                    models.OrderItem.organization_id == current_user.organization_id,
-                )
-                .all()
-            )
-            for idx, item in enumerate(items, start=1):
-                job = models.ProductionJob(
-                    organization_id=current_user.organization_id,
-                    order_item_id=item.id,
-                    job_number=f"{order.order_number}-{idx:03d}",
-                    status="PENDING",
-                    quantity_required=item.quantity,
-                    quantity_produced=0,
-                )
-                db.add(job)
-
-        # If moving to SIPARIS, record receivable transaction in same DB tx
-        if previous_status != "SIPARIS" and status == "SIPARIS":
-            if order.partner_id is not None:
-                tx = models.FinancialTransaction(
-                    organization_id=current_user.organization_id,
-                    account_id=None,
-                    partner_id=order.partner_id,
-                    order_id=order.id,
-                    purchase_order_id=None,
-                    direction=models.TransactionDirection.IN,
-                    amount=order.grand_total or 0,
-                    transaction_date=date.today(),
-                    description=f"Order {order.order_number}",
-                    method="ORDER",
-                )
-                db.add(tx)
+        _apply_status(db, [order], status, current_user.organization_id)
         db.commit()
     except Exception:
         db.rollback()
         raise
+    dashboard_cache.invalidate(order.organization_id)
     db.refresh(order)
     return order
 
 
+def update_orders_status_bulk(
+    db: Session, order_ids: List[UUID], status: str, current_user: models.User
+) -> Tuple[List[dict], int]:
+    """Move many orders to ``status`` in one transaction.
+
+    Returns a result per requested id (unknown ids are reported, not fatal) and
+    the number of production jobs spawned.
+    """
+    org_id = current_user.organization_id
+    orders = (
+        db.query(models.Order)
+        .filter(models.Order.organization_id == org_id, models.Order.id.in_(set(order_ids)))
+        .all()
+    )
+    found = {o.id for o in orders}
+    try:
+        jobs_created = _apply_status(db, orders, status, org_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    dashboard_cache.invalidate(org_id)
+    results = [
+        {'order_id': oid, 'ok': True} if oid in found else {'order_id': oid, 'ok': False, 'error': "Order not found"}
+        for oid in order_ids
+    ]
+    return results, jobs_created
+
+
+# Newest first; id breaks ties so the cursor is stable under concurrent inserts
+ORDER_LIST_KEYS = (
+    SortKey(models.Order.order_date, descending=True, nullable=True),
+    SortKey(models.Order.id, descending=True),
+)
+
+
 def list_orders(
     db: Session,
     current_user: models.User,
@@ -260,7 +457,8 @@ def list_orders(
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-) -> List[models.Order]:
+    cursor: Optional[str] = None,
+) -> Page:
     query = db.query(models.Order).filter(
         models.Order.organization_id == current_user.organization_id
     )
@@ -269,22 +467,14 @@ def list_orders(
     if partner_id:
         query = query.filter(models.Order.partner_id == partner_id)
     if search:
-        s = f"%{search}%"
         # Filter by order_number, project_name, or partner name
         query = (
             query.outerjoin(models.Partner, models.Partner.id == models.Order.partner_id)
-            .filter(
-                (models.Order.order_number.ilike(s))
-                | (models.Order.project_name.ilike(s))
-                | (models.Partner.name.ilike(s))
-            )
+            .filter(search_service.match(
+                (models.Order.order_number, models.Order.project_name, models.Partner.name), search
+            ))
         )
-    return (
-        query.order_by(models.Order.order_date.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    return paginate(query, ORDER_LIST_KEYS, cursor=cursor, limit=limit, skip=skip)
 
 
 def get_order(
@@ -0,0 +1,116 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, false, or_
+from sqlalchemy.orm import Query
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class SortKey:
+    """One column of a keyset ordering. The last key of a sequence must be unique (usually id)."""
+
+    expr: Any
+    descending: bool = False
+    nullable: bool = False
+
+    def order_by(self):
+        clause = self.expr.desc() if self.descending else self.expr.asc()
+        # NULLs always sort last so the seek predicate below stays simple
+        return clause.nullslast() if self.nullable else clause
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    def _plain(v):
+        if isinstance(v, (date, datetime)):
+            return v.isoformat()
+        if isinstance(v, (UUID, Decimal)):
+            return str(v)
+        if hasattr(v, 'value'):  # enums
+            return v.value
+        return v
+
+    raw = json.dumps([_plain(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> List[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match ordering")
+        return [coerce_value(v, k.expr) for v, k in zip(values, keys)]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def coerce_value(value, expr):
+    """Convert a JSON/query-string value to the Python type of a column expression."""
+    if value is None:
+        return None
+    python_type = expr.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def _after(key: SortKey, value):
+    if value is None:
+        return false()
+    cmp = key.expr < value if key.descending else key.expr > value
+    return or_(cmp, key.expr.is_(None)) if key.nullable else cmp
+
+
+def _equal(key: SortKey, value):
+    return key.expr.is_(None) if value is None else key.expr == value
+
+
+def seek_predicate(keys: Sequence[SortKey], values: Sequence[Any]):
+    """Rows strictly after ``values`` in the lexicographic ordering given by ``keys``."""
+    predicate = _after(keys[-1], values[-1])
+    for key, value in zip(reversed(keys[:-1]), reversed(values[:-1])):
+        predicate = or_(_after(key, value), and_(_equal(key, value), predicate))
+    return predicate
+
+
+def paginate(query: Query, keys: Sequence[SortKey], cursor: Optional[str] = None, limit: int = 100, skip: int = 0) -> Page:
+    """Order ``query`` by ``keys`` and return one page plus an opaque cursor for the next.
+
+    Without a cursor the legacy ``skip`` offset is honoured so existing clients keep working.
+    """
+    limit = max(int(limit), 0)
+    key_columns = [k.expr.label(f"_page_key_{i}") for i, k in enumerate(keys)]
+    q = query.add_columns(*key_columns).order_by(*[k.order_by() for k in keys])
+    if cursor:
+        q = q.filter(seek_predicate(keys, decode_cursor(cursor, keys)))
+    elif skip:
+        q = q.offset(int(skip))
+    rows = q.limit(limit + 1).all()
+    n_keys = len(keys)
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if rows:
+            next_cursor = encode_cursor(rows[-1][-n_keys:])
+    items = [row[0] if len(row) == n_keys + 1 else tuple(row[:-n_keys]) for row in rows]
+    return Page(items, next_cursor)
+
+
+def set_next_cursor(response: Response, page: Page) -> None:
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
@@ -1,11 +1,14 @@
-from typing import List, Optional
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from fastapi import HTTPException
 
 from .. import models, schemas
+from . import search_service
+from .pagination import Page, SortKey, paginate
+
+PARTNER_LIST_KEYS = (SortKey(models.Partner.name), SortKey(models.Partner.id))
 
 
 def create_partner(db: Session, partner_in: schemas.PartnerCreate, current_user: models.User):
@@ -37,7 +40,8 @@ def list_partners(
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-) -> List[models.Partner]:
+    cursor: Optional[str] = None,
+) -> Page:
     """List partners for the current user's organization with optional filters."""
     query = db.query(models.Partner).filter(
         models.Partner.organization_id == current_user.organization_id
@@ -47,15 +51,10 @@ def list_partners(
     if is_active is not None:
         query = query.filter(models.Partner.is_active == is_active)
     if search:
-        like = f"%{search}%"
         query = query.filter(
-            or_(
-                models.Partner.name.ilike(like),
-                models.Partner.email.ilike(like),
-                models.Partner.phone.ilike(like),
-            )
+            search_service.match((models.Partner.name, models.Partner.email, models.Partner.phone), search)
         )
-    return query.offset(skip).limit(limit).all()
+    return paginate(query, PARTNER_LIST_KEYS, cursor=cursor, limit=limit, skip=skip)
 
 
 def update_partner(
@@ -87,6 +86,7 @@ def delete_partner(db: Session, partner_id: UUID, current_user: models.User) ->
             status_code=409,
             detail="This partner cannot be deleted because they have existing orders.",
         )
+    db.query(models.PartnerBalance).filter(models.PartnerBalance.partner_id == partner_id).delete()
     db.delete(partner)
     db.commit()
     return True
@@ -0,0 +1,101 @@
+"""Order pricing shared by create, bulk import, reprice and quote.
+
+Everything stays in Decimal; only the grand total is rounded (to cents), as
+order_service always did.
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Iterable, List, Optional
+
+VAT_RATE = Decimal("0.20")
+CENT = Decimal("0.01")
+_ZERO = Decimal("0")
+_MM_PER_M = Decimal(1000)
+
+
+def _dec(value) -> Decimal:
+    if value is None:
+        return _ZERO
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+@dataclass
+class LinePrice:
+    area_sqm: Decimal
+    quantity: int
+    unit_price: Decimal
+    total_price: Decimal
+
+
+@dataclass
+class OrderTotals:
+    subtotal: Decimal
+    discount: Decimal
+    vat: Decimal
+    grand_total: Decimal
+
+
+@dataclass
+class OrderPrice(OrderTotals):
+    total_area_sqm: Decimal = _ZERO
+    lines: List[LinePrice] = field(default_factory=list)
+
+
+def price_lines(items: Iterable) -> List[LinePrice]:
+    """Area and line total for each item, in one pass.
+
+    Items give either an explicit ``area_sqm`` (quantity defaults to 1 and does
+    not multiply the area) or ``width``/``height`` in mm times ``quantity``.
+    """
+    lines = []
+    append = lines.append
+    for item in items:
+        unit_price = _dec(item.unit_price)
+        area_sqm = getattr(item, "area_sqm", None)
+        if area_sqm is not None:
+            area = _dec(area_sqm)
+            quantity = item.quantity or 1
+        else:
+            quantity = item.quantity or 0
+            area = (_dec(item.width) / _MM_PER_M) * (_dec(item.height) / _MM_PER_M) * quantity
+        append(LinePrice(area, quantity, unit_price, area * unit_price))
+    return lines
+
+
+def order_totals(
+    subtotal, *, discount_percent=None, vat_inclusive: bool = False, vat_rate: Decimal = VAT_RATE
+) -> OrderTotals:
+    """Discount and VAT on top of an items subtotal."""
+    subtotal = _dec(subtotal)
+    discount = _ZERO
+    if discount_percent is not None:
+        try:
+            discount = subtotal * _dec(discount_percent) / Decimal("100")
+        except Exception:
+            discount = _ZERO
+    net = subtotal - discount
+    if vat_inclusive:
+        # prices already include VAT; discount applies on gross
+        grand_total = net.quantize(CENT)
+        return OrderTotals(subtotal, discount, grand_total - (grand_total / (1 + vat_rate)).quantize(CENT), grand_total)
+    # prices exclude VAT; add VAT after discount
+    vat = net * vat_rate
+    return OrderTotals(subtotal, discount, vat, (net + vat).quantize(CENT))
+
+
+def grand_total(subtotal, *, discount_percent=None, vat_inclusive: bool = False, vat_rate: Decimal = VAT_RATE) -> Decimal:
+    return order_totals(subtotal, discount_percent=discount_percent, vat_inclusive=vat_inclusive, vat_rate=vat_rate).grand_total
+
+
+def price_order(items: Iterable, *, discount_percent=None, vat_inclusive: Optional[bool] = False) -> OrderPrice:
+    lines = price_lines(items)
+    subtotal = sum((line.total_price for line in lines), _ZERO)
+    totals = order_totals(subtotal, discount_percent=discount_percent, vat_inclusive=bool(vat_inclusive))
+    return OrderPrice(
+        subtotal=totals.subtotal,
+        discount=totals.discount,
+        vat=totals.vat,
+        grand_total=totals.grand_total,
+        total_area_sqm=sum((line.area_sqm for line in lines), _ZERO),
+        lines=lines,
+    )
@@ -1,11 +1,14 @@
-from typing import List, Optional
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from fastapi import HTTPException
 
 from .. import models, schemas
+from . import search_service
+from .pagination import Page, SortKey, paginate
+
+PRODUCT_LIST_KEYS = (SortKey(models.Product.name), SortKey(models.Product.id))
 
 
 def create_product(db: Session, product_in: schemas.ProductCreate, current_user: models.User):
@@ -36,7 +39,8 @@ def list_products(
     search: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-) -> List[models.Product]:
+    cursor: Optional[str] = None,
+) -> Page:
     """List products for the current user's organization with optional filters."""
     query = db.query(models.Product).filter(
         models.Product.organization_id == current_user.organization_id
@@ -44,11 +48,8 @@ def list_products(
     if category_id:
         query = query.filter(models.Product.category_id == category_id)
     if search:
-        like = f"%{search}%"
-        query = query.filter(
-            or_(models.Product.name.ilike(like), models.Product.sku.ilike(like))
-        )
-    return query.offset(skip).limit(limit).all()
+        query = query.filter(search_service.match((models.Product.name, models.Product.sku), search))
+    return paginate(query, PRODUCT_LIST_KEYS, cursor=cursor, limit=limit, skip=skip)
 
 
 def update_product(
@@ -0,0 +1,243 @@
+"""Station throughput, cycle time, WIP and bottleneck analytics over production logs.
+
+Per-station daily figures for finished days are cached in
+``production_daily_rollups``, with a ``production_rollup_days`` row per computed
+day; today is always computed live. Log writers call ``invalidate_rollups`` so
+late-arriving (e.g. offline scanner) logs are picked up.
+"""
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, case, delete, func, select
+from sqlalchemy.orm import Session, aliased
+
+from .. import models
+from ..database import dialect_insert
+from . import production_service
+
+MAX_RANGE_DAYS = 366
+
+
+def _seconds_between(db: Session, later, earlier):
+    if db.get_bind().dialect.name == "postgresql":
+        return func.extract("epoch", later - earlier)
+    # SQLite stores timestamps as text; julianday() gives fractional days
+    return (func.julianday(later) - func.julianday(earlier)) * 86400
+
+
+def _as_date(value) -> date:
+    # func.date() comes back as text on SQLite
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _daily_station_stats(db: Session, org_id: UUID, start: date, end: date) -> List[Dict[str, Any]]:
+    """Per (station, day) log count, quantity and inbound cycle time for [start, end].
+
+    A log's cycle time is the gap since the previous log of the same job, when
+    that log was at an earlier station in the route (lower order_index). The
+    previous log may predate ``start``, so LAG runs over the full history of
+    the jobs active in the range.
+    """
+    log, job = models.ProductionLog, models.ProductionJob
+    start_dt, end_dt = datetime.combine(start, time.min), datetime.combine(end + timedelta(days=1), time.min)
+    window = dict(partition_by=log.job_id, order_by=(log.completed_at, log.id))
+    jobs_in_range = (
+        select(log.job_id)
+        .where(log.completed_at >= start_dt, log.completed_at < end_dt)
+        .distinct()
+    )
+    history = (
+        select(
+            log.station_id,
+            log.completed_at,
+            log.quantity,
+            func.lag(log.completed_at).over(**window).label("prev_at"),
+            func.lag(log.station_id).over(**window).label("prev_station_id"),
+        )
+        .join(job, job.id == log.job_id)
+        .where(job.organization_id == org_id, log.job_id.in_(jobs_in_range))
+        .subquery()
+    )
+    cur, prev = aliased(models.ProductionStation), aliased(models.ProductionStation)
+    consecutive = and_(history.c.prev_at.isnot(None), prev.order_index < cur.order_index)
+    day = func.date(history.c.completed_at)
+    rows = db.execute(
+        select(
+            history.c.station_id,
+            day.label("day"),
+            func.count(),
+            func.coalesce(func.sum(history.c.quantity), 0),
+            func.coalesce(func.sum(case((consecutive, 1), else_=0)), 0),
+            func.coalesce(
+                func.sum(case((consecutive, _seconds_between(db, history.c.completed_at, history.c.prev_at)), else_=0)), 0
+            ),
+        )
+        .join(cur, cur.id == history.c.station_id)
+        .outerjoin(prev, prev.id == history.c.prev_station_id)
+        .where(history.c.completed_at >= start_dt, history.c.completed_at < end_dt)
+        .group_by(history.c.station_id, day)
+    ).all()
+    return [
+        {
+            'station_id': station_id,
+            'day': _as_date(d),
+            'log_count': int(n or 0),
+            'quantity': int(qty or 0),
+            'cycle_count': int(cycles or 0),
+            'cycle_seconds': Decimal(str(secs or 0)),
+        }
+        for station_id, d, n, qty, cycles, secs in rows
+    ]
+
+
+def _ensure_rollups(db: Session, org_id: UUID, start: date, end: date) -> None:
+    """Compute and store rollups for finished days in [start, end] that have none yet.
+
+    The cache is written and committed on a session of its own, so reading
+    analytics never commits the caller's transaction. Rows a concurrent request
+    stored first are skipped one by one (ON CONFLICT DO NOTHING).
+    """
+    last_finished = min(end, date.today() - timedelta(days=1))
+    if last_finished < start:
+        return
+    marker = models.ProductionRollupDay
+    with Session(db.get_bind()) as cache_db:
+        have = {
+            _as_date(d)
+            for d in cache_db.execute(
+                select(marker.day).where(marker.organization_id == org_id, marker.day >= start, marker.day <= last_finished)
+            ).scalars()
+        }
+        missing = [start + timedelta(days=i) for i in range((last_finished - start).days + 1)]
+        missing = [d for d in missing if d not in have]
+        if not missing:
+            return
+        wanted = set(missing)
+        stats = [s for s in _daily_station_stats(cache_db, org_id, missing[0], missing[-1]) if s['day'] in wanted]
+        now = datetime.utcnow()
+        r = models.ProductionDailyRollup
+        if stats:
+            cache_db.execute(
+                dialect_insert(cache_db, r).on_conflict_do_nothing(index_elements=[r.organization_id, r.station_id, r.day]),
+                [dict(s, id=uuid4(), organization_id=org_id, computed_at=now) for s in stats],
+            )
+        # The marker records that the day was computed even if it had no logs
+        cache_db.execute(
+            dialect_insert(cache_db, marker).on_conflict_do_nothing(index_elements=[marker.organization_id, marker.day]),
+            [dict(organization_id=org_id, day=d, computed_at=now) for d in missing],
+        )
+        cache_db.commit()
+
+
+def invalidate_rollups(db: Session, org_id: UUID, logs: Iterable[Dict[str, Any]]) -> None:
+    """Drop the cached days that late logs (dicts with job_id and completed_at) change.
+
+    That is each log's own day, plus the days of its job's later logs, whose
+    cycle time is measured from the log before them. Other jobs' days stay cached.
+    """
+    today = datetime.combine(date.today(), time.min)
+    since: Dict[UUID, datetime] = {}
+    for entry in logs:
+        if entry['completed_at'] < today:
+            since[entry['job_id']] = min(entry['completed_at'], since.get(entry['job_id'], entry['completed_at']))
+    if not since:
+        return
+    log = models.ProductionLog
+    later = func.date(log.completed_at)
+    days = {at.date() for at in since.values()}
+    days.update(
+        _as_date(d)
+        for d in db.execute(
+            select(later)
+            .where(log.job_id.in_(list(since)), log.completed_at >= min(since.values()), log.completed_at < today)
+            .distinct()
+        ).scalars()
+    )
+    for model in (models.ProductionRollupDay, models.ProductionDailyRollup):
+        db.execute(
+            delete(model)
+            .where(model.organization_id == org_id, model.day.in_(days))
+            .execution_options(synchronize_session=False)
+        )
+
+
+def station_analytics(db: Session, org_id: UUID, start: date, end: date) -> Dict[str, Any]:
+    days = (end - start).days + 1
+    _ensure_rollups(db, org_id, start, end)
+    r = models.ProductionDailyRollup
+    totals: Dict[UUID, Dict[str, Any]] = {}
+
+    def add(station_id, log_count, quantity, cycle_count, cycle_seconds):
+        t = totals.setdefault(station_id, {'log_count': 0, 'quantity': 0, 'cycle_count': 0, 'cycle_seconds': Decimal("0")})
+        t['log_count'] += int(log_count or 0)
+        t['quantity'] += int(quantity or 0)
+        t['cycle_count'] += int(cycle_count or 0)
+        t['cycle_seconds'] += Decimal(str(cycle_seconds or 0))
+
+    cached = db.execute(
+        select(r.station_id, func.sum(r.log_count), func.sum(r.quantity), func.sum(r.cycle_count), func.sum(r.cycle_seconds))
+        .where(r.organization_id == org_id, r.day >= start, r.day <= end)
+        .group_by(r.station_id)
+    ).all()
+    for row in cached:
+        add(*row)
+    today = date.today()
+    if start <= today <= end:
+        for s in _daily_station_stats(db, org_id, today, today):
+            add(s['station_id'], s['log_count'], s['quantity'], s['cycle_count'], s['cycle_seconds'])
+
+    # Work in progress right now: active jobs by the station of their latest log
+    job = models.ProductionJob
+    wip = dict(
+        db.execute(
+            select(job.current_station_id, func.count())
+            .where(job.organization_id == org_id, job.current_station_id.isnot(None), production_service.is_active_job())
+            .group_by(job.current_station_id)
+        ).all()
+    )
+
+    stations = db.execute(
+        select(models.ProductionStation)
+        .where(models.ProductionStation.organization_id == org_id)
+        .order_by(models.ProductionStation.order_index.asc().nullslast(), models.ProductionStation.name)
+    ).scalars().all()
+    report = []
+    for st in stations:
+        t = totals.get(st.id, {'log_count': 0, 'quantity': 0, 'cycle_count': 0, 'cycle_seconds': Decimal("0")})
+        per_day = Decimal(t['quantity']) / days
+        station_wip = int(wip.get(st.id, 0))
+        report.append({
+            'station_id': st.id,
+            'name': st.name,
+            'order_index': st.order_index,
+            'log_count': t['log_count'],
+            'quantity': t['quantity'],
+            'throughput_per_day': per_day.quantize(Decimal("0.01")),
+            'avg_cycle_seconds': (t['cycle_seconds'] / t['cycle_count']).quantize(Decimal("0.1")) if t['cycle_count'] else None,
+            'cycle_count': t['cycle_count'],
+            'wip': station_wip,
+            # Little's law: how long the current queue takes to clear at the observed rate
+            'estimated_wait_days': (Decimal(station_wip) / per_day).quantize(Decimal("0.01")) if per_day else None,
+        })
+    return {
+        'start_date': start,
+        'end_date': end,
+        'days': days,
+        'stations': report,
+        'bottleneck_station_id': _bottleneck(report),
+    }
+
+
+def _bottleneck(report: List[Dict[str, Any]]) -> Optional[UUID]:
+    """Station whose queue takes longest to clear; a queue with no throughput at all ranks first."""
+    def wait(s):
+        if not s['wip']:
+            return Decimal("-1")
+        return s['estimated_wait_days'] if s['estimated_wait_days'] is not None else Decimal("Infinity")
+
+    candidates = [s for s in report if s['wip']]
+    if not candidates:
+        return None
+    return max(candidates, key=wait)['station_id']
@@ -0,0 +1,279 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, bindparam, case, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core import events
+from . import production_analytics, sequence_service
+
+COMPLETED_STATUSES = models.COMPLETED_JOB_STATUSES
+# Status set when logged output reaches quantity_required
+JOB_COMPLETED_STATUS = "TAMAMLANDI"
+
+# Org-wide change counter for production jobs. Every job write takes the next
+# value, so "everything after version N" is an indexed range scan. The counter
+# row is locked until the writing transaction commits, so versions become
+# visible in order and a reader never skips past an uncommitted change.
+JOB_VERSION_SEQUENCE = "production_job_version"
+
+
+def is_active_job():
+    """Filter for jobs not yet completed. The statuses are rendered inline so the
+    planner can match the partial index ix_production_jobs_active_station."""
+    return models.ProductionJob.status.not_in(
+        bindparam("completed_statuses", list(COMPLETED_STATUSES), expanding=True, literal_execute=True)
+    )
+
+
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """``value`` as naive UTC, the form log and job timestamps are stored and compared in."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def allocate_job_versions(db: Session, org_id: UUID, count: int = 1) -> range:
+    return sequence_service.allocate(db, org_id, JOB_VERSION_SEQUENCE, count=count)
+
+
+def touch_job(db: Session, job: models.ProductionJob) -> None:
+    """Stamp a changed job with a new version; call before committing the change."""
+    job.version = allocate_job_versions(db, job.organization_id)[0]
+    job.updated_at = datetime.utcnow()
+
+
+def current_job_version(db: Session, org_id: UUID) -> int:
+    seq = models.NumberSequence
+    value = (
+        db.query(seq.last_value)
+        .filter(seq.organization_id == org_id, seq.name == JOB_VERSION_SEQUENCE, seq.period == 0)
+        .scalar()
+    )
+    return value or 0
+
+
+def board_query(db: Session, org_id: UUID):
+    """Jobs joined with the order, partner, product and item details the board shows."""
+    return (
+        db.query(
+            models.ProductionJob,
+            models.Order,
+            models.Partner,
+            models.Product,
+            models.OrderItem,
+        )
+        .join(models.OrderItem, models.ProductionJob.order_item_id == models.OrderItem.id)
+        .join(models.Order, models.OrderItem.order_id == models.Order.id)
+        .outerjoin(models.Partner, models.Order.partner_id == models.Partner.id)
+        .outerjoin(models.Product, models.OrderItem.product_id == models.Product.id)
+        .filter(models.ProductionJob.organization_id == org_id)
+    )
+
+
+def list_active_jobs(db: Session, org_id: UUID, since: Optional[int] = None) -> Tuple[List[tuple], int]:
+    """Board rows plus the board version they are current as of.
+
+    Without ``since`` this is every active job. With ``since`` it is only jobs
+    changed after that version, completed ones included so clients can drop them.
+    """
+    # Read the version first: a change committed while the rows are read is
+    # then delivered again next poll rather than missed.
+    version = current_job_version(db, org_id)
+    q = board_query(db, org_id)
+    if since is None:
+        q = q.filter(is_active_job())
+    else:
+        q = q.filter(models.ProductionJob.version > since).order_by(models.ProductionJob.version)
+    return q.all(), version
+
+
+def get_board_jobs(db: Session, org_id: UUID, job_ids: List[UUID]) -> List[tuple]:
+    return board_query(db, org_id).filter(models.ProductionJob.id.in_(job_ids)).all()
+
+
+def set_jobs_status(db: Session, org_id: UUID, job_ids: List[UUID], status: str) -> List[UUID]:
+    """Set ``status`` on the org's jobs with one UPDATE ... RETURNING; the caller commits.
+
+    The whole batch shares one new version, allocated only once some job was
+    actually updated, so a batch of unknown ids leaves the board version alone.
+    Returns the ids that were updated; ids of unknown or other-org jobs are left out.
+    """
+    if not job_ids:
+        return []
+    job = models.ProductionJob
+    updated = db.execute(
+        update(job)
+        .where(job.organization_id == org_id, job.id.in_(set(job_ids)))
+        .values(status=status, updated_at=datetime.utcnow())
+        .returning(job.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+    if not updated:
+        return []
+    version = allocate_job_versions(db, org_id)[0]
+    # The rows are locked by the UPDATE above until the caller commits
+    db.execute(
+        update(job)
+        .where(job.id.in_(updated))
+        .values(version=version)
+        .execution_options(synchronize_session=False)
+    )
+    for job_id in updated:
+        events.publish(db, org_id, "job.status", {'job_id': job_id, 'status': status, 'version': version})
+    return updated
+
+
+def final_station_ids(db: Session, org_id: UUID) -> Optional[set]:
+    """Stations at the end of the org's route (highest order_index).
+
+    None when no station has an order_index, i.e. there is no route and every
+    station counts as final.
+    """
+    st = models.ProductionStation
+    last = select(func.max(st.order_index)).where(st.organization_id == org_id).scalar_subquery()
+    ids = set(db.execute(select(st.id).where(st.organization_id == org_id, st.order_index == last)).scalars())
+    return ids or None
+
+
+def apply_logs(db: Session, org_id: UUID, logs: List[Dict[str, Any]]) -> List[UUID]:
+    """Roll inserted logs (dicts with job_id, station_id, completed_at, quantity) up onto their jobs.
+
+    One executemany UPDATE, one row per job. It atomically adds the quantity
+    logged at the final station of the route to quantity_produced (earlier
+    stations only move the job along) and completes jobs that reach quantity_required.
+    It also moves each job to the station of its latest log unless the job
+    already holds a later one, and drops cached analytics rollups the logs
+    change. Runs in the caller's transaction. Returns the ids of jobs
+    completed by these logs.
+    """
+    finals = final_station_ids(db, org_id) if logs else None
+    per_job: Dict[UUID, Dict[str, Any]] = {}
+    for log in logs:
+        agg = per_job.setdefault(log['job_id'], {'b_id': log['job_id'], 'b_qty': 0, 'b_at': None, 'b_station': None})
+        if finals is None or log['station_id'] in finals:
+            agg['b_qty'] += log.get('quantity') or 0
+        if agg['b_at'] is None or log['completed_at'] >= agg['b_at']:
+            agg['b_at'], agg['b_station'] = log['completed_at'], log['station_id']
+    if not per_job:
+        return []
+
+    t = models.ProductionJob.__table__
+    job_ids = list(per_job)
+    was_completed = set(
+        db.execute(select(t.c.id).where(t.c.id.in_(job_ids), t.c.status.in_(COMPLETED_STATUSES))).scalars()
+    )
+    b_qty = bindparam('b_qty', type_=t.c.quantity_produced.type)
+    b_at = bindparam('b_at', type_=t.c.last_log_at.type)
+    b_station = bindparam('b_station', type_=t.c.current_station_id.type)
+    produced = func.coalesce(t.c.quantity_produced, 0) + b_qty
+    is_newer = or_(t.c.last_log_at.is_(None), t.c.last_log_at <= b_at)
+    reaches_required = and_(
+        t.c.quantity_required > 0, produced >= t.c.quantity_required, ~t.c.status.in_(COMPLETED_STATUSES)
+    )
+    version = allocate_job_versions(db, org_id)[0]
+    # Core table update so the session runs a plain executemany
+    db.execute(
+        update(t)
+        .where(t.c.id == bindparam('b_id'), t.c.organization_id == org_id)
+        .values(
+            quantity_produced=produced,
+            status=case((reaches_required, JOB_COMPLETED_STATUS), else_=t.c.status),
+            current_station_id=case((is_newer, b_station), else_=t.c.current_station_id),
+            last_log_at=case((is_newer, b_at), else_=t.c.last_log_at),
+            version=version,
+            updated_at=datetime.utcnow(),
+        ),
+        list(per_job.values()),
+    )
+    production_analytics.invalidate_rollups(db, org_id, logs)
+    completed = [
+        job_id
+        for job_id in db.execute(select(t.c.id).where(t.c.id.in_(job_ids), t.c.status == JOB_COMPLETED_STATUS)).scalars()
+        if job_id not in was_completed
+    ]
+    for job_id in completed:
+        events.publish(db, org_id, "job.status", {'job_id': job_id, 'status': JOB_COMPLETED_STATUS, 'version': version})
+    return completed
+
+
+def ingest_logs(db: Session, org_id: UUID, user_id: UUID, entries: List[Any]) -> Dict[str, Any]:
+    """Validate a batch of station logs, bulk insert the valid ones and roll them up; commits.
+
+    Entries referring to jobs or stations of another org (or none) are rejected
+    individually; the rest are written in one transaction.
+    """
+    job_ids = {e.job_id for e in entries}
+    station_ids = {e.station_id for e in entries}
+    known_jobs = set(
+        db.execute(select(models.ProductionJob.id).where(
+            models.ProductionJob.organization_id == org_id, models.ProductionJob.id.in_(job_ids)
+        )).scalars()
+    )
+    known_stations = set(
+        db.execute(select(models.ProductionStation.id).where(
+            models.ProductionStation.organization_id == org_id, models.ProductionStation.id.in_(station_ids)
+        )).scalars()
+    )
+    now = datetime.utcnow()
+    rows, rejected = [], []
+    for index, entry in enumerate(entries):
+        if entry.job_id not in known_jobs:
+            rejected.append({'index': index, 'error': "Job not found"})
+        elif entry.station_id not in known_stations:
+            rejected.append({'index': index, 'error': "Station not found"})
+        else:
+            rows.append(dict(
+                id=uuid4(),
+                job_id=entry.job_id,
+                station_id=entry.station_id,
+                user_id=user_id,
+                completed_at=entry.completed_at or now,
+                quantity=entry.quantity,
+                notes=entry.notes,
+            ))
+    completed: List[UUID] = []
+    if rows:
+        try:
+            db.execute(insert(models.ProductionLog), rows)
+            completed = apply_logs(db, org_id, rows)
+            events.publish(db, org_id, "production_logs.created", {
+                'count': len(rows), 'job_ids': list(dict.fromkeys(r['job_id'] for r in rows)),
+            })
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    return {'accepted': len(rows), 'rejected': rejected, 'completed_job_ids': completed}
+
+
+def rebuild_job_stations(db: Session, org_id: Optional[UUID] = None) -> int:
+    """Recompute current_station_id/last_log_at for every job from its logs; commits."""
+    job, log = models.ProductionJob, models.ProductionLog
+    latest = (
+        select(log.station_id)
+        .where(log.job_id == job.id)
+        .order_by(log.completed_at.desc().nullslast(), log.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    last_at = select(func.max(log.completed_at)).where(log.job_id == job.id).scalar_subquery()
+    stmt = update(job).values(current_station_id=latest, last_log_at=last_at)
+    if org_id is not None:
+        stmt = stmt.where(job.organization_id == org_id)
+    count = db.execute(stmt.execution_options(synchronize_session=False)).rowcount
+    db.commit()
+    return count
+
+
+def station_queue(db: Session, org_id: UUID, station_id: UUID) -> List[tuple]:
+    """Active jobs currently at the station, longest waiting first."""
+    return (
+        board_query(db, org_id)
+        .filter(models.ProductionJob.current_station_id == station_id)
+        .filter(is_active_job())
+        .order_by(models.ProductionJob.last_log_at.asc().nullsfirst(), models.ProductionJob.id)
+        .all()
+    )
@@ -0,0 +1,95 @@
+"""Text search for orders, partners, products and categories.
+
+Columns are compared through the SQL function ``tr_fold`` (see core.textfold),
+so matching ignores case and Turkish diacritics. On PostgreSQL tr_fold is an
+IMMUTABLE SQL function and each searched column has a pg_trgm GIN index on
+``tr_fold(column)``, so ``LIKE '%term%'`` is an index scan for terms of three
+or more characters. On SQLite the same function is registered from Python
+when a connection opens (see database.py).
+"""
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import and_, case, func, literal, or_, true
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.textfold import tr_fold
+
+# Extra words in a query only narrow the result; cap them to keep the SQL small
+MAX_TERMS = 5
+MAX_RESULTS = 50
+
+
+def terms(q: str) -> List[str]:
+    return [tr_fold(t) for t in (q or "").split()][:MAX_TERMS]
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def match(columns: Sequence[Any], q: str):
+    """Every word of ``q`` occurs in at least one of ``columns``."""
+    words = terms(q)
+    if not words:
+        return true()
+    return and_(*[
+        or_(*[func.tr_fold(c).like(f"%{_escape_like(term)}%", escape="\\") for c in columns])
+        for term in words
+    ])
+
+
+def rank(columns: Sequence[Any], q: str):
+    """Relevance for ordering: exact match beats prefix, which beats a word
+    starting with the query, which beats a plain substring."""
+    folded_q = " ".join(terms(q))
+    phrase = _escape_like(folded_q)
+    scores = []
+    for c in columns:
+        folded = func.tr_fold(c)
+        scores.append(case(
+            (folded == folded_q, 3),
+            (folded.like(f"{phrase}%", escape="\\"), 2),
+            ((literal(" ") + folded).like(f"% {phrase}%", escape="\\"), 1),
+            else_=0,
+        ))
+    return sum(scores[1:], scores[0])
+
+
+def search_partners(db: Session, org_id, q: str, limit: int = 10) -> List[models.Partner]:
+    p = models.Partner
+    return (
+        db.query(p)
+        .filter(p.organization_id == org_id, match((p.name, p.email, p.phone), q))
+        .order_by(rank((p.name,), q).desc(), p.name, p.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def search_products(db: Session, org_id, q: str, limit: int = 10) -> List[models.Product]:
+    p = models.Product
+    return (
+        db.query(p)
+        .filter(p.organization_id == org_id, match((p.name, p.sku), q))
+        .order_by(rank((p.sku, p.name), q).desc(), p.name, p.id)
+        .limit(limit)
+        .all()
+    )
+
+
+def search_orders(db: Session, org_id, q: str, limit: int = 10) -> List[models.Order]:
+    o = models.Order
+    return (
+        db.query(o)
+        .outerjoin(models.Partner, models.Partner.id == o.partner_id)
+        .filter(o.organization_id == org_id, match((o.order_number, o.project_name, models.Partner.name), q))
+        .order_by(rank((o.order_number, o.project_name), q).desc(), o.order_date.desc().nullslast(), o.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def search_all(db: Session, org_id, q: str, limit: int = 10, *, include: Sequence[str] = ("orders", "partners", "products")) -> Dict[str, list]:
+    searches = {'orders': search_orders, 'partners': search_partners, 'products': search_products}
+    return {name: (fn(db, org_id, q, limit) if name in include else []) for name, fn in searches.items()}
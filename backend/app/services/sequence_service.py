@@ -0,0 +1,66 @@
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .. import models
+
+ORDER_SEQUENCE = "order"
+PURCHASE_ORDER_SEQUENCE = "purchase_order"
+
+
+def allocate(
+    db: Session,
+    organization_id: UUID,
+    name: str,
+    period: int = 0,
+    count: int = 1,
+    seed: Optional[Callable[[], int]] = None,
+) -> range:
+    """Reserve ``count`` consecutive values of the (org, name, period) sequence.
+
+    A single UPDATE ... RETURNING on the counter row, so the cost does not grow
+    with the number of documents and concurrent callers never see the same
+    value. The row is created on first use, starting after ``seed()`` so numbers
+    issued before the sequence existed are not handed out again. Runs in the
+    caller's transaction: a rollback returns the block.
+    """
+    if count < 1:
+        raise ValueError("count must be positive")
+    seq = models.NumberSequence
+    stmt = (
+        update(seq)
+        .where(seq.organization_id == organization_id, seq.name == name, seq.period == period)
+        .values(last_value=seq.last_value + count)
+        .returning(seq.last_value)
+        .execution_options(synchronize_session=False)
+    )
+    last = db.execute(stmt).scalar()
+    if last is None:
+        start = seed() if seed else 0
+        try:
+            with db.begin_nested():
+                db.add(seq(organization_id=organization_id, name=name, period=period, last_value=start + count))
+            last = start + count
+        except IntegrityError:
+            # Another transaction created the row first; take the next block from it
+            last = db.execute(stmt).scalar()
+    return range(last - count + 1, last + 1)
+
+
+def next_value(db: Session, organization_id: UUID, name: str, period: int = 0, seed: Optional[Callable[[], int]] = None) -> int:
+    return allocate(db, organization_id, name, period, 1, seed)[0]
+
+
+def max_numeric_suffix(numbers: Iterable[Optional[str]], prefix: str) -> int:
+    """Largest integer following ``prefix`` among legacy document numbers (0 if none)."""
+    best = 0
+    for number in numbers:
+        if number and number.startswith(prefix):
+            try:
+                best = max(best, int(number[len(prefix):]))
+            except ValueError:
+                continue
+    return best
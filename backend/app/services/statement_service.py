@@ -0,0 +1,96 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from .. import models
+from .ledger_service import POSTING_METHODS, signed_amount_expr
+
+# Rows pulled from the cursor per round trip while streaming a statement
+STREAM_BATCH_SIZE = 500
+
+
+def _partner_filter(query, org_id: UUID, partner_id: UUID, start_date: Optional[date], end_date: Optional[date]):
+    t = models.FinancialTransaction
+    query = query.filter(t.organization_id == org_id, t.partner_id == partner_id)
+    if start_date is not None:
+        query = query.filter(t.transaction_date >= start_date)
+    if end_date is not None:
+        query = query.filter(t.transaction_date <= end_date)
+    return query
+
+
+def opening_balance(db: Session, org_id: UUID, partner_id: UUID, start_date: Optional[date]) -> Decimal:
+    """Balance carried into the statement period from transactions dated before ``start_date``."""
+    if start_date is None:
+        return Decimal("0")
+    t = models.FinancialTransaction
+    total = (
+        db.query(func.coalesce(func.sum(signed_amount_expr()), 0))
+        .filter(t.organization_id == org_id, t.partner_id == partner_id, t.transaction_date < start_date)
+        .scalar()
+    )
+    return Decimal(str(total or 0))
+
+
+def statement_summary(
+    db: Session, org_id: UUID, partner_id: UUID, start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> Dict[str, Decimal]:
+    """Incoming/outgoing payments and balance for the period, in one aggregate query."""
+    t = models.FinancialTransaction
+    is_posting = func.upper(func.coalesce(t.method, "")).in_(POSTING_METHODS)
+    postings, incoming, outgoing = _partner_filter(
+        db.query(
+            func.coalesce(func.sum(case((is_posting, t.amount), else_=0)), 0),
+            func.coalesce(func.sum(case((~is_posting & (t.direction == models.TransactionDirection.IN), t.amount), else_=0)), 0),
+            func.coalesce(func.sum(case((~is_posting & (t.direction == models.TransactionDirection.OUT), t.amount), else_=0)), 0),
+        ),
+        org_id, partner_id, start_date, end_date,
+    ).one()
+    postings, incoming, outgoing = (Decimal(str(v or 0)) for v in (postings, incoming, outgoing))
+    return {'incoming': incoming, 'outgoing': outgoing, 'balance': postings - incoming - outgoing}
+
+
+def iter_statement_rows(
+    db: Session, org_id: UUID, partner_id: UUID, start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield statement rows oldest first, each carrying the running balance computed in SQL."""
+    t = models.FinancialTransaction
+    running = func.sum(signed_amount_expr()).over(
+        order_by=(t.transaction_date.asc().nullsfirst(), t.id.asc())
+    )
+    q = (
+        db.query(
+            t.id,
+            t.transaction_date,
+            t.direction,
+            t.amount,
+            t.description,
+            t.method,
+            func.coalesce(models.Order.project_name, models.Order.order_number, models.PurchaseOrder.po_number),
+            models.Order.total_area_sqm,
+            running,
+        )
+        .outerjoin(models.Order, models.Order.id == t.order_id)
+        .outerjoin(models.PurchaseOrder, models.PurchaseOrder.id == t.purchase_order_id)
+    )
+    q = _partner_filter(q, org_id, partner_id, start_date, end_date)
+    q = q.order_by(t.transaction_date.asc().nullsfirst(), t.id.asc())
+    opening = opening_balance(db, org_id, partner_id, start_date)
+    for tx_id, tx_date, direction, amount, description, method, doc_name, area, balance in (
+        q.execution_options(stream_results=True).yield_per(STREAM_BATCH_SIZE)
+    ):
+        yield {
+            'id': tx_id,
+            'transaction_date': tx_date,
+            'direction': direction,
+            'amount': amount,
+            'description': description,
+            'document_name': doc_name,
+            'method': method,
+            'area_sqm': area,
+            'running_balance': opening + Decimal(str(balance or 0)),
+        }
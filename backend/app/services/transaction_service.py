@@ -0,0 +1,216 @@
+import csv
+import io
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import case, func, insert, or_
+from sqlalchemy.orm import Query, Session
+
+from .. import models, schemas
+from . import dashboard_cache, ledger_service
+from .order_service import _existing_ids
+from .pagination import Page, SortKey, paginate
+
+MAX_IMPORT_ROWS = 5000
+CSV_DELIMITERS = ",;\t"
+
+# Newest first; matches ix_financial_transactions_org_date (see models._newest_first_index)
+LEDGER_LIST_KEYS = (
+    SortKey(models.FinancialTransaction.transaction_date, descending=True, nullable=True),
+    SortKey(models.FinancialTransaction.id, descending=True),
+)
+
+DuplicateKey = Tuple[Optional[date], str, Optional[UUID], Decimal, str]
+
+
+def parse_csv(text: str) -> List[Dict[str, Any]]:
+    """Rows of a CSV with a header of FinancialTransactionCreate field names.
+
+    The delimiter (comma, semicolon or tab, as bank exports vary) is sniffed
+    from the header line; empty cells become None.
+    """
+    text = text.lstrip("﻿")
+    try:
+        dialect = csv.Sniffer().sniff(text.split("\n", 1)[0], delimiters=CSV_DELIMITERS)
+    except csv.Error:
+        dialect = csv.excel
+    return [
+        {k.strip(): (v.strip() or None) if isinstance(v, str) else v for k, v in row.items() if k}
+        for row in csv.DictReader(io.StringIO(text), dialect=dialect)
+    ]
+
+
+def _duplicate_key(tx_date: Optional[date], direction, account_id: Optional[UUID], amount, description: Optional[str]) -> DuplicateKey:
+    # normalize() so 100, 100.0 and 100.00 compare equal
+    return (
+        tx_date,
+        getattr(direction, 'value', direction),
+        account_id,
+        Decimal(str(amount or 0)).normalize(),
+        (description or "").strip().casefold(),
+    )
+
+
+def _existing_keys(db: Session, org_id: UUID, dates: set) -> set:
+    t = models.FinancialTransaction
+    q = db.query(t.transaction_date, t.direction, t.account_id, t.amount, t.description).filter(t.organization_id == org_id)
+    dated = {d for d in dates if d is not None}
+    if None in dates:
+        q = q.filter((t.transaction_date.in_(dated)) | (t.transaction_date.is_(None)))
+    else:
+        q = q.filter(t.transaction_date.in_(dated))
+    return {_duplicate_key(*row) for row in q.all()}
+
+
+def import_transactions(
+    db: Session, org_id: UUID, rows: List[Dict[str, Any]], *, atomic: bool = False, skip_duplicates: bool = True
+) -> List[Dict[str, Any]]:
+    """Validate and insert a batch of transactions with executemany; commits.
+
+    Account and partner references are checked against two preloaded id sets.
+    A row whose (date, direction, account, amount, description) matches an
+    existing transaction or an earlier row of the batch is flagged as a
+    duplicate and, with ``skip_duplicates``, not imported. Account and partner balances get one net
+    update each. Returns one result dict per row; with ``atomic`` any invalid
+    row means nothing is inserted.
+    """
+    results: List[Dict[str, Any]] = [{'index': i, 'ok': False, 'duplicate': False} for i in range(len(rows))]
+    parsed: Dict[int, schemas.FinancialTransactionCreate] = {}
+    for i, row in enumerate(rows):
+        try:
+            parsed[i] = schemas.FinancialTransactionCreate.model_validate(row)
+        except ValidationError as e:
+            err = e.errors()[0]
+            results[i]['error'] = f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+
+    known_accounts = _existing_ids(db, models.Account, org_id, {tx.account_id for tx in parsed.values() if tx.account_id})
+    known_partners = _existing_ids(db, models.Partner, org_id, {tx.partner_id for tx in parsed.values() if tx.partner_id})
+    seen = _existing_keys(db, org_id, {tx.transaction_date for tx in parsed.values()})
+    valid = []
+    for i, tx in parsed.items():
+        if tx.account_id and tx.account_id not in known_accounts:
+            results[i]['error'] = "Account not found"
+            continue
+        if tx.partner_id and tx.partner_id not in known_partners:
+            results[i]['error'] = "Partner not found"
+            continue
+        key = _duplicate_key(tx.transaction_date, tx.direction, tx.account_id, tx.amount, tx.description)
+        if key in seen:
+            results[i]['duplicate'] = True
+            if skip_duplicates:
+                results[i]['error'] = "Duplicate transaction"
+                continue
+        seen.add(key)
+        valid.append(i)
+    failed = any(r.get('error') and not r['duplicate'] for r in results)
+    if not valid or (atomic and failed):
+        return results
+
+    tx_rows = []
+    account_deltas: Dict[UUID, Decimal] = defaultdict(Decimal)
+    partner_deltas: Dict[UUID, Decimal] = defaultdict(Decimal)
+    for i in valid:
+        tx = parsed[i]
+        values = tx.dict(exclude={'order_id', 'purchase_order_id'})
+        values.update(id=uuid4(), organization_id=org_id, order_id=None, purchase_order_id=None)
+        tx_rows.append(values)
+        if tx.account_id:
+            account_deltas[tx.account_id] += ledger_service.account_delta(tx.direction, tx.amount)
+        if tx.partner_id:
+            partner_deltas[tx.partner_id] += ledger_service.signed_amount(tx.method, tx.amount)
+        results[i].update(ok=True, id=values['id'])
+    try:
+        db.execute(insert(models.FinancialTransaction), tx_rows)
+        for account_id, delta in account_deltas.items():
+            ledger_service.apply_account_delta(db, account_id, delta)
+        for partner_id, delta in partner_deltas.items():
+            ledger_service.apply_delta(db, org_id, partner_id, delta)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    dashboard_cache.invalidate(org_id)
+    return results
+
+
+def ledger_query(
+    db: Session,
+    org_id: UUID,
+    *,
+    partner_id: Optional[UUID] = None,
+    account_id: Optional[UUID] = None,
+    order_id: Optional[UUID] = None,
+    purchase_order_id: Optional[UUID] = None,
+    direction: Optional[models.TransactionDirection] = None,
+    method: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    min_amount: Optional[Decimal] = None,
+    max_amount: Optional[Decimal] = None,
+    search: Optional[str] = None,
+) -> Query:
+    """The org's transactions narrowed by the ledger filters (all optional, ANDed)."""
+    t = models.FinancialTransaction
+    q = db.query(t).filter(t.organization_id == org_id)
+    for column, value in (
+        (t.partner_id, partner_id),
+        (t.account_id, account_id),
+        (t.order_id, order_id),
+        (t.purchase_order_id, purchase_order_id),
+        (t.direction, direction),
+    ):
+        if value is not None:
+            q = q.filter(column == value)
+    if method:
+        q = q.filter(func.upper(t.method) == method.upper())
+    if start_date is not None:
+        q = q.filter(t.transaction_date >= start_date)
+    if end_date is not None:
+        q = q.filter(t.transaction_date <= end_date)
+    if min_amount is not None:
+        q = q.filter(t.amount >= min_amount)
+    if max_amount is not None:
+        q = q.filter(t.amount <= max_amount)
+    if search:
+        like = f"%{search}%"
+        q = q.filter(or_(t.description.ilike(like), t.method.ilike(like)))
+    return q
+
+
+_EMPTY_TOTALS = {'count': 0, 'incoming': Decimal("0"), 'outgoing': Decimal("0"), 'net': Decimal("0")}
+
+
+def ledger_totals(query: Query) -> Dict[str, Any]:
+    """Row count and IN/OUT sums of ``query`` in one aggregate."""
+    t = models.FinancialTransaction
+    is_in = t.direction == models.TransactionDirection.IN
+    count, incoming, outgoing = query.with_entities(
+        func.count(t.id),
+        func.coalesce(func.sum(case((is_in, t.amount), else_=0)), 0),
+        func.coalesce(func.sum(case((~is_in, t.amount), else_=0)), 0),
+    ).order_by(None).one()
+    incoming, outgoing = Decimal(str(incoming or 0)), Decimal(str(outgoing or 0))
+    return {'count': count or 0, 'incoming': incoming, 'outgoing': outgoing, 'net': incoming - outgoing}
+
+
+def list_transactions(db: Session, org_id: UUID, *, cursor: Optional[str] = None, limit: int = 100, **filters) -> Page:
+    return paginate(ledger_query(db, org_id, **filters), LEDGER_LIST_KEYS, cursor=cursor, limit=limit)
+
+
+def ledger_page(db: Session, org_id: UUID, *, cursor: Optional[str] = None, limit: int = 100, **filters) -> Dict[str, Any]:
+    """One keyset page plus totals for the page and for the whole filtered set."""
+    query = ledger_query(db, org_id, **filters)
+    page = paginate(query, LEDGER_LIST_KEYS, cursor=cursor, limit=limit)
+    t = models.FinancialTransaction
+    page_ids = [tx.id for tx in page.items]
+    page_totals = ledger_totals(db.query(t).filter(t.id.in_(page_ids))) if page_ids else _EMPTY_TOTALS
+    return {
+        'items': page.items,
+        'next_cursor': page.next_cursor,
+        'page_totals': page_totals,
+        'totals': ledger_totals(query),
+    }
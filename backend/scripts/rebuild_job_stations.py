@@ -0,0 +1,33 @@
+"""Recompute each production job's current station and last log time from its logs.
+
+Usage: python scripts/rebuild_job_stations.py [ORG_SLUG]
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app import models  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.services.production_service import rebuild_job_stations  # noqa: E402
+
+
+def main() -> int:
+    db = SessionLocal()
+    try:
+        org_id = None
+        if len(sys.argv) > 1:
+            org = db.query(models.Organization).filter_by(slug=sys.argv[1]).first()
+            if not org:
+                print(f"Organization not found: {sys.argv[1]}")
+                return 1
+            org_id = org.id
+        count = rebuild_job_stations(db, org_id)
+        print(f"Rebuilt stations for {count} jobs")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""Rebuild the partner balance ledger from financial transactions.
+
+Usage: python scripts/rebuild_partner_balances.py [ORG_SLUG]
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app import models  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.services.ledger_service import rebuild_partner_balances  # noqa: E402
+
+
+def main() -> int:
+    db = SessionLocal()
+    try:
+        org_id = None
+        if len(sys.argv) > 1:
+            org = db.query(models.Organization).filter_by(slug=sys.argv[1]).first()
+            if not org:
+                print(f"Organization not found: {sys.argv[1]}")
+                return 1
+            org_id = org.id
+        count = rebuild_partner_balances(db, org_id)
+        print(f"Rebuilt {count} partner balances")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""Compare account balances with their transactions and report drift.
+
+Usage: python scripts/reconcile_account_balances.py [--fix] [ORG_SLUG]
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app import models  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.services.ledger_service import reconcile_account_balances  # noqa: E402
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    fix = "--fix" in args
+    args = [a for a in args if a != "--fix"]
+    db = SessionLocal()
+    try:
+        org_id = None
+        if args:
+            org = db.query(models.Organization).filter_by(slug=args[0]).first()
+            if not org:
+                print(f"Organization not found: {args[0]}")
+                return 1
+            org_id = org.id
+        drift = reconcile_account_balances(db, org_id, fix=fix)
+        for d in drift:
+            print(f"{d['account_id']} {d['name']}: stored {d['stored']} computed {d['computed']} drift {d['drift']}")
+        print(f"{len(drift)} account(s) drifted" + (", fixed" if fix and drift else ""))
+        return 0 if fix or not drift else 2
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
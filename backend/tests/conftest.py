@@ -1,4 +1,5 @@
 import os
+import uuid
 import pytest
 from fastapi.testclient import TestClient
 
@@ -12,6 +13,7 @@ from app import models  # noqa: E402
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_db():
+    Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     yield
 
@@ -32,6 +34,9 @@ def client():
 
 @pytest.fixture()
 def org(db):
+    existing = db.query(models.Organization).filter_by(slug="test").first()
+    if existing:
+        return existing
     org = models.Organization(name="Test Org", slug="test")
     db.add(org)
     db.commit()
@@ -43,14 +48,15 @@ def org(db):
 def auth_headers(client: TestClient, db, org: models.Organization):
     email = "admin@example.com"
     password = "secret123"
-    # Register user via API
-    r = client.post("/auth/register", json={"email": email, "password": password})
-    assert r.status_code == 200, r.text
-    user_id = r.json()["id"]
-    # Add membership as admin directly in DB
-    ou = models.UserOrganization(user_id=user_id, org_id=org.id, role="admin")
-    db.add(ou)
-    db.commit()
+    if not db.query(models.User).filter_by(email=email).first():
+        # Register user via API
+        r = client.post("/auth/register", json={"email": email, "password": password})
+        assert r.status_code == 200, r.text
+        user_id = uuid.UUID(r.json()["id"])
+        # Add membership as admin directly in DB
+        ou = models.UserOrganization(user_id=user_id, org_id=org.id, role="admin")
+        db.add(ou)
+        db.commit()
     # Get token
     r2 = client.post("/auth/token", data={"username": email, "password": password})
     assert r2.status_code == 200, r2.text
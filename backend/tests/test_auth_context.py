@@ -0,0 +1,38 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import engine
+
+
+def test_permission_check_uses_single_auth_query(client: TestClient, auth_headers):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        r = client.get("/partners/", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    assert r.status_code == 200, r.text
+    auth_queries = [s for s in statements if "FROM users" in s]
+    assert len(auth_queries) == 1
+
+
+def test_auth_context_errors(client: TestClient, auth_headers):
+    r = client.get("/me/permissions", headers=auth_headers)
+    assert r.status_code == 200, r.text
+    assert r.json()["is_admin"] is True
+
+    r2 = client.get("/me/permissions", headers={**auth_headers, "X-Org-Slug": "missing"})
+    assert r2.status_code == 404
+
+
+def test_auth_lookups_are_cached(client: TestClient, auth_headers):
+    client.get("/partners/", headers=auth_headers)
+    before = client.get("/admin/cache-stats", headers=auth_headers).json()
+    client.get("/partners/", headers=auth_headers)
+    after = client.get("/admin/cache-stats", headers=auth_headers).json()
+    assert after["org_by_slug"]["hits"] > before["org_by_slug"]["hits"]
+    assert after["role_permissions"]["hits"] > before["role_permissions"]["hits"]
@@ -0,0 +1,38 @@
+import uuid
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app import models
+
+
+def test_bulk_create_inserts_valid_orders_and_reports_failures(client: TestClient, db: Session, auth_headers):
+    pr = client.post("/partners/", headers=auth_headers, json={
+        "type": "CUSTOMER", "name": "Toplu Müşteri", "contact_person": None, "phone": None,
+        "email": None, "address": None, "tax_number": None, "is_active": True,
+    })
+    pid = pr.json()["id"]
+    item = {"description": "Panel", "area_sqm": 1, "unit_price": 100}
+    orders = [
+        {"partner_id": pid, "status": "SIPARIS", "order_date": "2023-05-01", "items": [item, item]},
+        {"partner_id": str(uuid.uuid4()), "items": [item]},
+        {"project_name": "Taslak", "order_date": "2023-05-02", "items": [item]},
+    ]
+
+    r = client.post("/orders/bulk", headers=auth_headers, json={"orders": orders, "atomic": True})
+    assert r.status_code == 200, r.text
+    assert r.json()["created"] == 0
+    assert r.json()["results"][1]["error"] == "Partner not found"
+
+    r = client.post("/orders/bulk", headers=auth_headers, json={"orders": orders})
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["created"], body["failed"]) == (2, 1)
+    first, _, third = body["results"]
+    assert [first["order_number"], third["order_number"]] == ["2023-001", "2023-002"]
+
+    order_id = uuid.UUID(first["id"])
+    assert db.query(models.OrderItem).filter_by(order_id=order_id).count() == 2
+    tx = db.query(models.FinancialTransaction).filter_by(order_id=order_id).one()
+    assert Decimal(str(tx.amount)) == Decimal(str(first["grand_total"]))
+    balance = db.get(models.PartnerBalance, uuid.UUID(pid))
+    assert Decimal(str(balance.balance)) == Decimal(str(first["grand_total"]))
@@ -0,0 +1,54 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app import models
+from app.services.crud import CRUDService
+
+
+def test_generic_list_filters_sorts_and_pages(client: TestClient, auth_headers):
+    for i in range(4):
+        r = client.post("/production_stations/", headers=auth_headers, json={
+            "name": f"İstasyon {i}", "code": f"CRUD-{i}", "order_index": i,
+        })
+        assert r.status_code == 200, r.text
+
+    r = client.get("/production_stations/", headers=auth_headers, params={
+        "order_index__gte": 1, "sort": "-order_index", "limit": 2,
+    })
+    assert r.status_code == 200, r.text
+    assert [s["code"] for s in r.json()] == ["CRUD-3", "CRUD-2"]
+    cursor = r.headers["X-Next-Cursor"]
+
+    r = client.get("/production_stations/", headers=auth_headers, params={
+        "order_index__gte": 1, "sort": "-order_index", "limit": 2, "cursor": cursor,
+    })
+    assert [s["code"] for s in r.json()] == ["CRUD-1"]
+    assert "X-Next-Cursor" not in r.headers
+
+    r = client.get("/production_stations/", headers=auth_headers, params={"code": "CRUD-0", "fields": "name"})
+    assert r.status_code == 200, r.text
+    assert r.json() == [{"id": r.json()[0]["id"], "name": "İstasyon 0"}]
+
+
+def test_generic_list_rejects_unknown_params(client: TestClient, auth_headers):
+    assert client.get("/production_stations/", headers=auth_headers, params={"nope": 1}).status_code == 400
+    assert client.get("/production_stations/", headers=auth_headers, params={"sort": "nope"}).status_code == 400
+    assert client.get("/production_stations/", headers=auth_headers, params={"fields": "nope"}).status_code == 400
+    assert client.get("/production_stations/", headers=auth_headers, params={"limit": 100000}).status_code == 422
+    assert client.get("/production_logs/", headers=auth_headers).status_code == 200
+
+
+def test_generic_list_rejects_malformed_filter_values(client: TestClient, auth_headers):
+    for params in ({"current_balance": "abc"}, {"current_balance__in": "1,abc"}, {"current_balance__gte": "1e"}):
+        r = client.get("/accounts/", headers=auth_headers, params=params)
+        assert r.status_code == 400, (params, r.text)
+
+
+def test_in_filter_parses_booleans_like_eq():
+    service = CRUDService(models.User)
+    clause = service._filter_clause("is_active__in", "yes,false")
+    assert clause.right.value == [True, False]
+    with pytest.raises(HTTPException) as exc:
+        service._filter_clause("is_active__in", "maybe")
+    assert exc.value.status_code == 400
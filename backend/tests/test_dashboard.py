@@ -0,0 +1,24 @@
+from datetime import date
+from fastapi.testclient import TestClient
+
+
+def test_dashboard_snapshot_is_cached_and_invalidated(client: TestClient, auth_headers):
+    first = client.get("/dashboard/summary", headers=auth_headers)
+    assert first.status_code == 200, first.text
+    generated_at = first.json()["generated_at"]
+
+    again = client.get("/dashboard/summary", headers=auth_headers).json()
+    assert again["generated_at"] == generated_at
+
+    tr = client.post("/financial_transactions/", headers=auth_headers, json={
+        "direction": "IN", "amount": "5", "method": "CASH",
+        "transaction_date": date.today().isoformat(),
+    })
+    assert tr.status_code == 200, tr.text
+    after_write = client.get("/dashboard/summary", headers=auth_headers).json()
+    assert after_write["generated_at"] != generated_at
+
+    fresh = client.get("/dashboard/summary?fresh=true", headers=auth_headers).json()
+    assert fresh["generated_at"] >= after_write["generated_at"]
+    assert fresh["cash_flow_7d"][-1] >= 5
+    assert len(fresh["cash_flow_7d"]) == 7
@@ -0,0 +1,54 @@
+import asyncio
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+from app.api.events import stream_events
+from app.core import events
+from app.database import engine
+
+
+def _collect(org_id, action, timeout=0.5):
+    """Subscribe to the org, run ``action`` on a worker thread, return delivered events."""
+    async def run():
+        with events.subscription(org_id, asyncio.get_running_loop()) as sub:
+            await asyncio.to_thread(action)
+            received = []
+            try:
+                while True:
+                    received.append(await asyncio.wait_for(sub.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                return received
+    return asyncio.run(run())
+
+
+def test_events_are_delivered_on_commit_only(db: Session, org):
+    def commit():
+        events.publish(db, org.id, "test.committed", {"n": 1})
+        db.commit()
+
+    def rollback():
+        events.publish(db, org.id, "test.rolled_back")
+        db.rollback()
+
+    assert [e["type"] for e in _collect(org.id, commit)] == ["test.committed"]
+    assert _collect(org.id, rollback) == []
+    assert _collect("another-org", commit) == []
+
+
+def test_order_status_change_is_pushed(client: TestClient, auth_headers, org):
+    item = {"description": "Panel", "area_sqm": 1, "unit_price": 10}
+    oid = client.post("/orders/", headers=auth_headers, json={"project_name": "Push", "items": [item]}).json()["id"]
+
+    received = _collect(org.id, lambda: client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"}))
+    assert [e["type"] for e in received] == ["order.status", "jobs.created"]
+    assert received[0]["data"]["status"] == "URETIMDE"
+    assert received[1]["data"]["count"] == 1
+
+
+def test_event_stream_does_not_hold_a_db_connection(auth_headers):
+    before = engine.pool.checkedout()
+    token = auth_headers["Authorization"].split()[1]
+    response = asyncio.run(stream_events(Request({"type": "http"}), auth_headers["X-Org-Slug"], token))
+    assert response.media_type == "text/event-stream"
+    # Authentication is done and its session returned before any event is streamed
+    assert engine.pool.checkedout() == before
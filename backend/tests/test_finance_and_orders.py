@@ -1,3 +1,4 @@
+import uuid
 from decimal import Decimal
 from fastapi.testclient import TestClient
 from app import models
@@ -31,9 +32,10 @@ def test_order_creates_financial_posting(client: TestClient, db: Session, auth_h
     orr = client.post("/orders/", headers=auth_headers, json=payload)
     assert orr.status_code == 200, orr.text
     order = orr.json()
-    order_id = order["id"]
+    order_id = uuid.UUID(order["id"])
     grand_total = Decimal(str(order.get("grand_total") or "0"))
-    assert grand_total == Decimal("250")
+    # 2.5 m² × 100 plus 20% VAT (prices are VAT-exclusive by default)
+    assert grand_total == Decimal("300")
 
     # Check that a financial transaction is recorded
     tx = (
@@ -0,0 +1,44 @@
+import uuid
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app import models
+from app.services import production_service
+
+
+def test_latest_log_moves_job_between_stations(client: TestClient, db: Session, auth_headers, org):
+    stations = []
+    for code in ("KES-Q", "ROD-Q"):
+        r = client.post("/production_stations/", headers=auth_headers, json={"name": f"İst {code}", "code": code, "order_index": 1})
+        stations.append(r.json()["id"])
+    # Later in the route, so output at the first two stations does not complete the job
+    client.post("/production_stations/", headers=auth_headers, json={"name": "İst PAK-Q", "code": "PAK-Q", "order_index": 5})
+    item = {"description": "Panel", "area_sqm": 1, "unit_price": 10}
+    oid = client.post("/orders/", headers=auth_headers, json={"project_name": "Kuyruk", "items": [item]}).json()["id"]
+    client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"})
+    job = (
+        db.query(models.ProductionJob)
+        .join(models.OrderItem, models.OrderItem.id == models.ProductionJob.order_item_id)
+        .filter(models.OrderItem.order_id == uuid.UUID(oid))
+        .one()
+    )
+    user_id = str(db.query(models.User.id).filter_by(email="admin@example.com").scalar())
+
+    def log(station, at):
+        r = client.post("/production_logs/", headers=auth_headers, json={
+            "job_id": str(job.id), "station_id": station, "user_id": user_id,
+            "completed_at": at, "quantity": 1, "notes": None,
+        })
+        assert r.status_code == 200, r.text
+
+    log(stations[1], "2025-01-02T10:00:00")
+    log(stations[0], "2025-01-01T10:00:00")  # late-arriving older log does not move the job back
+    queue = client.get(f"/production/stations/{stations[1]}/queue", headers=auth_headers).json()
+    assert [j["id"] for j in queue] == [str(job.id)]
+    assert client.get(f"/production/stations/{stations[0]}/queue", headers=auth_headers).json() == []
+
+    summary = client.get("/dashboard/summary", headers=auth_headers, params={"fresh": True}).json()
+    assert summary["jobs_by_station"].get("İst ROD-Q") == 1
+
+    production_service.rebuild_job_stations(db, org.id)
+    db.expire_all()
+    assert str(db.get(models.ProductionJob, job.id).current_station_id) == stations[1]
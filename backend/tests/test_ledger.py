@@ -0,0 +1,70 @@
+import uuid
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app import models
+from app.services import ledger_service
+
+
+def _balance(db: Session, partner_id) -> Decimal:
+    db.expire_all()
+    row = db.query(models.PartnerBalance).filter(models.PartnerBalance.partner_id == partner_id).first()
+    return Decimal(str(row.balance)) if row else Decimal("0")
+
+
+def test_partner_balance_follows_postings_and_payments(client: TestClient, db: Session, auth_headers, org):
+    pr = client.post("/partners/", headers=auth_headers, json={
+        "type": "CUSTOMER", "name": "Ledger Müşteri", "contact_person": None, "phone": None,
+        "email": None, "address": None, "tax_number": None, "is_active": True,
+    })
+    assert pr.status_code == 200, pr.text
+    pid = pr.json()["id"]
+    partner_uuid = uuid.UUID(pid)
+
+    orr = client.post("/orders/", headers=auth_headers, json={
+        "partner_id": pid, "status": "SIPARIS",
+        "items": [{"description": "Panel", "area_sqm": 1, "unit_price": 100}],
+    })
+    assert orr.status_code == 200, orr.text
+    grand_total = Decimal(str(orr.json()["grand_total"]))
+    assert _balance(db, partner_uuid) == grand_total
+
+    tr = client.post("/financial_transactions/", headers=auth_headers, json={
+        "partner_id": pid, "direction": "IN", "amount": "20", "method": "CASH",
+    })
+    assert tr.status_code == 200, tr.text
+    assert _balance(db, partner_uuid) == grand_total - 20
+
+    ledger_service.rebuild_partner_balances(db, org.id)
+    assert _balance(db, partner_uuid) == grand_total - 20
+
+    receivables, _ = ledger_service.receivables_and_payables(db, org.id)
+    assert receivables >= grand_total - 20
+
+    # Another organization's write never reaches this partner's balance
+    ledger_service.apply_delta(db, uuid.uuid4(), partner_uuid, Decimal("1000"))
+    db.commit()
+    assert _balance(db, partner_uuid) == grand_total - 20
+
+
+def test_account_balance_increments_and_reconciliation(client: TestClient, db: Session, auth_headers, org):
+    ar = client.post("/accounts/", headers=auth_headers, json={"name": "Kasa Mutabakat", "type": "CASH", "current_balance": "100"})
+    assert ar.status_code == 200, ar.text
+    assert Decimal(str(ar.json()["opening_balance"])) == 100
+    account_id = uuid.UUID(ar.json()["id"])
+
+    for direction, amount in (("IN", "50"), ("OUT", "30")):
+        tr = client.post("/financial_transactions/", headers=auth_headers, json={
+            "account_id": str(account_id), "direction": direction, "amount": amount, "method": "CASH",
+        })
+        assert tr.status_code == 200, tr.text
+    db.expire_all()
+    assert Decimal(str(db.get(models.Account, account_id).current_balance)) == 120
+    assert not [d for d in ledger_service.account_balance_drift(db, org.id) if d['account_id'] == account_id]
+
+    db.get(models.Account, account_id).current_balance = Decimal("999")
+    db.commit()
+    drift = [d for d in ledger_service.reconcile_account_balances(db, org.id, fix=True) if d['account_id'] == account_id]
+    assert drift and drift[0]['drift'] == 879
+    db.expire_all()
+    assert Decimal(str(db.get(models.Account, account_id).current_balance)) == 120
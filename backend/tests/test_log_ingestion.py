@@ -0,0 +1,129 @@
+from datetime import datetime
+import uuid
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app import models
+
+
+def test_log_batch_rolls_up_quantity_and_completes_jobs(client: TestClient, db: Session, auth_headers):
+    station = client.post("/production_stations/", headers=auth_headers, json={
+        "name": "Paketleme", "code": "PKT-B", "order_index": 9,
+    }).json()["id"]
+    item = {"description": "Panel", "width": 1000, "height": 1000, "quantity": 5, "unit_price": 10}
+    oid = client.post("/orders/", headers=auth_headers, json={"project_name": "Toplu Log", "items": [item]}).json()["id"]
+    client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"})
+    job = (
+        db.query(models.ProductionJob)
+        .join(models.OrderItem, models.OrderItem.id == models.ProductionJob.order_item_id)
+        .filter(models.OrderItem.order_id == uuid.UUID(oid))
+        .one()
+    )
+    jid = str(job.id)
+
+    logs = [
+        {"job_id": jid, "station_id": station, "quantity": 2, "completed_at": "2025-02-01T08:00:00"},
+        {"job_id": jid, "station_id": station, "quantity": 2, "completed_at": "2025-02-01T09:00:00"},
+        {"job_id": str(uuid.uuid4()), "station_id": station, "quantity": 1},
+    ]
+    r = client.post("/production/logs/batch", headers=auth_headers, json={"logs": logs})
+    assert r.status_code == 200, r.text
+    assert r.json() == {"accepted": 2, "rejected": [{"index": 2, "error": "Job not found"}], "completed_job_ids": []}
+    db.expire_all()
+    job = db.get(models.ProductionJob, job.id)
+    assert (job.quantity_produced, job.status, str(job.current_station_id)) == (4, "PENDING", station)
+
+    # The generic single-row create goes through the same rollup
+    user_id = str(db.query(models.User.id).filter_by(email="admin@example.com").scalar())
+    r = client.post("/production_logs/", headers=auth_headers, json={
+        "job_id": jid, "station_id": station, "user_id": user_id, "completed_at": None, "quantity": 1, "notes": None,
+    })
+    assert r.status_code == 200, r.text
+    db.expire_all()
+    job = db.get(models.ProductionJob, job.id)
+    assert (job.quantity_produced, job.status) == (5, "TAMAMLANDI")
+
+    r = client.post("/production/logs/batch", headers=auth_headers, json={"logs": logs[:1]})
+    assert r.json()["completed_job_ids"] == []
+
+
+def test_output_before_the_final_station_does_not_complete_the_job(client: TestClient, db: Session, auth_headers):
+    first = client.post("/production_stations/", headers=auth_headers, json={
+        "name": "Kesim Rota", "code": "KES-R", "order_index": 1,
+    }).json()["id"]
+    last = client.post("/production_stations/", headers=auth_headers, json={
+        "name": "Paketleme Rota", "code": "PKT-R", "order_index": 9,
+    }).json()["id"]
+    item = {"description": "Panel", "width": 1000, "height": 1000, "quantity": 1, "unit_price": 10}
+    oid = client.post("/orders/", headers=auth_headers, json={"project_name": "Rota", "items": [item]}).json()["id"]
+    client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"})
+    job_id = (
+        db.query(models.ProductionJob.id)
+        .join(models.OrderItem, models.OrderItem.id == models.ProductionJob.order_item_id)
+        .filter(models.OrderItem.order_id == uuid.UUID(oid))
+        .scalar()
+    )
+
+    r = client.post("/production/logs/batch", headers=auth_headers, json={"logs": [
+        {"job_id": str(job_id), "station_id": first, "quantity": 1, "completed_at": "2025-02-02T08:00:00"},
+    ]})
+    assert r.json()["completed_job_ids"] == []
+    db.expire_all()
+    job = db.get(models.ProductionJob, job_id)
+    assert (job.quantity_produced or 0, job.status, str(job.current_station_id)) == (0, "PENDING", first)
+
+    r = client.post("/production/logs/batch", headers=auth_headers, json={"logs": [
+        {"job_id": str(job_id), "station_id": last, "quantity": 1, "completed_at": "2025-02-02T10:00:00"},
+    ]})
+    assert r.json()["completed_job_ids"] == [str(job_id)]
+
+
+def test_logs_with_a_utc_offset_are_stored_as_naive_utc(client: TestClient, db: Session, auth_headers):
+    station = client.post("/production_stations/", headers=auth_headers, json={
+        "name": "Kesim Saat", "code": "KES-TZ", "order_index": 1,
+    }).json()["id"]
+    item = {"description": "Panel", "width": 1000, "height": 1000, "quantity": 5, "unit_price": 10}
+    oid = client.post("/orders/", headers=auth_headers, json={"project_name": "Saat", "items": [item]}).json()["id"]
+    client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"})
+    job_id = (
+        db.query(models.ProductionJob.id)
+        .join(models.OrderItem, models.OrderItem.id == models.ProductionJob.order_item_id)
+        .filter(models.OrderItem.order_id == uuid.UUID(oid))
+        .scalar()
+    )
+
+    r = client.post("/production/logs/batch", headers=auth_headers, json={"logs": [
+        {"job_id": str(job_id), "station_id": station, "quantity": 1, "completed_at": "2025-02-01T08:00:00Z"},
+    ]})
+    assert r.status_code == 200, r.text
+    user_id = str(db.query(models.User.id).filter_by(email="admin@example.com").scalar())
+    r = client.post("/production_logs/", headers=auth_headers, json={
+        "job_id": str(job_id), "station_id": station, "user_id": user_id,
+        "completed_at": "2025-02-01T12:00:00+03:00", "quantity": 1, "notes": None,
+    })
+    assert r.status_code == 200, r.text
+
+    times = db.query(models.ProductionLog.completed_at).filter_by(job_id=job_id).order_by(models.ProductionLog.completed_at)
+    assert [t for (t,) in times] == [datetime(2025, 2, 1, 8), datetime(2025, 2, 1, 9)]
+
+
+def test_batch_mixing_offset_and_omitted_timestamps(client: TestClient, db: Session, auth_headers):
+    station = client.post("/production_stations/", headers=auth_headers, json={
+        "name": "Kesim Karışık", "code": "KES-MX", "order_index": 1,
+    }).json()["id"]
+    item = {"description": "Panel", "width": 1000, "height": 1000, "quantity": 5, "unit_price": 10}
+    oid = client.post("/orders/", headers=auth_headers, json={"project_name": "Karışık", "items": [item]}).json()["id"]
+    client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"})
+    job_id = (
+        db.query(models.ProductionJob.id)
+        .join(models.OrderItem, models.OrderItem.id == models.ProductionJob.order_item_id)
+        .filter(models.OrderItem.order_id == uuid.UUID(oid))
+        .scalar()
+    )
+
+    # The omitted time is filled with naive utcnow() and compared with the explicit one
+    r = client.post("/production/logs/batch", headers=auth_headers, json={"logs": [
+        {"job_id": str(job_id), "station_id": station, "quantity": 1, "completed_at": "2025-02-01T08:00:00+03:00"},
+        {"job_id": str(job_id), "station_id": station, "quantity": 1},
+    ]})
+    assert r.status_code == 200, r.text
+    assert r.json()["accepted"] == 2
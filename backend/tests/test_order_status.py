@@ -0,0 +1,92 @@
+import uuid
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app import models
+from app.services import order_service
+
+
+def _order(client: TestClient, auth_headers, n_items: int) -> str:
+    item = {"description": "Panel", "area_sqm": 1, "unit_price": 10}
+    r = client.post("/orders/", headers=auth_headers, json={"project_name": "Üretim", "items": [item] * n_items})
+    assert r.status_code == 200, r.text
+    return r.json()["id"]
+
+
+def _jobs(db: Session, order_id: str):
+    db.expire_all()
+    return (
+        db.query(models.ProductionJob)
+        .join(models.OrderItem, models.OrderItem.id == models.ProductionJob.order_item_id)
+        .filter(models.OrderItem.order_id == uuid.UUID(order_id))
+        .all()
+    )
+
+
+def test_resending_uretimde_does_not_duplicate_jobs(client: TestClient, db: Session, auth_headers):
+    oid = _order(client, auth_headers, 3)
+    for _ in range(2):
+        r = client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"})
+        assert r.status_code == 200, r.text
+    jobs = _jobs(db, oid)
+    assert len(jobs) == 3
+    assert len({j.job_number for j in jobs}) == 3
+
+
+def test_bulk_status_moves_orders_into_production(client: TestClient, db: Session, auth_headers):
+    ids = [_order(client, auth_headers, 2), _order(client, auth_headers, 1)]
+    missing = str(uuid.uuid4())
+    r = client.post("/orders/status/bulk", headers=auth_headers, json={"order_ids": ids + [missing], "status": "URETIMDE"})
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["updated"], body["failed"], body["jobs_created"]) == (2, 1, 3)
+    assert body["results"][-1] == {"order_id": missing, "ok": False, "error": "Order not found"}
+
+    r = client.post("/orders/status/bulk", headers=auth_headers, json={"order_ids": ids, "status": "URETIMDE"})
+    assert r.json()["jobs_created"] == 0
+    assert [len(_jobs(db, oid)) for oid in ids] == [2, 1]
+
+
+def test_job_numbers_follow_item_entry_order_and_skip_existing_jobs(client: TestClient, db: Session, auth_headers, org):
+    items = [{"description": f"Kalem {i}", "area_sqm": 1, "unit_price": 10} for i in range(1, 6)]
+    r = client.post("/orders/", headers=auth_headers, json={"project_name": "Sıra", "items": items})
+    order = r.json()
+    order_id = uuid.UUID(order["id"])
+    by_desc = {
+        i.description: i
+        for i in db.query(models.OrderItem).filter(models.OrderItem.order_id == order_id)
+    }
+    # Item 2 already has a job, e.g. spawned by a concurrent request
+    db.add(models.ProductionJob(
+        organization_id=org.id, order_item_id=by_desc["Kalem 2"].id, job_number="ELLE", status="PENDING",
+    ))
+    db.commit()
+
+    assert order_service.spawn_production_jobs(db, org.id, [order_id]) == 4
+    db.commit()
+    numbers = {j.order_item_id: j.job_number for j in _jobs(db, order["id"])}
+    assert [numbers[by_desc[f"Kalem {i}"].id] for i in range(1, 6)] == [
+        f"{order['order_number']}-001", "ELLE", f"{order['order_number']}-003",
+        f"{order['order_number']}-004", f"{order['order_number']}-005",
+    ]
+    assert order_service.spawn_production_jobs(db, org.id, [order_id]) == 0
+
+
+def test_job_numbers_follow_item_positions_for_bulk_and_appended_items(client: TestClient, db: Session, auth_headers, org):
+    items = [{"description": f"Toplu {i}", "area_sqm": 1, "unit_price": 10} for i in range(1, 8)]
+    r = client.post("/orders/bulk", headers=auth_headers, json={"orders": [{"project_name": "Toplu Sıra", "items": items}]})
+    assert r.status_code == 200, r.text
+    order = r.json()["results"][0]
+    r = client.post("/order_items/", headers=auth_headers, json={
+        "order_id": order["id"], "product_id": None, "description": "Toplu 8", "area_sqm": 1, "width": None,
+        "height": None, "quantity": 1, "unit_price": 10, "total_price": 10, "notes": None,
+    })
+    assert r.status_code == 200, r.text
+
+    # All seven rows go in with one executemany; the positions still keep their order
+    assert order_service.spawn_production_jobs(db, org.id, [uuid.UUID(order["id"])]) == 8
+    db.commit()
+    by_item = {j.order_item_id: j.job_number for j in _jobs(db, order["id"])}
+    rows = db.query(models.OrderItem).filter_by(order_id=uuid.UUID(order["id"])).all()
+    assert sorted((it.position, it.description, by_item[it.id]) for it in rows) == [
+        (i, f"Toplu {i}", f"{order['order_number']}-{i:03d}") for i in range(1, 9)
+    ]
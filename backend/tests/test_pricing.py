@@ -0,0 +1,40 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from app.services import pricing
+
+
+def _item(**kw):
+    base = dict(area_sqm=None, width=None, height=None, quantity=None, unit_price=None)
+    base.update(kw)
+    return SimpleNamespace(**base)
+
+
+def test_price_order_keeps_decimal_semantics():
+    price = pricing.price_order(
+        [_item(area_sqm=Decimal("2.5"), unit_price=Decimal("100")), _item(width=1000, height=500, quantity=3, unit_price=10)],
+        discount_percent=Decimal("10"),
+    )
+    assert [line.area_sqm for line in price.lines] == [Decimal("2.5"), Decimal("1.5")]
+    assert price.subtotal == Decimal("265")
+    assert price.discount == Decimal("26.5")
+    assert price.grand_total == Decimal("286.20")
+    assert price.total_area_sqm == Decimal("4.0")
+
+    inclusive = pricing.price_order([_item(area_sqm=1, unit_price=120)], vat_inclusive=True)
+    assert (inclusive.grand_total, inclusive.vat) == (Decimal("120.00"), Decimal("20.00"))
+
+
+def test_quote_matches_create_and_writes_nothing(client: TestClient, auth_headers):
+    payload = {
+        "project_name": "Teklif", "discount_percent": 5,
+        "items": [{"description": "Panel", "width": 1200, "height": 800, "quantity": 2, "unit_price": 75}],
+    }
+    before = len(client.get("/orders/", headers=auth_headers, params={"limit": 500}).json())
+    quote = client.post("/orders/quote", headers=auth_headers, json=payload)
+    assert quote.status_code == 200, quote.text
+    assert len(client.get("/orders/", headers=auth_headers, params={"limit": 500}).json()) == before
+
+    created = client.post("/orders/", headers=auth_headers, json=payload).json()
+    assert Decimal(str(quote.json()["grand_total"])) == Decimal(str(created["grand_total"]))
+    assert Decimal(str(quote.json()["total_area_sqm"])) == Decimal(str(created["total_area_sqm"]))
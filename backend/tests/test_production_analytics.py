@@ -0,0 +1,79 @@
+import uuid
+from datetime import date
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app import models
+from app.services import production_analytics
+
+
+def test_station_analytics_with_cached_rollups(client: TestClient, db: Session, auth_headers, org):
+    stations = []
+    for index, code in enumerate(("KES-A", "ROD-A"), start=1):
+        r = client.post("/production_stations/", headers=auth_headers, json={"name": f"İst {code}", "code": code, "order_index": index})
+        stations.append(r.json()["id"])
+    job_ids = []
+    for project in ("Analiz", "Analiz 2"):
+        item = {"description": "Panel", "area_sqm": 1, "quantity": 10, "unit_price": 10}
+        oid = client.post("/orders/", headers=auth_headers, json={"project_name": project, "items": [item]}).json()["id"]
+        client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"})
+        job_ids.append(
+            db.query(models.ProductionJob.id)
+            .join(models.OrderItem, models.OrderItem.id == models.ProductionJob.order_item_id)
+            .filter(models.OrderItem.order_id == uuid.UUID(oid))
+            .scalar()
+        )
+
+    def log(station, at, quantity, job_id=job_ids[0]):
+        r = client.post("/production/logs/batch", headers=auth_headers, json={"logs": [
+            {"job_id": str(job_id), "station_id": station, "completed_at": at, "quantity": quantity},
+        ]})
+        assert r.json()["accepted"] == 1, r.text
+
+    def analytics(end="2025-01-01"):
+        r = client.get("/production/analytics", headers=auth_headers,
+                       params={"start_date": "2025-01-01", "end_date": end})
+        assert r.status_code == 200, r.text
+        return r.json()
+
+    def cached_days():
+        rows = db.query(models.ProductionRollupDay.day).filter_by(organization_id=org.id)
+        return {d for (d,) in rows}
+
+    log(stations[0], "2025-01-01T10:00:00", 3)
+    log(stations[1], "2025-01-01T12:00:00", 2)
+    log(stations[0], "2025-01-03T09:00:00", 5, job_id=job_ids[1])
+    analytics(end="2025-01-03")
+    assert {date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)} <= cached_days()
+    data = analytics()
+    by_id = {s["station_id"]: s for s in data["stations"]}
+    assert [s["station_id"] for s in data["stations"] if s["station_id"] in stations] == stations
+    assert by_id[stations[0]]["log_count"] == 1 and by_id[stations[0]]["avg_cycle_seconds"] is None
+    assert by_id[stations[0]]["quantity"] == 3 and float(by_id[stations[0]]["throughput_per_day"]) == 3
+    assert by_id[stations[1]]["quantity"] == 2
+    assert float(by_id[stations[1]]["avg_cycle_seconds"]) == 7200
+    assert by_id[stations[1]]["wip"] == 1
+    assert data["bottleneck_station_id"] is not None
+    assert db.query(models.ProductionDailyRollup).filter_by(organization_id=org.id).count() > 0
+
+    # A late log for a cached day invalidates that job's days only, and is picked up
+    log(stations[1], "2025-01-01T11:00:00", 4)
+    assert date(2025, 1, 1) not in cached_days() and date(2025, 1, 3) in cached_days()
+    by_id = {s["station_id"]: s for s in analytics()["stations"]}
+    assert by_id[stations[1]]["log_count"] == 2 and by_id[stations[1]]["quantity"] == 6
+    assert float(by_id[stations[1]]["avg_cycle_seconds"]) == 3600
+    by_id = {s["station_id"]: s for s in analytics(end="2025-01-03")["stations"]}
+    assert by_id[stations[0]]["quantity"] == 8
+    assert float(by_id[stations[0]]["throughput_per_day"]) == round(8 / 3, 2)
+
+    r = client.get("/production/analytics", headers=auth_headers,
+                   params={"start_date": "2025-02-01", "end_date": "2025-01-01"})
+    assert r.status_code == 400
+
+
+def test_reading_analytics_does_not_commit_the_callers_session(db: Session, org):
+    db.add(models.ProductionStation(organization_id=org.id, name="Taslak", code="TASLAK-A"))
+    production_analytics.station_analytics(db, org.id, date(2024, 6, 1), date(2024, 6, 2))
+    db.rollback()
+    assert db.query(models.ProductionStation).filter_by(code="TASLAK-A").count() == 0
+    # The cache itself was stored on its own session
+    assert db.query(models.ProductionRollupDay).filter_by(organization_id=org.id, day=date(2024, 6, 2)).count() == 1
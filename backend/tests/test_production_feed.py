@@ -0,0 +1,58 @@
+from fastapi.testclient import TestClient
+
+
+def test_active_jobs_feed_returns_only_changes(client: TestClient, auth_headers):
+    item = {"description": "Panel", "area_sqm": 1, "unit_price": 10}
+    r = client.post("/orders/", headers=auth_headers, json={"project_name": "Pano", "items": [item, item]})
+    oid = r.json()["id"]
+
+    board = client.get("/production/active-jobs", headers=auth_headers)
+    assert board.status_code == 200, board.text
+    version = int(board.headers["X-Board-Version"])
+
+    r = client.get("/production/active-jobs", headers=auth_headers, params={"since": version})
+    assert r.json() == []
+
+    client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"})
+    r = client.get("/production/active-jobs", headers=auth_headers, params={"since": version})
+    spawned = r.json()
+    assert len(spawned) == 2
+    version = int(r.headers["X-Board-Version"])
+    assert version == max(j["version"] for j in spawned)
+
+    job_id = spawned[0]["id"]
+    r = client.post(f"/production/jobs/{job_id}/status", headers=auth_headers, json={"status": "TAMAMLANDI"})
+    assert r.status_code == 200, r.text
+    assert r.json()["version"] > version
+
+    r = client.get("/production/active-jobs", headers=auth_headers, params={"since": version})
+    assert [(j["id"], j["status"]) for j in r.json()] == [(job_id, "TAMAMLANDI")]
+    full = client.get("/production/active-jobs", headers=auth_headers).json()
+    assert job_id not in {j["id"] for j in full}
+
+
+def test_batch_job_status_update(client: TestClient, auth_headers):
+    item = {"description": "Panel", "area_sqm": 1, "unit_price": 10}
+    r = client.post("/orders/", headers=auth_headers, json={"project_name": "Barkod", "items": [item] * 3})
+    oid = r.json()["id"]
+    since = int(client.get("/production/active-jobs", headers=auth_headers).headers["X-Board-Version"])
+    client.post(f"/orders/{oid}/status", headers=auth_headers, json={"status": "URETIMDE"})
+    job_ids = [j["id"] for j in client.get("/production/active-jobs", headers=auth_headers, params={"since": since}).json()]
+    missing = "00000000-0000-0000-0000-000000000000"
+
+    r = client.post("/production/jobs/status", headers=auth_headers, json={"job_ids": job_ids + [missing], "status": "KESIM"})
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert sorted(j["id"] for j in body["updated"]) == sorted(job_ids)
+    assert {j["status"] for j in body["updated"]} == {"KESIM"}
+    assert len({j["version"] for j in body["updated"]}) == 1
+    assert body["updated"][0]["order_number"]
+    assert body["not_found"] == [missing]
+
+    # A batch that matches no job leaves the board version alone
+    version = int(client.get("/production/active-jobs", headers=auth_headers).headers["X-Board-Version"])
+    r = client.post("/production/jobs/status", headers=auth_headers, json={"job_ids": [missing], "status": "KESIM"})
+    assert r.json()["not_found"] == [missing]
+    r = client.post(f"/production/jobs/{missing}/status", headers=auth_headers, json={"status": "KESIM"})
+    assert r.status_code == 404
+    assert int(client.get("/production/active-jobs", headers=auth_headers).headers["X-Board-Version"]) == version
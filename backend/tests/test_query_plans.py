@@ -0,0 +1,88 @@
+"""Hot queries must seek through an index, not scan the table.
+
+Runs the real service functions, captures the SQL they send and checks the
+plan of each: EXPLAIN QUERY PLAN on SQLite, EXPLAIN on PostgreSQL. The test
+tables are near-empty, so this shows that a matching index exists and is
+usable (e.g. that a partial index predicate still matches the query), not
+what the planner picks on production-sized tables. On PostgreSQL seq scans
+are disabled for the check, as the planner rightly prefers them on tiny tables.
+"""
+from contextlib import contextmanager
+from datetime import date
+from types import SimpleNamespace
+import re
+import uuid
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.services import order_service, partner_service, production_analytics, production_service, transaction_service
+
+pytestmark = pytest.mark.skipif(
+    engine.dialect.name not in ("sqlite", "postgresql"), reason="plans are checked on SQLite and PostgreSQL"
+)
+
+
+@contextmanager
+def captured_sql():
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def plan(db: Session, statement, parameters) -> str:
+    conn = db.connection()
+    if engine.dialect.name == "postgresql":
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        return "\n".join(row[0] for row in conn.exec_driver_sql("EXPLAIN " + statement, parameters).all())
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+def assert_seeks(db: Session, call, table: str, index: str = None, ordered: bool = False):
+    """``ordered``: a keyset list query, whose ORDER BY the index must serve without a sort."""
+    with captured_sql() as statements:
+        call()
+    plans = [plan(db, s, p) for s, p in statements if table in s]
+    assert plans, f"no query touched {table}"
+    for p in plans:
+        if engine.dialect.name == "postgresql":
+            assert f"Seq Scan on {table}" not in p, p
+            assert re.search(rf"Index (Only )?Scan using \w+ on {table}\b|Bitmap Heap Scan on {table}\b", p), p
+        else:
+            assert f"SCAN {table}\n" not in p + "\n", p  # bare SCAN = full table scan
+            assert f"SEARCH {table} USING" in p or f"SCAN {table} USING" in p, p
+        if index:
+            assert re.search(rf"\b{index}\b", p), p
+        if ordered:
+            assert not re.search(r"(^|->\s+)(Incremental )?Sort\s+\(", p, re.M), p
+            assert not re.search(r"USE TEMP B-TREE FOR (\w+ )*ORDER BY", p), p
+
+
+def test_hot_queries_use_indexes(db: Session, org):
+    user = SimpleNamespace(organization_id=org.id)
+    some_id = uuid.uuid4()
+    assert_seeks(db, lambda: transaction_service.list_transactions(db, org.id, partner_id=some_id), "financial_transactions")
+    assert_seeks(db, lambda: transaction_service.list_transactions(db, org.id, start_date=date(2025, 1, 1)), "financial_transactions",
+                 "ix_financial_transactions_org_date", ordered=True)
+    assert_seeks(db, lambda: order_service.list_orders(db, user), "orders", "ix_orders_org_date", ordered=True)
+    assert_seeks(db, lambda: order_service.refresh_order_area(db, org.id, some_id), "order_items", "ix_order_items_order_id")
+    assert_seeks(db, lambda: partner_service.list_partners(db, user), "partners", "ix_partners_org_name", ordered=True)
+    assert_seeks(db, lambda: production_service.list_active_jobs(db, org.id), "production_jobs")
+    assert_seeks(db, lambda: production_service.station_queue(db, org.id, some_id), "production_jobs",
+                 "ix_production_jobs_active_station")
+    assert_seeks(
+        db, lambda: production_analytics._daily_station_stats(db, org.id, date(2025, 1, 1), date(2025, 1, 7)), "production_logs",
+        "ix_production_logs_job_completed_at",
+    )
+    db.rollback()
@@ -0,0 +1,46 @@
+from fastapi.testclient import TestClient
+from app.core.textfold import tr_fold
+
+
+def _partner(client, headers, name):
+    r = client.post("/partners/", headers=headers, json={
+        "type": "CUSTOMER", "name": name, "contact_person": None, "phone": None,
+        "email": None, "address": None, "tax_number": None, "is_active": True,
+    })
+    assert r.status_code == 200, r.text
+    return r.json()["id"]
+
+
+def test_turkish_case_folding():
+    assert tr_fold("İSTANBUL") == tr_fold("Istanbul") == "istanbul"
+    assert tr_fold("IŞIK") == tr_fold("ışık") == "isik"
+    # Only the explicit mapping applies, as in SQL, whatever the database collation
+    assert tr_fold("ÇAM ÉTAGE Ω") == "cam Étage Ω"
+
+
+def test_search_ranks_across_orders_partners_and_products(client: TestClient, auth_headers):
+    exact = _partner(client, auth_headers, "Arama Işık")
+    prefix = _partner(client, auth_headers, "ARAMA IŞIKLARI Ltd")
+    r = client.post("/products/", headers=auth_headers, json={
+        "name": "Arama Çift Cam", "sku": "ARM-01", "category_id": None, "base_price_sqm": None,
+    })
+    assert r.status_code == 200, r.text
+    r = client.post("/orders/", headers=auth_headers, json={"project_name": "Arama Şantiye", "partner_id": prefix, "items": []})
+    assert r.status_code == 200, r.text
+
+    r = client.get("/search/", headers=auth_headers, params={"q": "arama isik"})
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert [p["id"] for p in body["partners"]] == [exact, prefix]
+    # The order matches through its partner's name
+    assert [o["project_name"] for o in body["orders"]] == ["Arama Şantiye"]
+    assert body["products"] == []
+
+    body = client.get("/search/", headers=auth_headers, params={"q": "ÇİFT"}).json()
+    assert [p["sku"] for p in body["products"]] == ["ARM-01"]
+
+    # List endpoints use the same folding
+    r = client.get("/partners/", headers=auth_headers, params={"search": "ARAMA ışıkları"})
+    assert [p["id"] for p in r.json()] == [prefix]
+    r = client.get("/products/", headers=auth_headers, params={"search": "cift"})
+    assert "ARM-01" in [p["sku"] for p in r.json()]
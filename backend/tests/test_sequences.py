@@ -0,0 +1,32 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app import models
+from app.services import order_service, sequence_service
+
+
+def test_order_numbers_continue_after_legacy_numbers(db: Session, org):
+    db.add(models.Order(organization_id=org.id, order_number="1999-1000", status="DRAFT"))
+    db.commit()
+
+    assert order_service.allocate_order_numbers(db, org.id, 1999) == ["1999-1001"]
+    assert order_service.allocate_order_numbers(db, org.id, 1999, count=3) == ["1999-1002", "1999-1003", "1999-1004"]
+    # Other periods and names are independent counters
+    assert sequence_service.allocate(db, org.id, "test", period=1999, count=2) == range(1, 3)
+    db.commit()
+
+    row = db.query(models.NumberSequence).filter_by(
+        organization_id=org.id, name=sequence_service.ORDER_SEQUENCE, period=1999
+    ).one()
+    assert row.last_value == 1004
+
+
+def test_purchase_orders_get_sequential_numbers(client: TestClient, auth_headers):
+    numbers = []
+    for _ in range(2):
+        r = client.post("/purchase_orders/", headers=auth_headers, json={"order_date": "2024-03-01"})
+        assert r.status_code == 200, r.text
+        numbers.append(r.json()["po_number"])
+    assert numbers == ["PO-2024-001", "PO-2024-002"]
+
+    r = client.post("/purchase_orders/", headers=auth_headers, json={"po_number": "MANUEL-1"})
+    assert r.json()["po_number"] == "MANUEL-1"
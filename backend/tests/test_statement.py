@@ -0,0 +1,102 @@
+import json
+import uuid
+from decimal import Decimal
+from fastapi.testclient import TestClient
+
+from app import models
+from app.database import SessionLocal
+from app.routers.partners import stream_partner_statement
+from app.services import order_service
+
+
+def test_streamed_statement_running_balance_matches_summary(client: TestClient, auth_headers):
+    pr = client.post("/partners/", headers=auth_headers, json={
+        "type": "CUSTOMER", "name": "Ekstre Müşteri", "contact_person": None, "phone": None,
+        "email": None, "address": None, "tax_number": None, "is_active": True,
+    })
+    assert pr.status_code == 200, pr.text
+    pid = pr.json()["id"]
+    orr = client.post("/orders/", headers=auth_headers, json={
+        "partner_id": pid, "status": "SIPARIS", "order_date": "2025-01-01",
+        "items": [{"description": "Panel", "area_sqm": 2, "unit_price": 100}],
+    })
+    assert orr.status_code == 200, orr.text
+    for day, amount in (("2025-01-05", "30"), ("2025-01-10", "20")):
+        r = client.post("/financial_transactions/", headers=auth_headers, json={
+            "partner_id": pid, "direction": "IN", "amount": amount, "method": "CASH", "transaction_date": day,
+        })
+        assert r.status_code == 200, r.text
+
+    r = client.get(f"/partners/{pid}/statement/stream", headers=auth_headers)
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    items, summary = lines[:-1], lines[-1]["summary"]
+    assert len(items) == 3
+    # Oldest first; the order posting is dated today, after both payments
+    assert [i["amount"] for i in items[:2]] == [30, 20]
+    assert Decimal(str(items[0]["running_balance"])) == Decimal("-30")
+    assert Decimal(str(items[-1]["running_balance"])) == Decimal(str(summary["balance"]))
+    assert summary["incoming"] == 50
+
+    legacy = client.get(f"/partners/{pid}/statement", headers=auth_headers).json()
+    assert legacy["summary"] == summary
+
+    r = client.get(f"/partners/{pid}/statement/stream", headers=auth_headers, params={"start_date": "2025-01-06"})
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert len(lines) == 3
+    # Payments before start_date carry over as the opening balance
+    assert Decimal(str(lines[0]["running_balance"])) == Decimal("-50")
+    assert Decimal(str(lines[1]["running_balance"])) == Decimal(str(summary["balance"]))
+
+
+def test_order_area_is_stored_and_follows_item_writes(client: TestClient, auth_headers):
+    orr = client.post("/orders/", headers=auth_headers, json={
+        "project_name": "Alan", "items": [
+            {"description": "A", "area_sqm": 1.5, "unit_price": 10},
+            {"description": "B", "width": 1000, "height": 500, "quantity": 2, "unit_price": 10},
+        ],
+    })
+    assert orr.status_code == 200, orr.text
+    order = orr.json()
+    assert Decimal(str(order["total_area_sqm"])) == Decimal("2.5")
+
+    r = client.post("/order_items/", headers=auth_headers, json={
+        "order_id": order["id"], "product_id": None, "description": "C", "area_sqm": 3, "width": None,
+        "height": None, "quantity": 1, "unit_price": 10, "total_price": 30, "notes": None,
+    })
+    assert r.status_code == 200, r.text
+    r = client.get(f"/orders/{order['id']}", headers=auth_headers)
+    assert Decimal(str(r.json()["total_area_sqm"])) == Decimal("5.5")
+
+
+def test_streamed_statement_releases_the_request_session(client: TestClient, auth_headers):
+    pr = client.post("/partners/", headers=auth_headers, json={
+        "type": "CUSTOMER", "name": "Ekstre Bağlantı", "contact_person": None, "phone": None,
+        "email": None, "address": None, "tax_number": None, "is_active": True,
+    })
+    assert pr.status_code == 200, pr.text
+    request_db = SessionLocal()
+    try:
+        user = request_db.query(models.User).filter_by(email="admin@example.com").one()
+        org = request_db.query(models.Organization).filter_by(slug=auth_headers["X-Org-Slug"]).one()
+        response = stream_partner_statement(uuid.UUID(pr.json()["id"]), request_db, user, org)
+        assert response.media_type == "application/x-ndjson"
+        # Nothing is fetched yet, and the request session no longer holds a connection
+        assert not request_db.in_transaction()
+    finally:
+        request_db.close()
+
+
+def test_order_area_refresh_is_scoped_to_the_organization(client: TestClient, auth_headers, db):
+    orr = client.post("/orders/", headers=auth_headers, json={
+        "project_name": "Alan Kapsam", "items": [{"description": "A", "area_sqm": 2, "unit_price": 10}],
+    })
+    order_id = uuid.UUID(orr.json()["id"])
+    db.query(models.Order).filter_by(id=order_id).update({"total_area_sqm": 0})
+    order_service.refresh_order_area(db, uuid.uuid4(), order_id)
+    assert db.query(models.Order.total_area_sqm).filter_by(id=order_id).scalar() == 0
+    org_id = db.query(models.Order.organization_id).filter_by(id=order_id).scalar()
+    order_service.refresh_order_area(db, org_id, order_id)
+    assert db.query(models.Order.total_area_sqm).filter_by(id=order_id).scalar() == 2
+    db.rollback()
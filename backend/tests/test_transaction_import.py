@@ -0,0 +1,72 @@
+import uuid
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app import models
+
+
+def test_bulk_import_json_and_csv_with_duplicates(client: TestClient, db: Session, auth_headers, org):
+    ar = client.post("/accounts/", headers=auth_headers, json={"name": "Banka İçe Aktarım", "type": "BANK", "current_balance": "0"})
+    account_id = ar.json()["id"]
+
+    r = client.post("/financial_transactions/bulk", headers=auth_headers, json=[
+        {"account_id": account_id, "direction": "IN", "amount": "100", "transaction_date": "2025-03-01", "description": "EFT 1"},
+        {"account_id": account_id, "direction": "OUT", "amount": "40", "transaction_date": "2025-03-02", "description": "Kira"},
+        {"account_id": account_id, "direction": "IN", "amount": "100.00", "transaction_date": "2025-03-01", "description": "eft 1"},
+        {"account_id": "00000000-0000-0000-0000-000000000000", "direction": "IN", "amount": "5"},
+        {"direction": "SIDEWAYS", "amount": "5"},
+    ])
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["created"], body["duplicates"], body["failed"]) == (2, 1, 2)
+    assert body["results"][2]["duplicate"] and not body["results"][2]["ok"]
+    assert body["results"][3]["error"] == "Account not found"
+
+    csv_body = (
+        "transaction_date;direction;amount;description;account_id\n"
+        f"2025-03-02;OUT;40;Kira;{account_id}\n"
+        f"2025-03-03;IN;15;EFT 2;{account_id}\n"
+    )
+    r = client.post("/financial_transactions/bulk", headers={**auth_headers, "Content-Type": "text/csv"}, content=csv_body)
+    assert r.status_code == 200, r.text
+    assert (r.json()["created"], r.json()["duplicates"]) == (1, 1)
+
+    db.expire_all()
+    account = db.get(models.Account, uuid.UUID(account_id))
+    assert Decimal(str(account.current_balance)) == 75
+
+    # Same day, amount and description, but the other direction or another account
+    other = client.post("/accounts/", headers=auth_headers, json={"name": "Kasa İçe Aktarım", "type": "CASH", "current_balance": "0"})
+    r = client.post("/financial_transactions/bulk", headers=auth_headers, json=[
+        {"account_id": account_id, "direction": "OUT", "amount": "100", "transaction_date": "2025-03-01", "description": "EFT 1"},
+        {"account_id": other.json()["id"], "direction": "IN", "amount": "100", "transaction_date": "2025-03-01", "description": "EFT 1"},
+    ])
+    assert (r.json()["created"], r.json()["duplicates"]) == (2, 0)
+
+
+def test_ledger_filters_pages_and_totals(client: TestClient, db: Session, auth_headers, org):
+    ar = client.post("/accounts/", headers=auth_headers, json={"name": "Defter Kasası", "type": "CASH", "current_balance": "0"})
+    account_id = ar.json()["id"]
+    rows = [
+        {"account_id": account_id, "direction": d, "amount": str(a), "transaction_date": f"2025-04-{day:02d}",
+         "description": f"Defter {day}", "method": "CASH"}
+        for day, d, a in ((1, "IN", 100), (2, "OUT", 30), (3, "IN", 50), (4, "IN", 5), (20, "IN", 999))
+    ]
+    assert client.post("/financial_transactions/bulk", headers=auth_headers, json=rows).json()["created"] == 5
+
+    params = {"account_id": account_id, "start_date": "2025-04-01", "end_date": "2025-04-10", "limit": 2}
+    r = client.get("/financial_transactions/ledger", headers=auth_headers, params=params)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert [i["transaction_date"] for i in body["items"]] == ["2025-04-04", "2025-04-03"]
+    assert body["page_totals"]["count"] == 2 and Decimal(body["page_totals"]["incoming"]) == 55
+    assert body["totals"]["count"] == 4 and Decimal(body["totals"]["net"]) == 125
+
+    r = client.get("/financial_transactions/ledger", headers=auth_headers, params={**params, "cursor": body["next_cursor"]})
+    assert [i["transaction_date"] for i in r.json()["items"]] == ["2025-04-02", "2025-04-01"]
+
+    r = client.get("/financial_transactions/", headers=auth_headers, params={
+        "account_id": account_id, "direction": "IN", "min_amount": 10, "search": "defter",
+    })
+    assert [i["amount"] for i in r.json()] and all(Decimal(i["amount"]) >= 10 for i in r.json())
+    assert len(r.json()) == 3